@@ -1,22 +1,53 @@
 import logging
+import os
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing import Pool, Queue
 
 from pyology.cell import Cell
 from pyology.simulation import Reporter, SimulationController
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Change this to DEBUG to see all log messages
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+LOG_LEVEL = logging.WARNING  # Change this to DEBUG to see all log messages
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-reporter = Reporter()
-cell = Cell(logger=reporter)
-sim_controller = SimulationController(cell, reporter)
 glucose_amounts = [4]
-
-for glucose in glucose_amounts:
+# Metabolites the cell is built with; the names match the yml files
+METABOLITES = ["Glucose", "Pyruvate", "ATP", "ADP", "AMP", "NAD+", "NADH"]
+# Metabolites each compartment starts with, empty
+COMPARTMENT_METABOLITES = ["ATP", "ADP", "AMP", "NADH"]
+
+reporter = None
+cell = None
+sim_controller = None
+
+
+def build_simulation():
+    """Build the reporter, cell and controller that run the simulations."""
+    reporter = Reporter(console=False)
+    cell = Cell(METABOLITES, logger=reporter)
+    for compartment in (cell.cytoplasm, cell.mitochondrion):
+        for name in COMPARTMENT_METABOLITES:
+            compartment.add_metabolite(name, "metabolite", 0, 100)
+    return reporter, cell, SimulationController(cell, reporter)
+
+
+def init_worker(log_queue):
+    """
+    Build the cell and controller reused by a worker for each simulation.
+
+    The worker only puts its log records on ``log_queue``; the main process
+    formats and writes them, so the simulation never waits on console I/O.
+    """
+    global reporter, cell, sim_controller
+    root = logging.getLogger()
+    root.setLevel(LOG_LEVEL)
+    root.handlers[:] = [QueueHandler(log_queue)]
+    reporter, cell, sim_controller = build_simulation()
+
+
+def simulate(glucose):
+    """Simulate ATP production for one amount of glucose and return the results."""
     cell.cytoplasm.metabolites["glucose"].quantity = glucose
-    cell.cytoplasm.metabolites["glucose"].initial_quantity = glucose
-    reporter.log_event(f"\nSimulating ATP production with {glucose} glucose units:")
+    reporter.log_event("\nSimulating ATP production with %s glucose units:", glucose)
     initial_glucose = cell.metabolites["glucose"].quantity
     initial_atp = cell.cytoplasm.metabolites["ATP"].quantity
     initial_adp = cell.metabolites["ADP"].quantity
@@ -32,18 +63,19 @@ for glucose in glucose_amounts:
     initial_total_adenine = initial_atp + initial_adp + initial_amp
 
     reporter.log_event("Initial Metabolite Levels:")
-    reporter.log_event(f"ATP: {initial_atp:.2f}")
-    reporter.log_event(f"ADP: {initial_adp:.2f}")
-    reporter.log_event(f"AMP: {initial_amp:.2f}")
+    reporter.log_event("ATP: %.2f", initial_atp)
+    reporter.log_event("ADP: %.2f", initial_adp)
+    reporter.log_event("AMP: %.2f", initial_amp)
 
     # Pass the reporter to the run_simulation method
     results = sim_controller.run_simulation(glucose, reporter)
 
     reporter.log_event("\nAdenine Nucleotide Balance:")
     reporter.log_event(
-        f"Initial: {results['initial_adenine_nucleotides']:.6f}, "
-        f"Final: {results['final_adenine_nucleotides']:.6f}, "
-        f"Difference: {results['final_adenine_nucleotides'] - results['initial_adenine_nucleotides']:.6f}"
+        "Initial: %.6f, Final: %.6f, Difference: %.6f",
+        results["initial_adenine_nucleotides"],
+        results["final_adenine_nucleotides"],
+        results["final_adenine_nucleotides"] - results["initial_adenine_nucleotides"],
     )
 
     final_atp = results["final_cytoplasm_atp"] + results["final_mitochondrion_atp"]
@@ -51,9 +83,7 @@ for glucose in glucose_amounts:
     final_amp = cell.metabolites["AMP"].quantity
 
     reporter.log_event(
-        f"Final: ATP: {final_atp:.2f}, "
-        f"ADP: {final_adp:.2f}, "
-        f"AMP: {final_amp:.2f}"
+        "Final: ATP: %.2f, ADP: %.2f, AMP: %.2f", final_atp, final_adp, final_amp
     )
 
     # Assert final metabolite levels are non-negative
@@ -64,9 +94,9 @@ for glucose in glucose_amounts:
     total_initial = initial_atp + initial_adp + initial_amp
     total_final = final_atp + final_adp + final_amp
 
-    reporter.log_event(f"Total Initial Adenine Nucleotides: {total_initial:.2f}")
-    reporter.log_event(f"Total Final Adenine Nucleotides: {total_final:.2f}")
-    reporter.log_event(f"Difference: {total_final - total_initial:.2f}")
+    reporter.log_event("Total Initial Adenine Nucleotides: %.2f", total_initial)
+    reporter.log_event("Total Final Adenine Nucleotides: %.2f", total_final)
+    reporter.log_event("Difference: %.2f", total_final - total_initial)
 
     # Assert conservation of adenine nucleotides with a smaller tolerance
     tolerance = 1e-6  # Decreased tolerance
@@ -92,4 +122,28 @@ for glucose in glucose_amounts:
 
     sim_controller.reset()
 
-reporter.log_event("Simulation complete.")
+    return results
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
+    # Build one simulation here first: Pool restarts workers whose initializer
+    # raises, so a cell that cannot be built would otherwise hang the sweep
+    build_simulation()
+    # Worker log records are written by a background thread of this process
+    log_queue = Queue()
+    listener = QueueListener(log_queue, *logging.getLogger().handlers)
+    listener.start()
+    try:
+        # Each glucose amount is an independent simulation, so they run in parallel
+        with Pool(
+            min(len(glucose_amounts), os.cpu_count() or 1), init_worker, (log_queue,)
+        ) as pool:
+            pool.map(simulate, glucose_amounts)
+            # Let the workers exit cleanly so their queued records are flushed
+            pool.close()
+            pool.join()
+    finally:
+        listener.stop()
+
+    Reporter().log_event("Simulation complete.")
@@ -12,10 +12,18 @@ LEAK_MIDPOINT = 150
 V_MAX_DEFAULT = 1.0
 KM_DEFAULT = 0.1
 
+# Krebs Cycle yields per acetyl-CoA
+NADH_PER_ACETYL_COA = 3
+FADH2_PER_ACETYL_COA = 1
+GTP_PER_ACETYL_COA = 1
+
 # Electron Transport Chain constants
 PROTONS_PER_NADH = 4
 PROTONS_PER_FADH2 = 2
 PROTONS_PER_ATP = 4
+# Protons pumped per electron pair by Complexes III and IV
+PROTONS_PER_COMPLEX_III = 2
+PROTONS_PER_COMPLEX_IV = 2
 
 # NADH Shuttle efficiency
 SHUTTLE_EFFICIENCY = 0.67
@@ -31,6 +39,12 @@ INITIAL_CYTOCHROME_C = 100
 # Simulation constants
 TIME_STEP = 0.1
 SIMULATION_DURATION = 5
+# ADP level at which feedback activation doubles the base glycolysis rate
+ADP_ACTIVATION_SCALE = 500
+# Upper bound on the glycolysis rate. ADP feedback scales the base rate of 1
+# by at most 1 + MAX_METABOLITE / ADP_ACTIVATION_SCALE = 3; a feedback that
+# compounded from step to step instead would pass this within a few steps.
+MAX_GLYCOLYSIS_RATE = 10
 
 
 class GlycolysisSteps(Enum):
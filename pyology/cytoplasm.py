@@ -64,4 +64,11 @@ class Cytoplasm(Organelle):
         return result["result"]  # This should be the amount of pyruvate produced
 
     def reset(self) -> None:
-        self.__init__()
+        """
+        Reset the cytoplasm to its initial state.
+
+        The glycolysis rate and every metabolite are reset in place, keeping
+        the existing metabolite objects, logger and configuration.
+        """
+        self.glycolysis_rate = 1.0
+        self.metabolites.reset()
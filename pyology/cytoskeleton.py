@@ -21,7 +21,7 @@ Modeling Considerations
         microtubules.
 """
 
-from organelle import Organelle
+from .organelle import Organelle
 
 
 class Cytoskeleton(Organelle):
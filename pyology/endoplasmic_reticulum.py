@@ -20,7 +20,7 @@ Modeling Considerations
         Simulate synthesis of phospholipids and steroids.
 """
 
-from organelle import Organelle
+from .organelle import Organelle
 
 
 class EndoplasmicReticulum(Organelle):
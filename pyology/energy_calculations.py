@@ -1,12 +1,52 @@
 import logging
+import weakref
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Dict, Union
 
-from .metabolite import Metabolite
+import numpy as np
+
+from .jit import njit
+from .metabolite import Metabolite, Metabolites
 
 if TYPE_CHECKING:
     from pyology.cell import Cell
     from pyology.organelle import Organelle
 
+ADENINE_NUCLEOTIDES = ("ATP", "ADP", "AMP")
+
+# Energy per unit, in kJ/mol, of what the cell and glycolysis energy states count
+CELL_ENERGY_VALUES = MappingProxyType({"ATP": 50, "proton_gradient": 5})
+GLYCOLYSIS_ENERGY_VALUES = MappingProxyType(
+    {
+        "ATP": 50,
+        "ADP": 30,
+        "glucose": 686,
+        "glucose-6-phosphate": 916,
+        "fructose-6-phosphate": 916,
+        "fructose-1-6-bisphosphate": 1146,
+        "glyceraldehyde-3-phosphate": 573,
+        "1-3-bisphosphoglycerate": 803,
+        "3-phosphoglycerate": 573,
+        "2-phosphoglycerate": 573,
+        "phosphoenolpyruvate": 803,
+        "pyruvate": 343,
+    }
+)
+
+# ATP, ADP and AMP indices of each collection, with the layout they hold for
+_adenine_slots = weakref.WeakKeyDictionary()
+
+
+@njit(cache=True)
+def _adenine_total(quantities, slots):
+    """
+    Sum the quantities at the ATP, ADP and AMP ``slots``.
+    """
+    total = 0.0
+    for i in range(slots.shape[0]):
+        total += quantities[slots[i]]
+    return total
+
 
 def get_quantity(value: Union[float, "Metabolite"]) -> float:
     """
@@ -68,7 +108,7 @@ def calculate_cell_energy_state(cell: "Cell") -> float:
     float
         The energy state of the cell in kJ/mol.
     """
-    energy_values = {"ATP": 50, "proton_gradient": 5}
+    energy_values = CELL_ENERGY_VALUES
     return (
         calculate_base_energy_state(cell.cytoplasm.metabolites, energy_values)
         + calculate_base_energy_state(cell.mitochondrion.metabolites, energy_values)
@@ -91,21 +131,7 @@ def calculate_glycolysis_energy_state(organelle: "Organelle") -> float:
     float
         The energy state of the glycolysis pathway in kJ/mol.
     """
-    energy_values = {
-        "ATP": 50,
-        "ADP": 30,
-        "glucose": 686,
-        "glucose-6-phosphate": 916,
-        "fructose-6-phosphate": 916,
-        "fructose-1-6-bisphosphate": 1146,
-        "glyceraldehyde-3-phosphate": 573,
-        "1-3-bisphosphoglycerate": 803,
-        "3-phosphoglycerate": 573,
-        "2-phosphoglycerate": 573,
-        "phosphoenolpyruvate": 803,
-        "pyruvate": 343,
-    }
-    return calculate_base_energy_state(organelle.metabolites, energy_values)
+    return calculate_base_energy_state(organelle.metabolites, GLYCOLYSIS_ENERGY_VALUES)
 
 
 def calculate_total_adenine_nucleotides(organelle: "Organelle") -> float:
@@ -128,6 +154,52 @@ def calculate_total_adenine_nucleotides(organelle: "Organelle") -> float:
     )
 
 
+def adenine_slots(metabolites: "Metabolites") -> np.ndarray:
+    """
+    The ATP, ADP and AMP indices of a collection's quantity array.
+
+    Looked up once and reused until a metabolite is added or removed.
+
+    Parameters
+    ----------
+    metabolites : Metabolites
+        The collection holding the nucleotides.
+
+    Returns
+    -------
+    np.ndarray
+        The indices, in the order of :data:`ADENINE_NUCLEOTIDES`.
+
+    Raises
+    ------
+    UnknownMetaboliteError
+        If a nucleotide is not in the collection.
+    """
+    layout = (metabolites._generation, metabolites._size)
+    cached = _adenine_slots.get(metabolites)
+    if cached is None or cached[0] != layout:
+        cached = (layout, metabolites.indices(ADENINE_NUCLEOTIDES))
+        _adenine_slots[metabolites] = cached
+    return cached[1]
+
+
+def sum_adenine_nucleotides(metabolites: "Metabolites") -> float:
+    """
+    Sum ATP, ADP and AMP straight from a collection's quantity array.
+
+    Parameters
+    ----------
+    metabolites : Metabolites
+        The collection holding the nucleotides.
+
+    Returns
+    -------
+    float
+        The total amount of adenine nucleotides (ATP + ADP + AMP).
+    """
+    return float(_adenine_total(metabolites.quantity_array, adenine_slots(metabolites)))
+
+
 # def calculate_energy_state(organelle: "Organelle", logger: logging.Logger) -> float:
 #     """
 #     Calculate the total energy state of the organelle, with detailed logging for energy debugging.
@@ -231,6 +303,14 @@ def calculate_energy_state(
     float
         The total energy in kJ/mol.
     """
+    log_contributions = logger.isEnabledFor(logging.DEBUG)
+
+    metabolites = getattr(organelle_or_dict, "metabolites", None)
+    if isinstance(metabolites, Metabolites) and not log_contributions:
+        # One dot product over the quantity array
+        weights = metabolites.energy_weights(gibbs_free_energies)
+        return float(metabolites.quantity_array @ weights)
+
     total_energy = 0.0
 
     # Handle different input types
@@ -261,9 +341,10 @@ def calculate_energy_state(
         # Add to total energy
         total_energy += contribution
         
-        if contribution > 0:
-            #! remove this or have debug arg
-            logger.debug(f"{name} contributes {contribution:.2f} kJ/mol to total energy.")
+        if log_contributions and contribution > 0:
+            logger.debug(
+                "%s contributes %.2f kJ/mol to total energy.", name, contribution
+            )
 
     return total_energy
 
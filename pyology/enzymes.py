@@ -52,11 +52,19 @@ complex_enzyme.downstream_enzymes.append(downstream_enzyme)
 complex_enzyme.regulate_enzyme(downstream_enzyme, "activate")
 """
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
 from .metabolite import Metabolite
 
 
+def _read_only(parameters: Mapping) -> MappingProxyType:
+    """A read-only view of kinetic parameters, copied unless already one."""
+    if isinstance(parameters, MappingProxyType):
+        return parameters
+    return MappingProxyType(dict(parameters or {}))
+
+
 class Enzyme:
     """
     Represents an enzyme that catalyzes a biochemical reaction.
@@ -81,6 +89,10 @@ class Enzyme:
     hill_coefficients : Dict[str, float], optional
         The Hill coefficients for multiple substrates. Defaults to None.
 
+    ``k_m``, ``inhibitors``, ``activators`` and ``hill_coefficients`` are kept
+    as read-only mappings, since the rate calculation works from a packed copy
+    of them. Assign a new mapping to change one; the copy is then repacked.
+
     Methods
     -------
     calculate_rate : function
@@ -96,6 +108,27 @@ class Enzyme:
         substrates and products.
     """
 
+    __slots__ = (
+        "name",
+        "_k_cat",
+        "_k_m",
+        "_inhibitors",
+        "_activators",
+        "_active",
+        "_vmax",
+        "downstream_enzymes",
+        "_hill_coefficients",
+        "_kinetics",
+        "_regulation",
+    )
+
+    # Inhibition types, in the order they are coded in the packed parameters;
+    # activators follow with the next code
+    INHIBITION_TYPES = ("competitive", "noncompetitive", "uncompetitive")
+    _COMPETITIVE = INHIBITION_TYPES.index("competitive")
+    _NONCOMPETITIVE = INHIBITION_TYPES.index("noncompetitive")
+    _ACTIVATOR = len(INHIBITION_TYPES)
+
     def __init__(
         self,
         name: str,
@@ -108,13 +141,122 @@ class Enzyme:
         hill_coefficients: Dict[str, float] = None,
     ):
         self.name = name
-        self.k_cat = k_cat
-        self.k_m = k_m
-        self.inhibitors = inhibitors or {}
-        self.activators = activators or {}
-        self.active = active
+        self._k_cat = k_cat
+        self._active = active
+        self._vmax = k_cat if active else 0.0
+        self._k_m = _read_only(k_m)
+        self._inhibitors = _read_only(inhibitors)
+        self._activators = _read_only(activators)
         self.downstream_enzymes = downstream_enzymes or []
-        self.hill_coefficients = hill_coefficients or {}
+        self._hill_coefficients = _read_only(hill_coefficients)
+        self._pack_parameters()
+
+    @property
+    def k_cat(self) -> float:
+        """The catalytic constant (turnover number) of the enzyme."""
+        return self._k_cat
+
+    @k_cat.setter
+    def k_cat(self, value: float) -> None:
+        self._k_cat = value
+        self._vmax = value if self._active else 0.0
+
+    @property
+    def active(self) -> bool:
+        """Whether the enzyme is active."""
+        return self._active
+
+    @active.setter
+    def active(self, value: bool) -> None:
+        self._active = value
+        self._vmax = self._k_cat if value else 0.0
+
+    @property
+    def k_m(self) -> Mapping[str, float]:
+        """The Michaelis constant of each substrate."""
+        return self._k_m
+
+    @k_m.setter
+    def k_m(self, value: Mapping[str, float]) -> None:
+        self._k_m = _read_only(value)
+        self._pack_parameters()
+
+    @property
+    def inhibitors(self) -> Mapping[str, Dict[str, float]]:
+        """The inhibition constant, and optionally type, of each inhibitor."""
+        return self._inhibitors
+
+    @inhibitors.setter
+    def inhibitors(self, value: Mapping[str, Dict[str, float]]) -> None:
+        self._inhibitors = _read_only(value)
+        self._pack_parameters()
+
+    @property
+    def activators(self) -> Mapping[str, float]:
+        """The activation constant of each activator."""
+        return self._activators
+
+    @activators.setter
+    def activators(self, value: Mapping[str, float]) -> None:
+        self._activators = _read_only(value)
+        self._pack_parameters()
+
+    @property
+    def hill_coefficients(self) -> Mapping[str, float]:
+        """The Hill coefficient of each substrate; 1 where not given."""
+        return self._hill_coefficients
+
+    @hill_coefficients.setter
+    def hill_coefficients(self, value: Mapping[str, float]) -> None:
+        self._hill_coefficients = _read_only(value)
+        self._pack_parameters()
+
+    @property
+    def vmax(self) -> float:
+        """
+        The maximum rate of the enzyme: ``k_cat`` while active, else 0.
+
+        Kept up to date whenever ``k_cat`` or ``active`` changes, so rate
+        calculations read it instead of checking the activity every time.
+        """
+        return self._vmax
+
+    def _pack_parameters(self) -> None:
+        """
+        Packs the kinetic parameters into tuples read by :meth:`calculate_rate`.
+
+        Called on construction and whenever one of the parameter mappings is
+        replaced.
+
+        Hill-scaled Michaelis constants are computed here once rather than on
+        every rate calculation. Inhibitors and activators are packed into one
+        sequence of ``(metabolite, code, 1 / constant)`` so that a single
+        pass applies both, multiplying by the reciprocal constants instead of
+        dividing. An inhibitor given as a bare number is taken as a
+        competitive inhibitor with that inhibition constant.
+        """
+        kinetics = []
+        for substrate, k_m in self.k_m.items():
+            n = self.hill_coefficients.get(substrate, 1)  # Default to 1
+            kinetics.append((substrate, k_m**n, n))
+        self._kinetics = tuple(kinetics)
+
+        regulation = []
+        for inhibitor, inhibitor_info in self.inhibitors.items():
+            if not isinstance(inhibitor_info, dict):
+                inhibitor_info = {"ki": inhibitor_info}
+            inhibition_type = inhibitor_info.get("type", "competitive")
+            if inhibition_type in self.INHIBITION_TYPES:
+                regulation.append(
+                    (
+                        inhibitor,
+                        self.INHIBITION_TYPES.index(inhibition_type),
+                        1 / inhibitor_info["ki"],
+                    )
+                )
+        for activator, activator_constant in self.activators.items():
+            regulation.append((activator, self._ACTIVATOR, 1 / activator_constant))
+        self._regulation = tuple(regulation)
 
     def calculate_rate(self, metabolites: Dict[str, Metabolite]) -> float:
         """
@@ -130,13 +272,17 @@ class Enzyme:
         float
             The rate of the enzyme's reaction.
         """
-        if not self.active:
+        rate = self._vmax
+        if not rate:
             return 0.0
 
-        rate = self.k_cat
         rate *= self._calculate_kinetics(metabolites)
-        rate *= self._calculate_inhibition_effects(metabolites)
-        rate *= self._calculate_activation_effects(metabolites)
+        if self._regulation:
+            inhibition_factor, activation_factor = self._calculate_regulation_effects(
+                metabolites
+            )
+            rate *= inhibition_factor
+            rate *= activation_factor
 
         return rate
 
@@ -155,22 +301,19 @@ class Enzyme:
             The kinetics factor for the rate calculation.
         """
         kinetics_factor = 1.0
-        for substrate, k_m in self.k_m.items():
+        for substrate, k_m_n, n in self._kinetics:
             metabolite = metabolites.get(substrate)
             if metabolite is None:
                 return 0.0  # If a required substrate is missing, rate is 0
-            conc = metabolite.quantity
-            n = self.hill_coefficients.get(
-                substrate, 1
-            )  # Default to 1 if not specified
-            kinetics_factor *= conc**n / (k_m**n + conc**n)
+            conc_n = metabolite.quantity**n
+            kinetics_factor *= conc_n / (k_m_n + conc_n)
         return kinetics_factor
 
-    def _calculate_inhibition_effects(
+    def _calculate_regulation_effects(
         self, metabolites: Dict[str, Metabolite]
-    ) -> float:
+    ) -> Tuple[float, float]:
         """
-        Calculates the inhibition effects on the enzyme's reaction rate.
+        Calculates the inhibition and activation effects on the enzyme's rate.
 
         Parameters
         ----------
@@ -179,56 +322,39 @@ class Enzyme:
 
         Returns
         -------
-        float
-            The inhibition factor for the rate calculation.
+        Tuple[float, float]
+            The inhibition and activation factors for the rate calculation.
         """
         inhibition_factor = 1.0
-        for inhibitor, inhibitor_info in self.inhibitors.items():
-            metabolite = metabolites.get(inhibitor)
-            if metabolite:
-                conc = metabolite.quantity
-                inhibition_type = inhibitor_info.get("type", "competitive")
-                ki = inhibitor_info["ki"]
-
-                # Use the first substrate in k_m for inhibition calculations
-                substrate = next(iter(self.k_m))
-                k_m = self.k_m[substrate]
+        activation_factor = 1.0
 
-                if inhibition_type == "competitive":
+        # Use the first substrate in k_m for inhibition calculations; its
+        # quantity is shared by every inhibitor, so it is looked up only once
+        substrate_quantity = None
+        activator = self._ACTIVATOR
+        noncompetitive = self._NONCOMPETITIVE
+        for name, code, reciprocal in self._regulation:
+            metabolite = metabolites.get(name)
+            if metabolite is None:
+                continue
+            conc = metabolite.quantity
+            if code == activator:
+                activation_factor *= 1 + conc * reciprocal
+            elif code == noncompetitive:
+                inhibition_factor /= 1 + conc * reciprocal
+            else:
+                if substrate_quantity is None:
+                    substrate, k_m = next(iter(self.k_m.items()))
+                    substrate_quantity = metabolites[substrate].quantity
+                if code == self._COMPETITIVE:
                     inhibition_factor *= k_m / (
-                        k_m + metabolites[substrate].quantity * (1 + conc / ki)
+                        k_m + substrate_quantity * (1 + conc * reciprocal)
                     )
-                elif inhibition_type == "noncompetitive":
-                    inhibition_factor *= 1 / (1 + conc / ki)
-                elif inhibition_type == "uncompetitive":
-                    inhibition_factor *= 1 / (
-                        1 + k_m / (ki * (k_m + metabolites[substrate].quantity))
+                else:  # uncompetitive
+                    inhibition_factor /= 1 + k_m * reciprocal / (
+                        k_m + substrate_quantity
                     )
-        return inhibition_factor
-
-    def _calculate_activation_effects(
-        self, metabolites: Dict[str, Metabolite]
-    ) -> float:
-        """
-        Calculates the activation effects on the enzyme's reaction rate.
-
-        Parameters
-        ----------
-        metabolites : Dict[str, Metabolite]
-            The metabolites in the cell.
-
-        Returns
-        -------
-        float
-            The activation factor for the rate calculation.
-        """
-        activation_factor = 1.0
-        for substrate, activator_constant in self.activators.items():
-            metabolite = metabolites.get(substrate)
-            if metabolite:
-                conc = metabolite.quantity
-                activation_factor *= 1 + conc / activator_constant
-        return activation_factor
+        return inhibition_factor, activation_factor
 
     def activate(self) -> None:
         """
@@ -1,13 +1,13 @@
 import logging
 from typing import TYPE_CHECKING, Tuple
 
-from utils.command_data import CommandData
-from utils.tracking import execute_command
+import numpy as np
 
 from .common_reactions import GlycolysisReactions
 from .energy_calculations import calculate_total_adenine_nucleotides
 from .exceptions import GlycolysisError, ReactionError
 from .pathway import Pathway
+from .reaction_compiler import CompiledReactions
 
 if TYPE_CHECKING:
     from .organelle import Organelle
@@ -37,11 +37,43 @@ class Glycolysis(Pathway):
         Executes the investment phase of glycolysis.
     yield_phase:
         Executes the yield phase of glycolysis.
+    run_batch:
+        Runs both phases of glycolysis on many organelles at once.
     """
 
     time_step = 1
     reactions = GlycolysisReactions
 
+    # Steps 1-5, run once per glucose molecule
+    investment_reactions = (
+        GlycolysisReactions.hexokinase,
+        GlycolysisReactions.phosphoglucose_isomerase,
+        GlycolysisReactions.phosphofructokinase,
+        GlycolysisReactions.aldolase,
+        GlycolysisReactions.triose_phosphate_isomerase,
+    )
+    # Steps 6-10, run once per glyceraldehyde-3-phosphate
+    yield_reactions = (
+        GlycolysisReactions.glyceraldehyde_3_phosphate_dehydrogenase,
+        GlycolysisReactions.phosphoglycerate_kinase,
+        GlycolysisReactions.phosphoglycerate_mutate,
+        GlycolysisReactions.enolase,
+        GlycolysisReactions.pyruvate_kinase,
+    )
+    # Each phase runs as one generated function over the metabolite array
+    compiled_investment = CompiledReactions(investment_reactions)
+    compiled_yield = CompiledReactions(yield_reactions)
+    # Both phases in one function: the investment phase once per glucose
+    # unit, then the yield phase once per G3P unit, two per glucose unit
+    compiled_glycolysis = CompiledReactions(
+        investment_reactions + yield_reactions,
+        phases=((len(investment_reactions), 1), (len(yield_reactions), 2)),
+    )
+    # Metabolites whose net change debug runs log
+    tracked_metabolites = ("ATP", "ADP", "NADH", "glucose")
+    # Rows of the quantities taken by run_batch
+    batch_names = tuple(compiled_glycolysis.names)
+
     def __init__(self, debug=False):
         self.debug = debug
 
@@ -74,42 +106,45 @@ class Glycolysis(Pathway):
         try:
             if glucose_units <= 0:
                 raise GlycolysisError("The number of glucose units must be positive.")
+            # Truncate once, so the yield phase gets two G3P units for each
+            # glucose unit the investment phase actually processes
+            glucose_units = int(glucose_units)
 
             initial_energy = organelle.metabolites.total_energy
             initial_adenine = calculate_total_adenine_nucleotides(organelle)
             logger.info(
-                f"Initial energy: {initial_energy:.2f} kJ/mol, Initial adenine nucleotides: {initial_adenine:.2f} mol"
-            )
-
-            # Investment phase
-            investment_results = execute_command(
-                organelle,
-                CommandData(
-                    obj=self.__class__,  # Pass the class, not the instance
-                    command=self.__class__.investment_phase,
-                    tracked_attributes=["ATP", "ADP", "NADH", "glucose"],
-                    args=(organelle, glucose_units, logger),
-                ),
-                logger=logger,
+                "Initial energy: %.2f kJ/mol, Initial adenine nucleotides: %.2f mol",
+                initial_energy,
+                initial_adenine,
             )
 
-            # Yield phase
-            yield_results = execute_command(
-                organelle,
-                CommandData(
-                    obj=self.__class__,
-                    command=self.__class__.yield_phase,
-                    tracked_attributes=["ATP", "ADP", "NADH"],
-                    args=(organelle, glucose_units * 2, logger),
-                ),
-                logger=logger,
-            )
+            if self.debug:
+                # One snapshot of the tracked metabolites around both phases
+                metabolites = organelle.metabolites
+                tracked = metabolites.indices(self.tracked_metabolites)
+                before = metabolites.quantity_array[tracked]
+
+            if logger.isEnabledFor(logging.INFO):
+                # Step through the phases so each logs its own summary
+                self.investment_phase(organelle, glucose_units, logger)
+                self.yield_phase(organelle, glucose_units * 2, logger)
+            else:
+                self.compiled_glycolysis.run(organelle, glucose_units)
+
+            if self.debug:
+                change = metabolites.quantity_array[tracked] - before
+                logger.debug(
+                    "Glycolysis changes: %s",
+                    dict(zip(self.tracked_metabolites, change.tolist())),
+                )
 
             final_energy = organelle.metabolites.total_energy
             final_adenine = calculate_total_adenine_nucleotides(organelle)
 
             logger.info(
-                f"Final energy: {final_energy:.2f} kJ/mol, Final adenine nucleotides: {final_adenine:.2f} mol"
+                "Final energy: %.2f kJ/mol, Final adenine nucleotides: %.2f mol",
+                final_energy,
+                final_adenine,
             )
 
             #! Add these to checks and have as part of validation for commands
@@ -117,20 +152,22 @@ class Glycolysis(Pathway):
             energy_difference = final_energy - initial_energy
             if abs(energy_difference) > 1e-6:
                 logger.warning(
-                    f"Energy not conserved in glycolysis. Difference: {energy_difference}"
+                    "Energy not conserved in glycolysis. Difference: %s",
+                    energy_difference,
                 )
             #! Add these to checks and have as part of validation for commands
             # Check adenine nucleotide conservation
             adenine_difference = final_adenine - initial_adenine
             if abs(adenine_difference) > 1e-6:
                 logger.warning(
-                    f"Adenine nucleotides not conserved in glycolysis. Difference: {adenine_difference}"
+                    "Adenine nucleotides not conserved in glycolysis. Difference: %s",
+                    adenine_difference,
                 )
 
             return final_energy, final_adenine
 
         except Exception as e:
-            logger.error(f"Error during glycolysis: {str(e)}")
+            logger.error("Error during glycolysis: %s", e)
             raise GlycolysisError(f"Glycolysis failed: {str(e)}")
 
     @classmethod
@@ -154,29 +191,23 @@ class Glycolysis(Pathway):
         GlycolysisError:
             If the investment phase fails to complete.
         """
-        logger.info(f"Starting investment phase with {glucose_units} glucose units")
-        initial_atp = organelle.get_metabolite_quantity("ATP")
+        # Only read ATP around the phase when its summary will be logged
+        log_summary = logger.isEnabledFor(logging.INFO)
+        if log_summary:
+            initial_atp = organelle.get_metabolite_quantity("ATP")
+
+        try:
+            cls.compiled_investment.run(organelle, glucose_units)
+        except ReactionError as e:
+            logger.error("Investment phase failed: %s", e)
+            raise GlycolysisError(f"Investment phase failed: {str(e)}")
 
-        for i in range(glucose_units):
+        if log_summary:
             logger.info(
-                f"🔄🔄🔄 Processing glucose unit {i+1} of {glucose_units} 🔄🔄🔄"
+                "Investment phase processed %s glucose units. ATP consumed: %s",
+                glucose_units,
+                initial_atp - organelle.get_metabolite_quantity("ATP"),
             )
-            try:
-                # Steps 1-4 occur once per glucose molecule
-                cls.reactions.hexokinase.transform(organelle=organelle)
-                cls.reactions.phosphoglucose_isomerase.transform(organelle=organelle)
-                cls.reactions.phosphofructokinase.transform(organelle=organelle)
-                cls.reactions.aldolase.transform(organelle=organelle)
-
-                # Step 5 occurs once to convert DHAP to G3P
-                cls.reactions.triose_phosphate_isomerase.transform(organelle=organelle)
-
-            except ReactionError as e:
-                logger.error(f"Investment phase failed at glucose unit {i+1}: {str(e)}")
-                raise GlycolysisError(f"Investment phase failed: {str(e)}")
-
-        final_atp = organelle.get_metabolite_quantity("ATP")
-        logger.info(f"ATP consumed in investment phase: {initial_atp - final_atp}")
 
     @classmethod
     def yield_phase(
@@ -199,25 +230,57 @@ class Glycolysis(Pathway):
         GlycolysisError:
             If the yield phase fails to complete.
         """
-        logger.info(f"Starting yield phase with {g3p_units} G3P units")
-        initial_atp = organelle.get_metabolite_quantity("ATP")
-
-        for i in range(g3p_units):
-            logger.info(f"🍀🍀🍀 Processing G3P unit {i+1} of {g3p_units} 🍀🍀🍀")
-            try:
-                cls.reactions.glyceraldehyde_3_phosphate_dehydrogenase.transform(
-                    organelle=organelle
-                )
-                cls.reactions.phosphoglycerate_kinase.transform(organelle=organelle)
-                cls.reactions.phosphoglycerate_mutate.transform(organelle=organelle)
-                cls.reactions.enolase.transform(organelle=organelle)
-                cls.reactions.pyruvate_kinase.transform(organelle=organelle)
+        log_summary = logger.isEnabledFor(logging.INFO)
+        if log_summary:
+            initial_atp = organelle.get_metabolite_quantity("ATP")
 
-            except ReactionError as e:
-                raise GlycolysisError(f"Yield phase failed at G3P unit {i+1}: {str(e)}")
+        try:
+            cls.compiled_yield.run(organelle, g3p_units)
+        except ReactionError as e:
+            raise GlycolysisError(f"Yield phase failed: {str(e)}")
 
-        final_atp = organelle.get_metabolite_quantity("ATP")
-        logger.info(f"ATP produced in yield phase: {final_atp - initial_atp}")
+        if log_summary:
+            logger.info(
+                "Yield phase processed %s G3P units. ATP produced: %s",
+                g3p_units,
+                organelle.get_metabolite_quantity("ATP") - initial_atp,
+            )
+
+    @classmethod
+    def run_batch(
+        cls, quantities: np.ndarray, max_quantities, glucose_units
+    ) -> np.ndarray:
+        """
+        Runs both phases of glycolysis on many organelles at once.
+
+        Each column of ``quantities`` is one organelle, with a row per
+        metabolite in :attr:`batch_names`. Both phases run on all organelles
+        in one compiled call. An organelle whose investment phase stops
+        early skips its yield phase, as :meth:`run` would stop with an
+        error; it is reported in the returned mask instead.
+
+        Parameters
+        ----------
+        quantities : np.ndarray
+            The quantities, of shape ``(len(batch_names), organelles)``,
+            updated in place.
+        max_quantities : float or array_like
+            The maximum quantities, broadcast to the shape of
+            ``quantities``.
+        glucose_units : int or array_like
+            The glucose units each organelle processes.
+
+        Returns
+        -------
+        np.ndarray
+            Whether each organelle completed both phases.
+        """
+        glucose_units = np.broadcast_to(
+            np.asarray(glucose_units, dtype=np.int64), quantities.shape[1]
+        )
+        compiled = cls.compiled_glycolysis
+        done = compiled.run_lanes(quantities, max_quantities, glucose_units)
+        return done == glucose_units * compiled.steps
 
 
 def energy_in_balance(initial_energy: float, final_energy: float) -> bool:
@@ -14,7 +14,7 @@ Modeling Considerations
         Model the budding and fusion of transport vesicles.    
 """
 
-from organelle import Organelle
+from .organelle import Organelle
 
 
 class GolgiApparatus(Organelle):
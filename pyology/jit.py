@@ -0,0 +1,162 @@
+"""
+Optional just-in-time compilation for small numeric kernels.
+
+Numba is an optional dependency. When it is installed, functions decorated
+with :func:`njit` (or :func:`vectorize`) are compiled to machine code on first
+call; without it (or
+with ``NUMBA_DISABLE_JIT=1`` set) they run as the plain Python functions they
+are written as, so results are the same either way.
+
+Numba itself is only imported when a decorated function is first called, so
+importing a module that defines kernels stays cheap. A kernel can also be
+given ``min_calls`` so it runs as Python until it has been called that many
+times, which keeps short runs from paying a compile they would never earn
+back. Set ``PYOLOGY_JIT=1`` to ignore ``min_calls`` and compile on first call.
+"""
+
+import functools
+import importlib.util
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+EAGER = os.environ.get("PYOLOGY_JIT") == "1"
+
+_numba = None
+
+
+def _load_numba():
+    """
+    Import Numba on first use.
+
+    Returns
+    -------
+    module or None
+        The ``numba`` module, or None when it cannot be imported.
+    """
+    global _numba
+    if _numba is None:
+        try:
+            import numba
+            from numba.extending import typeof_impl
+        except ImportError:
+            _numba = False
+        else:
+            # Let compiled kernels call other lazily compiled kernels: Numba
+            # types the wrapper as the dispatcher it stands for.
+            @typeof_impl.register(LazyJit)
+            def _typeof_lazy_jit(val, c):
+                return typeof_impl(val.dispatcher, c)
+
+            _numba = numba
+    return _numba or None
+
+
+class LazyJit:
+    """
+    A function compiled with Numba the first time it is called.
+
+    Parameters
+    ----------
+    func : callable
+        The Python implementation of the kernel.
+    options : dict
+        Keyword arguments passed to the Numba decorator.
+    decorator : str, optional
+        The Numba decorator to compile with, ``"njit"`` by default.
+    args : tuple, optional
+        Positional arguments passed to the Numba decorator.
+    min_calls : int, optional
+        Number of calls made to ``func`` as Python before compiling. Ignored
+        when ``PYOLOGY_JIT=1`` is set.
+    """
+
+    def __init__(self, func, options, decorator="njit", args=(), min_calls=0):
+        functools.update_wrapper(self, func)
+        self.py_func = func
+        self.options = options
+        self.decorator = decorator
+        self.args = args
+        self.min_calls = 0 if EAGER else min_calls
+        self._calls = 0
+        self._dispatcher = None
+
+    @property
+    def dispatcher(self):
+        """The compiled dispatcher, or ``py_func`` when Numba is missing."""
+        if self._dispatcher is None:
+            numba = _load_numba()
+            if numba is None:
+                logger.debug("Numba unavailable; %s runs as Python", self.__name__)
+                self._dispatcher = self.py_func
+            else:
+                compile = getattr(numba, self.decorator)(*self.args, **self.options)
+                self._dispatcher = compile(self.py_func)
+        return self._dispatcher
+
+    def __call__(self, *args, **kwargs):
+        if self._dispatcher is None and self._calls < self.min_calls:
+            self._calls += 1
+            return self.py_func(*args, **kwargs)
+        return self.dispatcher(*args, **kwargs)
+
+
+def njit(*args, **kwargs):
+    """
+    Compile a function with ``numba.njit`` when Numba is available.
+
+    Can be used bare (``@njit``) or with options (``@njit(cache=True)``).
+    Compilation, and the Numba import, happen on the first call, or after
+    ``min_calls`` calls when that option is given. Without Numba the function
+    runs unchanged.
+
+    Parameters
+    ----------
+    *args, **kwargs
+        Passed through to ``numba.njit``, except ``min_calls`` which is kept
+        by :class:`LazyJit`.
+
+    Returns
+    -------
+    callable
+        The wrapped function, or a decorator producing it.
+    """
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return LazyJit(args[0], {})
+
+    min_calls = kwargs.pop("min_calls", 0)
+
+    def decorator(func):
+        return LazyJit(func, kwargs, min_calls=min_calls)
+
+    return decorator
+
+
+def vectorize(signatures, **kwargs):
+    """
+    Compile a scalar function into a NumPy ufunc with ``numba.vectorize``.
+
+    The ufunc applies the function elementwise with NumPy broadcasting, so a
+    whole array of inputs is one call. Without Numba the Python function is
+    used as is; it must then be written with operations that already work on
+    arrays.
+
+    Parameters
+    ----------
+    signatures : list
+        The type signatures to compile, as for ``numba.vectorize``.
+    **kwargs
+        Passed through to ``numba.vectorize``.
+
+    Returns
+    -------
+    callable
+        A decorator producing the wrapped function.
+    """
+
+    def decorator(func):
+        return LazyJit(func, kwargs, decorator="vectorize", args=(signatures,))
+
+    return decorator
@@ -1,6 +1,8 @@
 import logging
 from typing import TYPE_CHECKING, Tuple
 
+import numpy as np
+
 from .common_reactions import KrebsCycleReactions
 from .energy_calculations import (
     calculate_energy_state,
@@ -8,6 +10,8 @@ from .energy_calculations import (
 )
 from .exceptions import KrebsCycleError, ReactionError
 from .pathway import Pathway
+from .reaction_compiler import CompiledReactions
+from .utils import hill_equation
 
 if TYPE_CHECKING:
     from .organelle import Organelle
@@ -27,15 +31,74 @@ class KrebsCycle(Pathway):
         Executes the Krebs Cycle pathway for a given number of acetyl-CoA units.
     cycle:
         Executes one complete cycle of the Krebs Cycle.
+    cycles:
+        Executes several complete cycles in a single update.
+    enzyme_rates:
+        Calculates the rates of the cycle's enzymes in one batch.
     """
 
     time_step = 1
     reactions = KrebsCycleReactions
 
+    # Reactions that release CO2
+    CO2_REACTIONS = ("Isocitrate Dehydrogenase", "α_Ketoglutarate Dehydrogenase")
+    # Energy carriers and their ATP equivalents, reduced minus oxidized form
+    ENERGY_CARRIERS = ("NADH", "NAD+", "FADH2", "FAD", "GTP", "GDP")
+    ENERGY_WEIGHTS = np.array([2.5, -2.5, 1.5, -1.5, 1.0, -1.0])
+    ATP_ENERGY = 30.5  # kJ/mol of ATP
+
+    cycle_reactions = (
+        KrebsCycleReactions.citrate_synthase,
+        KrebsCycleReactions.aconitase,
+        KrebsCycleReactions.isocitrate_dehydrogenase,
+        KrebsCycleReactions.alpha_ketoglutarate_dehydrogenase,
+        KrebsCycleReactions.succinyl_coa_synthetase,
+        KrebsCycleReactions.succinate_dehydrogenase,
+        KrebsCycleReactions.fumarase,
+        KrebsCycleReactions.malate_dehydrogenase,
+    )
+    # The whole turn runs as one generated function over the metabolite array
+    compiled_cycle = CompiledReactions(cycle_reactions)
+    # Each CO2-releasing reaction runs once per turn
+    CO2_PER_TURN = len(CO2_REACTIONS)
+
     def __init__(self, debug=True):
         self.debug = debug
         self.reactions = KrebsCycleReactions()
 
+        # Michaelis-Menten parameters of each enzyme, in cycle order, with the
+        # metabolite its k_m is given for
+        self._enzymes = tuple(reaction.enzyme for reaction in self.cycle_reactions)
+        self._packed = None
+
+    def _enzyme_parameters(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The Michaelis constant and Hill coefficient of each enzyme.
+
+        Rebuilt whenever an enzyme's kinetic parameters have been replaced,
+        along with ``_rate_substrates``, the metabolite each k_m is for.
+        """
+        packed = tuple(enzyme._kinetics for enzyme in self._enzymes)
+        if self._packed is None or any(
+            old is not new for old, new in zip(self._packed, packed)
+        ):
+            self._hill = np.array(
+                [
+                    enzyme.hill_coefficients.get(next(iter(enzyme.k_m)), 1)
+                    for enzyme in self._enzymes
+                ],
+                dtype=float,
+            )
+            self._k_m = np.array(
+                [next(iter(enzyme.k_m.values())) for enzyme in self._enzymes],
+                dtype=float,
+            )
+            self._rate_substrates = tuple(
+                next(iter(enzyme.k_m)) for enzyme in self._enzymes
+            )
+            self._packed = packed
+        return self._k_m, self._hill
+
     def run(
         self, organelle: "Organelle", acetyl_coa_units: float, logger: logging.Logger
     ) -> Tuple[float, float, float]:
@@ -71,15 +134,12 @@ class KrebsCycle(Pathway):
             initial_energy = calculate_energy_state(organelle, logger)
             initial_adenine = calculate_total_adenine_nucleotides(organelle)
 
-            co2_produced = 0
-            total_energy_produced = 0
-            for i in range(int(acetyl_coa_units)):
-                cycle_results, cycle_energy = self.cycle(organelle, logger)
-                co2_produced += cycle_results
-                total_energy_produced += cycle_energy
+            co2_produced, total_energy_produced = self.cycles(
+                organelle, int(acetyl_coa_units), logger
+            )
 
-            logger.info(f"Krebs Cycle completed. Produced {co2_produced} CO2.")
-            logger.info(f"Total energy produced: {total_energy_produced} kJ/mol")
+            logger.info("Krebs Cycle completed. Produced %s CO2.", co2_produced)
+            logger.info("Total energy produced: %s kJ/mol", total_energy_produced)
 
             final_energy = calculate_energy_state(organelle, logger)
             final_adenine = calculate_total_adenine_nucleotides(organelle)
@@ -88,82 +148,201 @@ class KrebsCycle(Pathway):
             energy_difference = final_energy - initial_energy - total_energy_produced
             if abs(energy_difference) > 1e-6:
                 logger.warning(
-                    f"Energy not conserved in Krebs Cycle. Difference: {energy_difference}"
+                    "Energy not conserved in Krebs Cycle. Difference: %s",
+                    energy_difference,
                 )
 
             # Check adenine nucleotide conservation
             adenine_difference = final_adenine - initial_adenine
             if abs(adenine_difference) > 1e-6:
                 logger.warning(
-                    f"Adenine nucleotides not conserved in Krebs Cycle. Difference: {adenine_difference}"
+                    "Adenine nucleotides not conserved in Krebs Cycle. Difference: %s",
+                    adenine_difference,
                 )
 
             return final_energy, final_adenine, co2_produced
 
         except Exception as e:
-            logger.error(f"Error during Krebs Cycle: {str(e)}")
+            logger.error("Error during Krebs Cycle: %s", e)
+            raise KrebsCycleError(f"Krebs Cycle failed: {str(e)}")
+
+    def cycles(
+        self, organelle: "Organelle", count: int, logger: logging.Logger
+    ) -> Tuple[int, float]:
+        """
+        Executes ``count`` complete cycles of the Krebs Cycle.
+
+        The turns are run by :attr:`compiled_cycle`. The cycle regenerates
+        its intermediates, so every turn applies the same net change: when
+        the starting quantities are enough for all turns, the compiled
+        function applies that change once, scaled by ``count``, and the CO2
+        and energy totals are summed in closed form. Otherwise it stops at the
+        same reaction as repeated calls to :meth:`cycle` would; the reaction
+        that cannot run changes nothing.
+
+        Parameters
+        ----------
+        organelle: Organelle
+            The organelle to run the cycles on.
+        count: int
+            The number of cycles to run.
+        logger: logging.Logger
+            The logger to use for logging messages.
+
+        Returns
+        -------
+        Tuple[int, float]:
+            The CO2 and energy produced over all cycles.
+
+        Raises
+        ------
+        KrebsCycleError:
+            If a reaction is short of a substrate.
+        QuantityError:
+            If a reaction would take a product above its maximum.
+        UnknownMetaboliteError:
+            If a metabolite of the cycle is missing from the organelle; no
+            turn is run.
+        """
+        if count <= 0:
+            return 0, 0
+        metabolites = organelle.metabolites
+        # Both lookups raise before any quantity changes
+        self.compiled_cycle.indices(metabolites)
+        energy_idx = metabolites.indices(self.ENERGY_CARRIERS)
+
+        # The energy-carrier balance after each turn grows linearly
+        before = float(metabolites.quantity_array[energy_idx] @ self.ENERGY_WEIGHTS)
+        try:
+            self.compiled_cycle.run(organelle, count)
+        except ReactionError as e:
+            logger.error("Krebs Cycle failed: %s", e)
             raise KrebsCycleError(f"Krebs Cycle failed: {str(e)}")
+        after = float(metabolites.quantity_array[energy_idx] @ self.ENERGY_WEIGHTS)
+        carrier_total = count * before + (after - before) * (count + 1) / 2
+
+        co2_produced = count * self.CO2_PER_TURN
+        # Each reaction reports a rate of 1.0 when it runs
+        energy_produced = (
+            count * len(self.cycle_reactions) + carrier_total * self.ATP_ENERGY
+        )
+        logger.info(
+            "Ran %d Krebs cycles. CO2+: %d, energy+: %.2f kJ/mol",
+            count,
+            co2_produced,
+            energy_produced,
+        )
+        return co2_produced, energy_produced
+
+    def enzyme_rates(self, organelle: "Organelle") -> np.ndarray:
+        """
+        Calculates the rates of the cycle's enzymes in one batch.
+
+        Each rate is the one :meth:`Enzyme.calculate_rate` gives on the
+        organelle's metabolites. The Michaelis-Menten terms, with their Hill
+        coefficients, are one call to the :func:`hill_equation` ufunc; the
+        inhibitors and activators of the enzymes with a nonzero rate are then
+        applied one enzyme at a time.
+
+        Each enzyme's kinetics use the metabolite its k_m is given for, not
+        the reaction's first substrate. Citrate synthase's k_m is for
+        citrate. The k_m of alpha-ketoglutarate dehydrogenase and
+        succinyl-CoA synthetase are for "alpha-ketoglutarate" and
+        "succinyl-coa", which the cycle names α_Ketoglutarate and
+        Succinyl_CoA; like inactive enzymes and any other enzyme whose k_m
+        metabolite is missing, they have a rate of zero.
+
+        Parameters
+        ----------
+        organelle: Organelle
+            The organelle holding the intermediates.
+
+        Returns
+        -------
+        np.ndarray
+            The rate of each enzyme, in cycle order.
+
+        """
+        metabolites = organelle.metabolites
+        k_m, hill = self._enzyme_parameters()
+        found = [metabolites.get(name) for name in self._rate_substrates]
+        substrate = np.array(
+            [0.0 if metabolite is None else metabolite.quantity for metabolite in found]
+        )
+        vmax = np.array(
+            [
+                0.0 if metabolite is None else enzyme.vmax
+                for enzyme, metabolite in zip(self._enzymes, found)
+            ]
+        )
+        rates = hill_equation(substrate, vmax, k_m, hill)
+        for i, enzyme in enumerate(self._enzymes):
+            if rates[i] and enzyme._regulation:
+                inhibition, activation = enzyme._calculate_regulation_effects(
+                    metabolites
+                )
+                rates[i] *= inhibition * activation
+        return rates
 
     def cycle(
         self, organelle: "Organelle", logger: logging.Logger
     ) -> Tuple[int, float]:
-        logger.info("Starting Krebs Cycle Reactions")
+        # Check the level once rather than in every per-reaction log call
+        log_steps = logger.isEnabledFor(logging.INFO)
+        if log_steps:
+            logger.info("Starting Krebs Cycle Reactions")
         co2_produced = 0
         energy_produced = 0
 
         try:
 
-            for reaction in [
-                self.reactions.citrate_synthase,
-                self.reactions.aconitase,
-                self.reactions.isocitrate_dehydrogenase,
-                self.reactions.alpha_ketoglutarate_dehydrogenase,
-                self.reactions.succinyl_coa_synthetase,
-                self.reactions.succinate_dehydrogenase,
-                self.reactions.fumarase,
-                self.reactions.malate_dehydrogenase,
-            ]:
-                logger.info(
-                    f"Executing reaction: {reaction.name}, substrates: {reaction.substrates}"
-                )
+            for reaction in self.cycle_reactions:
+                if log_steps:
+                    logger.info(
+                        "Executing reaction: %s, substrates: %s",
+                        reaction.name,
+                        reaction.substrates,
+                    )
 
                 # Execute reaction and track energy changes
                 reaction_energy = reaction.transform(organelle=organelle)
                 energy_produced += reaction_energy
 
-                if reaction.name in [
-                    "Isocitrate Dehydrogenase",
-                    "α_Ketoglutarate Dehydrogenase",
-                ]:
+                if reaction.name in self.CO2_REACTIONS:
                     co2_produced += 1
-                logger.info(
-                    f"Energy produced in {reaction.name}: {reaction_energy} kJ/mol"
-                )
+                if log_steps:
+                    logger.info(
+                        "Energy produced in %s: %s kJ/mol",
+                        reaction.name,
+                        reaction_energy,
+                    )
 
             # Calculate total NADH, FADH2, and GTP produced
-            nadh_produced = organelle.get_metabolite_quantity(
-                "NADH"
-            ) - organelle.get_metabolite_quantity("NAD+")
-            fadh2_produced = organelle.get_metabolite_quantity(
-                "FADH2"
-            ) - organelle.get_metabolite_quantity("FAD")
-            gtp_produced = organelle.get_metabolite_quantity(
-                "GTP"
-            ) - organelle.get_metabolite_quantity("GDP")
+            metabolites = organelle.metabolites
+            nadh, nad, fadh2, fad, gtp, gdp = metabolites.quantity_array[
+                metabolites.indices(self.ENERGY_CARRIERS)
+            ].tolist()
+            nadh_produced = nadh - nad
+            fadh2_produced = fadh2 - fad
+            gtp_produced = gtp - gdp
 
             # Calculate energy from electron transport chain (more accurate values)
             etc_energy = (
                 nadh_produced * 2.5 + fadh2_produced * 1.5 + gtp_produced
             )  # ATP equivalents
-            atp_energy = 30.5  # kJ/mol of ATP
-            energy_produced += etc_energy * atp_energy
+            energy_produced += etc_energy * self.ATP_ENERGY
 
             logger.info(
-                f"Reactions Completed. CO2+: {co2_produced}, energy+: {energy_produced:.2f} kJ/mol, NADH+: {nadh_produced}, FADH2+: {fadh2_produced}, GTP+: {gtp_produced}"
+                "Reactions Completed. CO2+: %s, energy+: %.2f kJ/mol, NADH+: %s, FADH2+: %s, GTP+: %s",
+                co2_produced,
+                energy_produced,
+                nadh_produced,
+                fadh2_produced,
+                gtp_produced,
             )
 
         except ReactionError as e:
-            logger.error(f"Krebs Cycle failed: {str(e)}")
+            logger.error("Krebs Cycle failed: %s", e)
             raise KrebsCycleError(f"Krebs Cycle failed: {str(e)}")
 
         return co2_produced, energy_produced
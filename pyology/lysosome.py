@@ -14,7 +14,7 @@ Modeling Considerations
         Lysosomal enzymes are active at acidic pH; simulate environmental conditions.
 """
 
-from organelle import Organelle
+from .organelle import Organelle
 
 
 class Lysosome(Organelle):
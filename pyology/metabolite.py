@@ -1,41 +1,67 @@
-from threading import Lock
+import copy
+import functools
+import logging
+import sys
+import weakref
+from threading import RLock
+from types import MappingProxyType
 from typing import Dict, List
 
+import numpy as np
 import yaml
 
 from .exceptions import (
     InsufficientMetaboliteError,
+    MetaboliteError,
     QuantityError,
     UnknownMetaboliteError,
 )
 
-gibbs_free_energies = {
-    "ATP": 50,
-    "ADP": 30,
-    "AMP": 10,
-    "GTP": 50,
-    "NADH": 158,
-    "FADH2": 105,
-    "Acetyl_CoA": 31,
-    "proton_gradient": 5,
-    "glucose": 686,
-    "glucose-6-phosphate": 916,
-    "fructose-6-phosphate": 916,
-    "fructose-1-6-bisphosphate": 1146,
-    "glyceraldehyde-3-phosphate": 573,
-    "1-3-bisphosphoglycerate": 803,
-    "3-phosphoglycerate": 573,
-    "2-phosphoglycerate": 573,
-    "phosphoenolpyruvate": 803,
-    "pyruvate": 343,
-    "pyruvate_dehydrogenase": 100,
-    "phosphoenolpyruvate_carboxykinase": 100,
-    "phosphoenolpyruvate_mutase": 100,
-    "pyruvate_kinase": 100,
-    "phosphoglycerate_kinase": 100,
-    "phosphoglycerate_mutase": 100,
-    "phosphoglycerate_phosphatase": 100,
-}
+logger = logging.getLogger(__name__)
+
+# Rows of the state array backing metabolite values
+QUANTITY, MIN_QUANTITY, MAX_QUANTITY = range(3)
+
+# Locks shared by thread-safe metabolites, picked by name
+_LOCKS = tuple(RLock() for _ in range(16))
+
+# Marks an attribute a metabolite does not have, see Metabolites.state
+_MISSING = object()
+
+# The libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Read-only, so per-metabolite values and energy_weights arrays taken from
+# it stay valid
+gibbs_free_energies = MappingProxyType(
+    {
+        "ATP": 50,
+        "ADP": 30,
+        "AMP": 10,
+        "GTP": 50,
+        "NADH": 158,
+        "FADH2": 105,
+        "Acetyl_CoA": 31,
+        "proton_gradient": 5,
+        "glucose": 686,
+        "glucose-6-phosphate": 916,
+        "fructose-6-phosphate": 916,
+        "fructose-1-6-bisphosphate": 1146,
+        "glyceraldehyde-3-phosphate": 573,
+        "1-3-bisphosphoglycerate": 803,
+        "3-phosphoglycerate": 573,
+        "2-phosphoglycerate": 573,
+        "phosphoenolpyruvate": 803,
+        "pyruvate": 343,
+        "pyruvate_dehydrogenase": 100,
+        "phosphoenolpyruvate_carboxykinase": 100,
+        "phosphoenolpyruvate_mutase": 100,
+        "pyruvate_kinase": 100,
+        "phosphoglycerate_kinase": 100,
+        "phosphoglycerate_mutase": 100,
+        "phosphoglycerate_phosphatase": 100,
+    }
+)
 
 
 class Metabolite:
@@ -60,8 +86,15 @@ class Metabolite:
         Additional metadata about the metabolite.
     on_change : callable, optional
         A callback function that is called when the quantity of the metabolite changes.
-    lock : Lock
-        A lock object to ensure thread-safe access to the metabolite's quantity.
+    lock : RLock or None
+        The lock held while adjusting or resetting the quantity, one of a
+        shared set picked by name. None unless the metabolite was created
+        with ``thread_safe=True``; single-threaded use needs no lock.
+
+    The quantity and its bounds live in one column of a ``(3, n)`` array.
+    A standalone metabolite owns a single-column array; once registered with
+    a :class:`Metabolites` collection it reads and writes the collection's
+    array instead, so the collection can update many metabolites at once.
 
     Methods
     -------
@@ -79,6 +112,20 @@ class Metabolite:
         Returns a string representation of the metabolite.
     """
 
+    __slots__ = (
+        "name",
+        "label",
+        "type",
+        "_state",
+        "_slot",
+        "_owner",
+        "unit",
+        "metadata",
+        "on_change",
+        "lock",
+        "_gibbs",
+    )
+
     def __init__(
         self,
         name: str,
@@ -89,49 +136,89 @@ class Metabolite:
         metadata: dict = None,
         on_change=None,
         type: str = "default",
+        thread_safe: bool = False,
     ) -> None:
-        self.name = name.lower()
+        self.name = sys.intern(name.lower())
         self.label = name
+        # Energy per unit; metabolites without a known Gibbs free energy
+        # count 1 per unit, as in Metabolites.total_energy
+        self._gibbs = gibbs_free_energies.get(name, 1)
         self.type = type
-        self.quantity = float(quantity)
-        self.max_quantity = float(max_quantity)
-        self.min_quantity = float(min_quantity)
+        self._state = np.empty((3, 1))
+        self._slot = 0
+        # Weak reference to the collection whose array holds the values
+        self._owner = None
+        self.quantity = quantity
+        self.max_quantity = max_quantity
+        self.min_quantity = min_quantity
         self.unit = unit
         self.metadata = metadata or {}
         self.on_change = on_change
-        self.lock = Lock()
+        self.lock = _LOCKS[hash(self.name) % len(_LOCKS)] if thread_safe else None
 
     @property
-    def quantity(self):
-        return self._quantity
+    def quantity(self) -> float:
+        return self._state.item(QUANTITY, self._slot)
 
     @quantity.setter
-    def quantity(self, value):
-        self._quantity = float(value)
+    def quantity(self, value: float) -> None:
+        # float() raises for None and other non-numbers, which the float64
+        # state array would otherwise store as NaN
+        self._state[QUANTITY, self._slot] = float(value)
+
+    @property
+    def min_quantity(self) -> float:
+        return self._state.item(MIN_QUANTITY, self._slot)
+
+    @min_quantity.setter
+    def min_quantity(self, value: float) -> None:
+        self._state[MIN_QUANTITY, self._slot] = float(value)
+
+    @property
+    def max_quantity(self) -> float:
+        return self._state.item(MAX_QUANTITY, self._slot)
+
+    @max_quantity.setter
+    def max_quantity(self, value: float) -> None:
+        self._state[MAX_QUANTITY, self._slot] = float(value)
 
     def adjust_quantity(self, amount: float) -> None:
-        with self.lock:
-            new_quantity = self.quantity + amount
-            if new_quantity < self.min_quantity or new_quantity > self.max_quantity:
-                raise QuantityError(
-                    f"Invalid quantity for {self.name}. Attempted to set to {new_quantity}."
-                )
-            self.quantity = new_quantity
-            if self.on_change:
-                self.on_change(self)
+        if self.lock is None:
+            self._adjust_quantity(amount)
+        else:
+            with self.lock:
+                self._adjust_quantity(amount)
+
+    def _adjust_quantity(self, amount: float) -> None:
+        # Work on the state column directly rather than through the properties
+        state = self._state
+        slot = self._slot
+        new_quantity = state.item(QUANTITY, slot) + amount
+        if new_quantity < state.item(MIN_QUANTITY, slot) or new_quantity > state.item(
+            MAX_QUANTITY, slot
+        ):
+            raise QuantityError(
+                f"Invalid quantity for {self.name}. Attempted to set to {new_quantity}."
+            )
+        state[QUANTITY, slot] = new_quantity
+        if self.on_change:
+            self.on_change(self)
 
     @property
     def energy(self):
-        if self.label not in gibbs_free_energies:
-            pass
-            # raise KeyError(f"Gibbs free energy not found for metabolite: {self.label}")
-        return gibbs_free_energies.get(self.label, 1) * self.quantity
+        return self._gibbs * self._state.item(QUANTITY, self._slot)
 
     def reset(self) -> None:
-        with self.lock:
-            self.quantity = self.min_quantity
-            if self.on_change:
-                self.on_change(self)
+        if self.lock is None:
+            self._reset()
+        else:
+            with self.lock:
+                self._reset()
+
+    def _reset(self) -> None:
+        self._state[QUANTITY, self._slot] = self._state[MIN_QUANTITY, self._slot]
+        if self.on_change:
+            self.on_change(self)
 
     @property
     def percentage_filled(self) -> float:
@@ -187,6 +274,15 @@ class Metabolite:
         }
 
 
+@functools.lru_cache(maxsize=None)
+def _read_metabolite_info(name: str) -> dict:
+    """
+    Parses the yml file for a metabolite, memoized by name.
+    """
+    with open(f"pyology/metabolites/{name}.yml", "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
 class Metabolites:
     """
     A class that manages and stores all metabolites for an organelle.
@@ -199,6 +295,10 @@ class Metabolites:
     data : Dict[str, Metabolite]
         A dictionary storing metabolite names as keys and Metabolite instances as values.
 
+    The quantities and bounds of all registered metabolites are stored
+    column-wise in a single array, so :attr:`quantity_array` and
+    :meth:`indices` give vectorized access alongside the per-name interface.
+
     Methods
     -------
     register(name: str, quantity: int, max_quantity: int) -> None:
@@ -222,6 +322,168 @@ class Metabolites:
         Initializes the Metabolites manager with an empty dictionary.
         """
         self.data: Dict[str, Metabolite] = {}
+        self._state = np.zeros((3, 8))
+        self._index: Dict[str, int] = {}
+        self._size = 0
+        # Bumped whenever existing indices stop being valid
+        self._generation = 0
+        # Energy weight arrays, see energy_weights
+        self._energy_weights = {}
+
+    def _adopt(self, key: str, metabolite: Metabolite) -> None:
+        """
+        Store a metabolite under ``key`` and move its values into the
+        collection's state array.
+
+        Parameters
+        ----------
+        key : str
+            The normalized metabolite name.
+        metabolite : Metabolite
+            The metabolite to store.
+
+        Raises
+        ------
+        MetaboliteError
+            If the metabolite is already stored in another collection or
+            under another name. It can only be backed by one array.
+        """
+        owner = metabolite._owner() if metabolite._owner is not None else None
+        if owner is not None and not (
+            owner is self and self.data.get(key) is metabolite
+        ):
+            raise MetaboliteError(
+                f"Metabolite {metabolite.name} already belongs to a collection"
+            )
+        # Interned, so lookups by a metabolite's name match by identity
+        key = sys.intern(key)
+        slot = self._index.get(key)
+        if slot is None:
+            slot = self._size
+            if slot == self._state.shape[1]:
+                self._grow()
+            self._size += 1
+            self._index[key] = slot
+        else:
+            previous = self.data[key]
+            if previous is not metabolite:
+                self._detach(previous)
+        self._state[:, slot] = metabolite._state[:, metabolite._slot]
+        metabolite._state = self._state
+        metabolite._slot = slot
+        metabolite._owner = weakref.ref(self)
+        self.data[key] = metabolite
+
+    def _grow(self) -> None:
+        """Double the capacity of the state array."""
+        state = np.zeros((3, 2 * self._state.shape[1]))
+        state[:, : self._size] = self._state[:, : self._size]
+        self._state = state
+        for metabolite in self.data.values():
+            metabolite._state = state
+
+    @staticmethod
+    def _detach(metabolite: Metabolite) -> None:
+        """Give a metabolite leaving the collection its own copy of its values."""
+        metabolite._state = metabolite._state[:, [metabolite._slot]]
+        metabolite._slot = 0
+        metabolite._owner = None
+
+    def index(self, name: str) -> int:
+        """
+        Returns the position of a metabolite in :attr:`quantity_array`.
+
+        Parameters
+        ----------
+        name : str
+            The name of the metabolite.
+
+        Returns
+        -------
+        int
+            The index of the metabolite.
+
+        Raises
+        ------
+        UnknownMetaboliteError
+            If the metabolite does not exist.
+        """
+        try:
+            return self._index[name.lower()]
+        except KeyError:
+            raise UnknownMetaboliteError(f"Unknown metabolite: {name}") from None
+
+    def indices(self, names) -> np.ndarray:
+        """
+        Returns the positions of several metabolites in :attr:`quantity_array`.
+
+        Parameters
+        ----------
+        names : iterable of str
+            The names of the metabolites.
+
+        Returns
+        -------
+        np.ndarray
+            The indices of the metabolites, in the order given.
+
+        Raises
+        ------
+        UnknownMetaboliteError
+            If any metabolite does not exist.
+        """
+        return np.array([self.index(name) for name in names], dtype=np.intp)
+
+    def energy_weights(self, energies: dict, default: float = 0.0) -> np.ndarray:
+        """
+        Returns the energy of each slot of :attr:`quantity_array`.
+
+        The array is built once per table and reused until a metabolite is
+        added or removed, so an energy total is one dot product with the
+        quantities. Unused slots weigh zero.
+
+        Parameters
+        ----------
+        energies : dict
+            The energy per unit of each metabolite, keyed by label.
+        default : float, optional
+            The energy of a metabolite missing from ``energies``.
+
+        Returns
+        -------
+        np.ndarray
+            The energies, aligned with :attr:`quantity_array`.
+        """
+        key = (id(energies), default)
+        layout = (self._generation, len(self.data))
+        cached = self._energy_weights.get(key)
+        if cached is None or cached[1] != layout:
+            weights = np.zeros(self._size)
+            for name, slot in self._index.items():
+                weights[slot] = energies.get(self.data[name].label, default)
+            # Holding the table keeps its id from being reused
+            cached = (energies, layout, weights)
+            self._energy_weights[key] = cached
+        return cached[2]
+
+    @property
+    def quantity_array(self) -> np.ndarray:
+        """
+        A view of the quantities of all metabolites, indexed by :meth:`index`.
+
+        Writing to the view updates the metabolites.
+        """
+        return self._state[QUANTITY, : self._size]
+
+    @property
+    def min_quantity_array(self) -> np.ndarray:
+        """A view of the minimum quantities, indexed like :attr:`quantity_array`."""
+        return self._state[MIN_QUANTITY, : self._size]
+
+    @property
+    def max_quantity_array(self) -> np.ndarray:
+        """A view of the maximum quantities, indexed like :attr:`quantity_array`."""
+        return self._state[MAX_QUANTITY, : self._size]
 
     def _register(self, name: str, quantity: int, max_quantity: int, metadata: dict = None) -> None:
         """
@@ -247,11 +509,12 @@ class Metabolites:
             raise ValueError(
                 f"Initial quantity {quantity} exceeds max quantity {max_quantity}."
             )
-        if name.lower() not in self.data:
+        key = name.lower()
+        metabolite = self.data.get(key)
+        if metabolite is None:
             metabolite = Metabolite(name, quantity, max_quantity, metadata=metadata)
-            self.data[name.lower()] = metabolite
+            self._adopt(key, metabolite)
         else:
-            metabolite = self.data[name.lower()]
             new_quantity = min(metabolite.quantity + quantity, metabolite.max_quantity)
             metabolite.quantity = new_quantity
 
@@ -327,10 +590,10 @@ class Metabolites:
             raise TypeError("Metabolite name must be a string.")
         if not isinstance(amount, (int, float)):
             raise TypeError("Amount must be a number.")
-        if name.lower() not in self.data:
+        metabolite = self.data.get(name.lower())
+        if metabolite is None:
             raise UnknownMetaboliteError(f"Unknown metabolite: {name}")
 
-        metabolite = self.data[name.lower()]
         new_quantity = metabolite.quantity + amount
 
         if new_quantity < metabolite.min_quantity:
@@ -365,9 +628,10 @@ class Metabolites:
         UnknownMetaboliteError
             If the metabolite does not exist.
         """
-        if name.lower() not in self.data:
+        metabolite = self.data.get(name.lower())
+        if metabolite is None:
             raise UnknownMetaboliteError(f"Unknown metabolite: {name}")
-        return self.data[name.lower()].quantity >= amount
+        return metabolite.quantity >= amount
 
     def consume(self, **metabolites: float) -> None:
         """
@@ -380,16 +644,30 @@ class Metabolites:
 
         Raises
         ------
+        UnknownMetaboliteError
+            If a metabolite does not exist.
         InsufficientMetaboliteError
             If any metabolite is insufficient for consumption.
+        QuantityError
+            If consuming would take a metabolite below its minimum quantity.
         """
-        # First, check availability
+        # Look each metabolite up once and check them all before consuming any
+        data = self.data
+        consumed = []
         for name, amount in metabolites.items():
-            if not self.is_metabolite_available(name, amount):
+            metabolite = data.get(name.lower())
+            if metabolite is None:
+                raise UnknownMetaboliteError(f"Unknown metabolite: {name}")
+            quantity = metabolite.quantity
+            if quantity < amount:
                 raise InsufficientMetaboliteError(f"Insufficient {name} for reaction")
-        # Then, consume them
-        for name, amount in metabolites.items():
-            self.change_metabolite_quantity(name, -amount)
+            if quantity - amount < metabolite.min_quantity:
+                raise QuantityError(
+                    f"Cannot reduce {name} below {metabolite.min_quantity}. Attempted to set {name} to {quantity - amount}."
+                )
+            consumed.append((metabolite, amount))
+        for metabolite, amount in consumed:
+            metabolite.quantity -= amount
 
     def produce(self, **metabolites: float) -> None:
         """
@@ -399,11 +677,30 @@ class Metabolites:
         ----------
         metabolites : dict
             Metabolite names and amounts to produce.
+
+        Raises
+        ------
+        UnknownMetaboliteError
+            If a metabolite does not exist.
+        QuantityError
+            If producing would take a metabolite above its maximum quantity.
+            Nothing is produced in that case.
         """
+        # Look each metabolite up once and check them all before producing any
+        data = self.data
+        produced = []
         for name, amount in metabolites.items():
-            if name.lower() not in self.data:
+            metabolite = data.get(name.lower())
+            if metabolite is None:
                 raise UnknownMetaboliteError(f"Unknown metabolite: {name}")
-            self.change_metabolite_quantity(name, amount)
+            new_quantity = metabolite.quantity + amount
+            if new_quantity > metabolite.max_quantity:
+                raise QuantityError(
+                    f"Cannot exceed max quantity for {name}. Attempted to set {name} to {new_quantity}, but max is {metabolite.max_quantity}."
+                )
+            produced.append((metabolite, new_quantity))
+        for metabolite, new_quantity in produced:
+            metabolite.quantity = new_quantity
 
     def validate_all(self) -> None:
         """
@@ -414,48 +711,76 @@ class Metabolites:
         ValueError
             If any metabolite has an invalid quantity.
         """
-        for metabolite in self.data.values():
-            if (
-                metabolite.quantity < metabolite.min_quantity
-                or metabolite.quantity > metabolite.max_quantity
-            ):
+        quantities = self.quantity_array
+        invalid = (quantities < self.min_quantity_array) | (
+            quantities > self.max_quantity_array
+        )
+        if not invalid.any():
+            return
+        # Report the first invalid metabolite in insertion order
+        for key, slot in self._index.items():
+            if invalid[slot]:
+                metabolite = self.data[key]
                 raise ValueError(
                     f"Invalid quantity for {metabolite.name}: {metabolite.quantity}"
                 )
 
-    @property
-    def quantities(self) -> Dict[str, float]:
-        return {
-            metabolite.name: metabolite.quantity for metabolite in self.data.values()
-        }
-
     def get(self, key: str, default: Metabolite = None) -> Metabolite:
         return self.data.get(key.lower(), default)
 
     def reset(self):
+        size = self._size
+        self._state[QUANTITY, :size] = self._state[MIN_QUANTITY, :size]
         for metabolite in self.data.values():
-            metabolite.reset()
+            if metabolite.on_change:
+                metabolite.on_change(metabolite)
+
+    def setdefault(
+        self, name: str, quantity: float = 0, max_quantity: float = 100
+    ) -> Metabolite:
+        """
+        Returns a metabolite, registering it first if it does not exist.
+
+        Parameters
+        ----------
+        name : str
+            The name of the metabolite.
+        quantity : float, optional
+            The initial quantity if the metabolite is created. Defaults to 0.
+        max_quantity : float, optional
+            The maximum quantity if the metabolite is created. Defaults to 100.
+
+        Returns
+        -------
+        Metabolite
+            The existing or newly created metabolite.
+        """
+        key = name.lower()
+        metabolite = self.data.get(key)
+        if metabolite is None:
+            self._register(key, quantity, max_quantity)
+            metabolite = self.data[key]
+        return metabolite
 
     def __getitem__(self, key):
-        normalized_key = key.lower()
-        if normalized_key not in self.data:
-            # If the metabolite doesn't exist, create it with default values
-            self._register(
-                normalized_key, 0, 100
-            )  # You may want to adjust these default values
-            print(
-                f"Warning: Metabolite '{key}' was not found. Created with default values."
-            )
-        return self.data[normalized_key]
+        metabolite = self.data.get(key.lower())
+        if metabolite is not None:
+            return metabolite
+        # Callers throughout the models read metabolites they never
+        # registered, so a missing one is still created with default values
+        logger.warning(
+            "Metabolite '%s' was not found. Created with default values.", key
+        )
+        return self.setdefault(key)
 
     def __setitem__(self, key: str, value: Metabolite) -> None:
-        self.data[key.lower()] = value
+        self._adopt(key.lower(), value)
 
     def __delitem__(self, key: str) -> None:
-        del self.data[key.lower()]
-
-    def __iter__(self):
-        return iter(self.data)
+        key = key.lower()
+        self._detach(self.data.pop(key))
+        self._state[:, self._index.pop(key)] = 0
+        self._generation += 1
 
     def __len__(self) -> int:
         return len(self.data)
@@ -492,15 +817,25 @@ class Metabolites:
 
     @property
     def quantities(self):
-        return [metabolite.quantity for metabolite in self.data.values()]
+        # Slots follow insertion order until a metabolite is deleted
+        if len(self._index) == self._size:
+            return self._state[QUANTITY, : self._size].tolist()
+        return self._state[QUANTITY, list(self._index.values())].tolist()
 
     @property
     def total_energy(self):
-        return sum(metabolite.energy for metabolite in self.data.values())
+        weights = self.energy_weights(gibbs_free_energies, 1)
+        return float(self.quantity_array @ weights)
 
     @property
     def energy_dict(self):
-        return {metabolite.name: metabolite.energy for metabolite in self.data.values()}
+        energies = self.quantity_array * self.energy_weights(gibbs_free_energies, 1)
+        return {
+            self.data[key].name: energy
+            for key, energy in zip(
+                self._index, energies[list(self._index.values())].tolist()
+            )
+        }
 
     def exists(self, key: str) -> bool:
         """
@@ -539,8 +874,14 @@ class Metabolites:
         if attributes is None:
             attributes = self.DEFAULT_STATE_ATTRIBUTES
 
+        # One getattr per attribute: hasattr would evaluate properties such
+        # as energy a second time
         return {
-            x.name: {attr: getattr(x, attr) for attr in attributes if hasattr(x, attr)}
+            x.name: {
+                attr: value
+                for attr in attributes
+                if (value := getattr(x, attr, _MISSING)) is not _MISSING
+            }
             for x in self.data.values()
         }
 
@@ -548,9 +889,11 @@ class Metabolites:
     def _load_metabolite_info(cls, name: str) -> dict:
         """
         Loads the yml file for a metabolite and returns the info as a dict.
+
+        Each file is parsed once; later calls return a copy of the parsed
+        info, so callers may modify it freely.
         """
-        with open(f"pyology/metabolites/{name}.yml", "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        return copy.deepcopy(_read_metabolite_info(name))
 
     @classmethod
     def from_list(cls, metabolite_names: List[str]) -> "Metabolites":
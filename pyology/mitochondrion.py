@@ -1,18 +1,251 @@
 import logging
 import math
-from typing import Dict
-
-from utils.command_data import CommandData
-from utils.tracking import execute_command
+from typing import Dict, Sequence
 
 from .constants import *
 from .exceptions import *
+from .jit import njit
 from .krebs_cycle import KrebsCycle
 from .metabolite import Metabolite
 from .organelle import Organelle
 
 logger = logging.getLogger(__name__)
 
+ELECTRON_TRANSPORT_CHAIN_METABOLITES = (
+    "nadh",
+    "fadh2",
+    "ubiquinone",
+    "ubiquinol",
+    "cytochrome_c_oxidized",
+    "cytochrome_c_reduced",
+    "oxygen",
+)
+OXIDATIVE_PHOSPHORYLATION_METABOLITES = ELECTRON_TRANSPORT_CHAIN_METABOLITES + (
+    "adp",
+    "atp",
+)
+
+# Metabolites recorded before and after each cellular respiration call
+RESPIRATION_TRACKED_METABOLITES = (
+    "pyruvate",
+    "atp",
+    "adp",
+    "nad",
+    "nadh",
+    "fadh2",
+    "oxygen",
+)
+
+# Products of each step, in the order their amounts are passed to apply_deltas
+KREBS_CYCLE_PRODUCTS = ("nadh", "fadh2", "atp")
+COMPLEX_I_PRODUCTS = COMPLEX_II_PRODUCTS = ("ubiquinol",)
+COMPLEX_III_PRODUCTS = ("ubiquinone", "cytochrome_c_reduced")
+COMPLEX_IV_PRODUCTS = ("cytochrome_c_oxidized",)
+ATP_SYNTHASE_PRODUCTS = ("atp",)
+
+
+def _validate_conservation(obj, initial, final, changes):
+    # Add appropriate validation logic here
+    return True
+
+
+@njit(cache=True)
+def _proton_leak(proton_gradient, leak_rate, leak_steepness, leak_midpoint):
+    """
+    Logistic proton leak across the inner membrane.
+
+    Same formula as ``Mitochondrion.calculate_proton_leak``, as a free
+    function the compiled kernels can call.
+    """
+    return leak_rate / (
+        1 + math.exp(leak_steepness * (leak_midpoint - proton_gradient))
+    )
+
+
+@njit(cache=True)
+def _electron_transport_chain(
+    nadh,
+    fadh2,
+    ubiquinone,
+    ubiquinol,
+    cytochrome_c_oxidized,
+    cytochrome_c_reduced,
+    oxygen,
+    proton_gradient,
+    leak_rate,
+    leak_steepness,
+    leak_midpoint,
+):
+    """
+    Run complexes I-IV once on scalar quantities.
+
+    Mirrors ``Mitochondrion.complex_I`` to ``complex_IV`` called in order,
+    including the proton leak applied after each pumping step, but works on
+    plain floats so it can be compiled.
+
+    Returns
+    -------
+    tuple of float
+        The updated quantities (in the order of the arguments, up to and
+        including the proton gradient) followed by the electrons transferred
+        through complexes I, II, III and IV.
+    """
+    electrons_I = 0.0
+    if nadh >= 1 and ubiquinone >= 1:
+        electrons_I = min(nadh, ubiquinone)
+        nadh -= electrons_I
+        ubiquinone -= electrons_I
+        ubiquinol += electrons_I
+        proton_gradient += PROTONS_PER_NADH * electrons_I
+        proton_gradient = max(
+            0.0,
+            proton_gradient
+            - _proton_leak(proton_gradient, leak_rate, leak_steepness, leak_midpoint),
+        )
+
+    electrons_II = 0.0
+    if fadh2 >= 1 and ubiquinone >= 1:
+        electrons_II = min(fadh2, ubiquinone)
+        fadh2 -= electrons_II
+        ubiquinone -= electrons_II
+        ubiquinol += electrons_II
+
+    electrons_III = 0.0
+    if ubiquinol >= 1 and cytochrome_c_oxidized >= 1:
+        electrons_III = min(ubiquinol, cytochrome_c_oxidized)
+        ubiquinol -= electrons_III
+        cytochrome_c_oxidized -= electrons_III
+        ubiquinone += electrons_III
+        cytochrome_c_reduced += electrons_III
+        proton_gradient += PROTONS_PER_COMPLEX_III * electrons_III
+        proton_gradient = max(
+            0.0,
+            proton_gradient
+            - _proton_leak(proton_gradient, leak_rate, leak_steepness, leak_midpoint),
+        )
+
+    electrons_IV = 0.0
+    if cytochrome_c_reduced >= 1 and oxygen >= 0.5:
+        electrons_IV = min(cytochrome_c_reduced, oxygen * 2)  # 2 cytochrome c per O2
+        cytochrome_c_reduced -= electrons_IV
+        oxygen -= electrons_IV / 2
+        cytochrome_c_oxidized += electrons_IV
+        proton_gradient += PROTONS_PER_COMPLEX_IV * electrons_IV
+        proton_gradient = max(
+            0.0,
+            proton_gradient
+            - _proton_leak(proton_gradient, leak_rate, leak_steepness, leak_midpoint),
+        )
+
+    return (
+        nadh,
+        fadh2,
+        ubiquinone,
+        ubiquinol,
+        cytochrome_c_oxidized,
+        cytochrome_c_reduced,
+        oxygen,
+        proton_gradient,
+        electrons_I,
+        electrons_II,
+        electrons_III,
+        electrons_IV,
+    )
+
+
+@njit(cache=True)
+def _oxidative_phosphorylation(
+    nadh,
+    fadh2,
+    ubiquinone,
+    ubiquinol,
+    cytochrome_c_oxidized,
+    cytochrome_c_reduced,
+    oxygen,
+    adp,
+    atp,
+    proton_gradient,
+    max_ubiquinone,
+    max_cytochrome_c_oxidized,
+    leak_rate,
+    leak_steepness,
+    leak_midpoint,
+):
+    """
+    Run the electron transport chain, ATP synthase and carrier replenishment.
+
+    Mirrors ``Mitochondrion.electron_transport_chain`` followed by
+    ``atp_synthase``, ``replenish_ubiquinone`` and ``replenish_cytochrome_c``
+    on plain floats so the whole step can be compiled.
+
+    Returns
+    -------
+    tuple of float
+        The updated quantities (in the order of the arguments, up to and
+        including the proton gradient), the electrons transferred through
+        complexes I, II, III and IV and the ATP produced.
+    """
+    (
+        nadh,
+        fadh2,
+        ubiquinone,
+        ubiquinol,
+        cytochrome_c_oxidized,
+        cytochrome_c_reduced,
+        oxygen,
+        proton_gradient,
+        electrons_I,
+        electrons_II,
+        electrons_III,
+        electrons_IV,
+    ) = _electron_transport_chain(
+        nadh,
+        fadh2,
+        ubiquinone,
+        ubiquinol,
+        cytochrome_c_oxidized,
+        cytochrome_c_reduced,
+        oxygen,
+        proton_gradient,
+        leak_rate,
+        leak_steepness,
+        leak_midpoint,
+    )
+
+    # ATP synthase
+    atp_produced = min(proton_gradient // PROTONS_PER_ATP, adp)
+    adp -= atp_produced
+    atp += atp_produced
+    proton_gradient -= atp_produced * PROTONS_PER_ATP
+
+    # Replenish ubiquinone and cytochrome c
+    replenished = min(ubiquinol, max_ubiquinone - ubiquinone)
+    ubiquinone += replenished
+    ubiquinol -= replenished
+    replenished = min(
+        cytochrome_c_reduced, max_cytochrome_c_oxidized - cytochrome_c_oxidized
+    )
+    cytochrome_c_oxidized += replenished
+    cytochrome_c_reduced -= replenished
+
+    return (
+        nadh,
+        fadh2,
+        ubiquinone,
+        ubiquinol,
+        cytochrome_c_oxidized,
+        cytochrome_c_reduced,
+        oxygen,
+        adp,
+        atp,
+        proton_gradient,
+        electrons_I,
+        electrons_II,
+        electrons_III,
+        electrons_IV,
+        atp_produced,
+    )
+
 
 class Mitochondrion(Organelle):
     """
@@ -35,6 +268,8 @@ class Mitochondrion(Organelle):
         Converts pyruvate to Acetyl-CoA
     calculate_oxygen_needed:
         Calculates the amount of oxygen needed for cellular respiration
+    theoretical_atp_yield:
+        Calculates the ATP yield of fully oxidizing pyruvate in closed form
     cellular_respiration:
         Simulates the entire cellular respiration process with feedback inhibition
     calculate_proton_leak:
@@ -49,31 +284,53 @@ class Mitochondrion(Organelle):
         Simulates Complex III activity
     complex_IV:
         Simulates Complex IV activity
+    electron_transport_chain:
+        Runs Complexes I to IV in a single compiled step
     is_metabolite_available:
         Checks if a metabolite is available in sufficient quantity
     atp_synthase:
         Synthesizes ATP using the proton gradient
+    reset:
+        Resets the proton gradient and metabolites in place
     """
 
     name = "Mitochondrion"
 
+    atp_per_nadh = 2.5
+    atp_per_fadh2 = 1.5
+    atp_per_substrate_phosphorylation = 1
+    oxygen_per_nadh = 0.5
+    oxygen_per_fadh2 = 0.5
+    # ATP from fully oxidizing one pyruvate: pyruvate dehydrogenase and the
+    # Krebs cycle reduce 1 + NADH_PER_ACETYL_COA NAD+
+    atp_per_pyruvate = (
+        (1 + NADH_PER_ACETYL_COA) * atp_per_nadh
+        + FADH2_PER_ACETYL_COA * atp_per_fadh2
+        + GTP_PER_ACETYL_COA * atp_per_substrate_phosphorylation
+    )
+
+    calcium_threshold = CALCIUM_THRESHOLD
+    calcium_boost_factor = CALCIUM_BOOST_FACTOR
+    max_proton_gradient = MAX_PROTON_GRADIENT
+    leak_rate = float(LEAK_RATE)
+    leak_steepness = float(LEAK_STEEPNESS)
+    leak_midpoint = float(LEAK_MIDPOINT)
+
+    debug: bool
+    proton_gradient: float
+    krebs_cycle: KrebsCycle
+
+    __slots__ = (
+        "debug",
+        "proton_gradient",
+        "krebs_cycle",
+    )
+
     def __init__(self, debug=False) -> None:
         super().__init__()
         self.debug = debug
 
         self.proton_gradient = 0
-        self.atp_per_nadh = 2.5
-        self.atp_per_fadh2 = 1.5
-        self.atp_per_substrate_phosphorylation = 1
-        self.oxygen_per_nadh = 0.5
-        self.oxygen_per_fadh2 = 0.5
-
-        self.calcium_threshold = CALCIUM_THRESHOLD
-        self.calcium_boost_factor = CALCIUM_BOOST_FACTOR
-        self.max_proton_gradient = MAX_PROTON_GRADIENT
-        self.leak_rate = LEAK_RATE
-        self.leak_steepness = LEAK_STEEPNESS
-        self.leak_midpoint = LEAK_MIDPOINT
 
         self.krebs_cycle = KrebsCycle()
 
@@ -102,9 +359,13 @@ class Mitochondrion(Organelle):
         """
         if metabolite not in self.metabolites:
             logger.warning(
-                f"{metabolite} not found in metabolites. Adding it with initial quantity {initial_quantity}."
+                "%s not found in metabolites. Adding it with initial quantity %s.",
+                metabolite,
+                initial_quantity,
+            )
+            self.metabolites.register(
+                metabolite, initial_quantity, max(MAX_METABOLITE, initial_quantity)
             )
-            self.metabolites[metabolite] = Metabolite(metabolite, initial_quantity)
 
     def change_metabolite_quantity(self, metabolite: str, amount: float) -> float:
         """
@@ -126,21 +387,47 @@ class Mitochondrion(Organelle):
         float
             The actual amount changed (may be different if preventing negative values).
         """
-        if metabolite not in self.metabolites:
-            self.metabolites[metabolite] = Metabolite(metabolite, 0)
+        return self.apply_deltas((metabolite,), (amount,))[0]
 
-        current_quantity = self.metabolites[metabolite].quantity
-        new_quantity = max(current_quantity + amount, 0)
-        actual_change = new_quantity - current_quantity
+    def apply_deltas(self, names: Sequence[str], deltas: Sequence[float]) -> list:
+        """
+        Changes the quantities of several metabolites in one update.
 
-        self.metabolites[metabolite].quantity = new_quantity
+        As with :meth:`change_metabolite_quantity`, missing metabolites are
+        created and quantities are clamped at zero.
 
-        if actual_change != amount:
-            logger.warning(
-                f"Attempted to decrease {metabolite} by {-amount}, but only decreased by {-actual_change} to prevent negative quantity."
-            )
+        Parameters
+        ----------
+        names: Sequence[str]
+            The names of the metabolites.
+        deltas: Sequence[float]
+            The amount to change each metabolite by.
 
-        return actual_change
+        Returns
+        -------
+        list
+            The actual amount each metabolite changed by.
+        """
+        metabolites = self.metabolites
+        actual_changes = []
+        for name, amount in zip(names, deltas):
+            metabolite = metabolites.get(name)
+            if metabolite is None:
+                metabolites.register(name, 0, MAX_METABOLITE)
+                metabolite = metabolites[name]
+            current_quantity = metabolite.quantity
+            new_quantity = current_quantity + amount
+            if new_quantity < 0:
+                new_quantity = 0
+                logger.warning(
+                    "Attempted to decrease %s by %s, but only decreased by %s to prevent negative quantity.",
+                    name,
+                    -amount,
+                    current_quantity,
+                )
+            metabolite.quantity = new_quantity
+            actual_changes.append(new_quantity - current_quantity)
+        return actual_changes
 
     def consume_metabolites(self, **metabolites: Dict[str, float]) -> bool:
         """
@@ -156,16 +443,16 @@ class Mitochondrion(Organelle):
         bool
             True if all metabolites were consumed successfully, False otherwise.
         """
-        temp_changes = {}
-        for metabolite, amount in metabolites.items():
-            actual_change = self.change_metabolite_quantity(metabolite, -amount)
-            if abs(actual_change) < abs(amount):
-                # Revert changes if not all metabolites could be consumed
-                for rev_metabolite, rev_amount in temp_changes.items():
-                    self.change_metabolite_quantity(rev_metabolite, rev_amount)
-                logger.warning(f"Insufficient {metabolite} for reaction")
+        # Check everything first so a shortfall needs no rollback
+        consumed = []
+        for name, amount in metabolites.items():
+            metabolite = self.metabolites.get(name)
+            if metabolite is None or metabolite.quantity < amount:
+                logger.warning("Insufficient %s for reaction", name)
                 return False
-            temp_changes[metabolite] = actual_change
+            consumed.append((metabolite, amount))
+        for metabolite, amount in consumed:
+            metabolite.quantity -= amount
         return True
 
     def produce_metabolites(self, **metabolites: Dict[str, float]) -> None:
@@ -177,11 +464,16 @@ class Mitochondrion(Organelle):
         metabolites: Dict[str, float]
             The metabolites to produce and their amounts.
         """
-        for metabolite, amount in metabolites.items():
-            actual_change = self.change_metabolite_quantity(metabolite, amount)
+        actual_changes = self.apply_deltas(metabolites.keys(), metabolites.values())
+        for (metabolite, amount), actual_change in zip(
+            metabolites.items(), actual_changes
+        ):
             if actual_change != amount:
                 logger.warning(
-                    f"Could not produce full amount of {metabolite}. Produced {actual_change} instead of {amount}."
+                    "Could not produce full amount of %s. Produced %s instead of %s.",
+                    metabolite,
+                    actual_change,
+                    amount,
                 )
 
     def krebs_cycle_process(self, acetyl_coa_amount: int) -> int:
@@ -202,11 +494,10 @@ class Mitochondrion(Organelle):
             The total amount of NADH and FADH2 produced.
         """
         logger.info(
-            f"Processing {acetyl_coa_amount} units of acetyl-CoA through the Krebs cycle"
+            "Processing %s units of acetyl-CoA through the Krebs cycle",
+            acetyl_coa_amount,
         )
 
-        self.krebs_cycle.add_substrate("glucose", acetyl_coa_amount)
-
         # Ensure there's enough oxaloacetate to start the cycle
         if self.metabolites["oxaloacetate"].quantity < acetyl_coa_amount:
             oxaloacetate_needed = (
@@ -216,22 +507,14 @@ class Mitochondrion(Organelle):
                 logger.warning("Insufficient oxaloacetate to start Krebs cycle")
                 return 0
 
-        total_nadh = 0
-        total_fadh2 = 0
-        total_atp = 0
-
-        for metabolites, cofactors in self.krebs_cycle.krebs_cycle_iterator(
-            num_cycles=acetyl_coa_amount
-        ):
-            total_nadh += cofactors["NADH"]
-            total_fadh2 += cofactors["FADH2"]
-            total_atp += cofactors["GTP"]  # GTP is equivalent to ATP
+        # Every turn of the cycle yields the same cofactors, so the totals
+        # are a direct product of the number of turns.
+        total_nadh = NADH_PER_ACETYL_COA * acetyl_coa_amount
+        total_fadh2 = FADH2_PER_ACETYL_COA * acetyl_coa_amount
+        total_atp = GTP_PER_ACETYL_COA * acetyl_coa_amount  # GTP is equivalent to ATP
 
         # Transfer the products to the mitochondrion
-        self.produce_metabolites(nadh=total_nadh, fadh2=total_fadh2, atp=total_atp)
-
-        # Reset the Krebs cycle for the next round
-        self.krebs_cycle.reset()
+        self.apply_deltas(KREBS_CYCLE_PRODUCTS, (total_nadh, total_fadh2, total_atp))
 
         return total_nadh + total_fadh2
 
@@ -249,10 +532,9 @@ class Mitochondrion(Organelle):
         int
             The amount of acetyl-CoA produced.
         """
-        logger.info(f"Converting {pyruvate_amount} units of pyruvate to Acetyl-CoA")
+        logger.info("Converting %s units of pyruvate to Acetyl-CoA", pyruvate_amount)
         acetyl_coa_produced = pyruvate_amount
-        self.change_metabolite_quantity("nadh", pyruvate_amount)
-        self.change_metabolite_quantity("co2", pyruvate_amount)
+        self.apply_deltas(("nadh", "co2"), (pyruvate_amount, pyruvate_amount))
         return acetyl_coa_produced
 
     def calculate_oxygen_needed(self, pyruvate_amount: int) -> float:
@@ -272,6 +554,28 @@ class Mitochondrion(Organelle):
         """
         return pyruvate_amount * 2.5
 
+    def theoretical_atp_yield(self, pyruvate_amount: float) -> float:
+        """
+        Calculate the ATP yield of fully oxidizing pyruvate.
+
+        Pyruvate dehydrogenase, the Krebs cycle and oxidative phosphorylation
+        have fixed stoichiometries in this model, so their combined yield is
+        linear in the amount of pyruvate: :attr:`atp_per_pyruvate`, folded
+        once when the class is defined, times the amount. Works element-wise
+        on NumPy arrays.
+
+        Parameters
+        ----------
+        pyruvate_amount: float
+            The amount of pyruvate to oxidize.
+
+        Returns
+        -------
+        float
+            The amount of ATP (including GTP) produced.
+        """
+        return self.atp_per_pyruvate * pyruvate_amount
+
     def cellular_respiration(self, pyruvate_amount: float) -> float:
         """
         Perform cellular respiration on the given amount of pyruvate.
@@ -282,26 +586,17 @@ class Mitochondrion(Organelle):
         Returns:
             The amount of ATP produced.
         """
-        tracked_attributes = [
-            "pyruvate",
-            "atp",
-            "adp",
-            "nad",
-            "nadh",
-            "fadh2",
-            "oxygen",
-        ]
-
-        def validate_conservation(obj, initial, final, changes):
-            # Add appropriate validation logic here
-            return True
+        # Imported here rather than at module level: the command tracking
+        # utilities pull in pydantic, which only this method needs.
+        from utils.command_data import CommandData
+        from utils.tracking import execute_command
 
         command_data = CommandData(
             obj=self,
             command="process_pyruvate",
-            tracked_attributes=tracked_attributes,
+            tracked_attributes=list(RESPIRATION_TRACKED_METABOLITES),
             args=[pyruvate_amount],
-            validations=[validate_conservation],
+            validations=[_validate_conservation],
         )
 
         result = execute_command(self, command_data, logger, self.debug)
@@ -317,14 +612,12 @@ class Mitochondrion(Organelle):
         float
             The amount of proton leak.
         """
-        relative_gradient = self.proton_gradient / self.max_proton_gradient
-        leak = self.leak_rate / (
+        return self.leak_rate / (
             1
             + math.exp(
-                -self.leak_steepness * (self.proton_gradient - self.leak_midpoint)
+                self.leak_steepness * (self.leak_midpoint - self.proton_gradient)
             )
         )
-        return leak
 
     def update_proton_gradient(self, protons_pumped: float) -> float:
         """
@@ -343,7 +636,7 @@ class Mitochondrion(Organelle):
         self.proton_gradient += protons_pumped
         leak = self.calculate_proton_leak()
         self.proton_gradient = max(0, self.proton_gradient - leak)
-        logger.info(f"Updated proton gradient: {self.proton_gradient:.2f}")
+        logger.info("Updated proton gradient: %.2f", self.proton_gradient)
         return self.proton_gradient
 
     def complex_I(self) -> int:
@@ -358,20 +651,25 @@ class Mitochondrion(Organelle):
         int
             The amount of electrons transferred.
         """
-        if self.is_metabolite_available("nadh", 1) and self.is_metabolite_available(
-            "ubiquinone", 1
+        nadh = self.metabolites.get("nadh")
+        ubiquinone = self.metabolites.get("ubiquinone")
+        if (
+            nadh is not None
+            and ubiquinone is not None
+            and nadh.quantity >= 1
+            and ubiquinone.quantity >= 1
         ):
-            reaction_rate = min(
-                self.metabolites["nadh"].quantity,
-                self.metabolites["ubiquinone"].quantity,
+            reaction_rate = min(nadh.quantity, ubiquinone.quantity)
+            nadh.quantity -= reaction_rate
+            ubiquinone.quantity -= reaction_rate
+            self.apply_deltas(COMPLEX_I_PRODUCTS, (reaction_rate,))
+            self.update_proton_gradient(PROTONS_PER_NADH * reaction_rate)
+            logger.info(
+                "Complex I: Oxidized %s NADH, pumped %s protons",
+                reaction_rate,
+                PROTONS_PER_NADH * reaction_rate,
             )
-            if self.consume_metabolites(nadh=reaction_rate, ubiquinone=reaction_rate):
-                self.produce_metabolites(ubiquinol=reaction_rate)
-                self.update_proton_gradient(PROTONS_PER_NADH * reaction_rate)  # Updated
-                logger.info(
-                    f"Complex I: Oxidized {reaction_rate} NADH, pumped {PROTONS_PER_NADH * reaction_rate} protons"
-                )
-                return reaction_rate
+            return reaction_rate
         logger.warning("Insufficient NADH or ubiquinone for Complex I")
         return 0
 
@@ -387,17 +685,20 @@ class Mitochondrion(Organelle):
         int
             The amount of electrons transferred.
         """
-        if self.is_metabolite_available("fadh2", 1) and self.is_metabolite_available(
-            "ubiquinone", 1
+        fadh2 = self.metabolites.get("fadh2")
+        ubiquinone = self.metabolites.get("ubiquinone")
+        if (
+            fadh2 is not None
+            and ubiquinone is not None
+            and fadh2.quantity >= 1
+            and ubiquinone.quantity >= 1
         ):
-            reaction_rate = min(
-                self.metabolites["fadh2"].quantity,
-                self.metabolites["ubiquinone"].quantity,
-            )
-            if self.consume_metabolites(fadh2=reaction_rate, ubiquinone=reaction_rate):
-                self.produce_metabolites(ubiquinol=reaction_rate)
-                logger.info(f"Complex II: Oxidized {reaction_rate} FADH2")
-                return reaction_rate
+            reaction_rate = min(fadh2.quantity, ubiquinone.quantity)
+            fadh2.quantity -= reaction_rate
+            ubiquinone.quantity -= reaction_rate
+            self.apply_deltas(COMPLEX_II_PRODUCTS, (reaction_rate,))
+            logger.info("Complex II: Oxidized %s FADH2", reaction_rate)
+            return reaction_rate
         logger.warning("Insufficient FADH2 or ubiquinone for Complex II")
         return 0
 
@@ -413,24 +714,25 @@ class Mitochondrion(Organelle):
         int
             The amount of electrons transferred.
         """
-        if self.is_metabolite_available(
-            "ubiquinol", 1
-        ) and self.is_metabolite_available("cytochrome_c_oxidized", 1):
-            reaction_rate = min(
-                self.metabolites["ubiquinol"].quantity,
-                self.metabolites["cytochrome_c_oxidized"].quantity,
+        ubiquinol = self.metabolites.get("ubiquinol")
+        cytochrome_c_oxidized = self.metabolites.get("cytochrome_c_oxidized")
+        if (
+            ubiquinol is not None
+            and cytochrome_c_oxidized is not None
+            and ubiquinol.quantity >= 1
+            and cytochrome_c_oxidized.quantity >= 1
+        ):
+            reaction_rate = min(ubiquinol.quantity, cytochrome_c_oxidized.quantity)
+            ubiquinol.quantity -= reaction_rate
+            cytochrome_c_oxidized.quantity -= reaction_rate
+            self.apply_deltas(COMPLEX_III_PRODUCTS, (reaction_rate, reaction_rate))
+            self.update_proton_gradient(PROTONS_PER_COMPLEX_III * reaction_rate)
+            logger.info(
+                "Complex III: Transferred %s electron pairs, pumped %s protons",
+                reaction_rate,
+                PROTONS_PER_COMPLEX_III * reaction_rate,
             )
-            if self.consume_metabolites(
-                ubiquinol=reaction_rate, cytochrome_c_oxidized=reaction_rate
-            ):
-                self.produce_metabolites(
-                    ubiquinone=reaction_rate, cytochrome_c_reduced=reaction_rate
-                )
-                self.update_proton_gradient(PROTONS_PER_FADH2 * reaction_rate)
-                logger.info(
-                    f"Complex III: Transferred {reaction_rate} electron pairs, pumped {PROTONS_PER_FADH2 * reaction_rate} protons"
-                )
-                return reaction_rate
+            return reaction_rate
         logger.warning("Insufficient ubiquinol or cytochrome c for Complex III")
         return 0
 
@@ -446,29 +748,69 @@ class Mitochondrion(Organelle):
         int
             The amount of electrons transferred.
         """
-        if self.is_metabolite_available(
-            "cytochrome_c_reduced", 1
-        ) and self.is_metabolite_available("oxygen", 0.5):
-            reaction_rate = min(
-                self.metabolites["cytochrome_c_reduced"].quantity,
-                self.metabolites["oxygen"].quantity * 2,
-            )  # 2 cytochrome c per O2
+        oxygen = self.metabolites["oxygen"]
+        cytochrome_c_reduced = self.metabolites.get("cytochrome_c_reduced")
+        if (
+            cytochrome_c_reduced is not None
+            and cytochrome_c_reduced.quantity >= 1
+            and oxygen.quantity >= 0.5
+        ):
+            # 2 cytochrome c per O2
+            reaction_rate = min(cytochrome_c_reduced.quantity, oxygen.quantity * 2)
             oxygen_consumed = reaction_rate / 2
-            if self.consume_metabolites(
-                cytochrome_c_reduced=reaction_rate, oxygen=oxygen_consumed
-            ):
-                self.produce_metabolites(cytochrome_c_oxidized=reaction_rate)
-                self.update_proton_gradient(PROTONS_PER_FADH2 * reaction_rate)
-                logger.info(
-                    f"Complex IV: Consumed {oxygen_consumed} O2, pumped {PROTONS_PER_FADH2 * reaction_rate} protons"
-                )
-                return reaction_rate
-        if self.metabolites["oxygen"].quantity <= 0:
+            cytochrome_c_reduced.quantity -= reaction_rate
+            oxygen.quantity -= oxygen_consumed
+            self.apply_deltas(COMPLEX_IV_PRODUCTS, (reaction_rate,))
+            self.update_proton_gradient(PROTONS_PER_COMPLEX_IV * reaction_rate)
+            logger.info(
+                "Complex IV: Consumed %s O2, pumped %s protons",
+                oxygen_consumed,
+                PROTONS_PER_COMPLEX_IV * reaction_rate,
+            )
+            return reaction_rate
+        if oxygen.quantity <= 0:
             logger.warning("Insufficient oxygen for Complex IV")
         else:
             logger.warning("Insufficient reduced cytochrome c for Complex IV")
         return 0
 
+    def electron_transport_chain(self) -> tuple:
+        """
+        Runs Complexes I to IV of the electron transport chain.
+
+        Equivalent to calling ``complex_I`` to ``complex_IV`` in order, but the
+        work is done in a single call to a kernel that is compiled with Numba
+        when it is installed.
+
+        Returns
+        -------
+        tuple of float
+            The amount of electrons transferred through Complexes I, II, III
+            and IV.
+        """
+        metabolites = [
+            self.metabolites[name] for name in ELECTRON_TRANSPORT_CHAIN_METABOLITES
+        ]
+        result = _electron_transport_chain(
+            *(metabolite.quantity for metabolite in metabolites),
+            float(self.proton_gradient),
+            self.leak_rate,
+            self.leak_steepness,
+            self.leak_midpoint,
+        )
+        for metabolite, quantity in zip(metabolites, result):
+            metabolite.quantity = quantity
+        self.proton_gradient = result[len(metabolites)]
+        electrons = result[len(metabolites) + 1 :]
+
+        logger.info(
+            "Electron transport chain: %.2f, %.2f, %.2f, %.2f electron pairs "
+            "through Complexes I-IV, proton gradient %.2f",
+            *electrons,
+            self.proton_gradient,
+        )
+        return electrons
+
     def is_metabolite_available(self, metabolite: str, amount: float) -> bool:
         """
         Check if a metabolite is available in sufficient quantity.
@@ -485,11 +827,11 @@ class Mitochondrion(Organelle):
         bool
             True if the metabolite is available in sufficient quantity, False otherwise.
         """
-        if hasattr(self, metabolite):
-            return getattr(self, metabolite).quantity >= amount
-        else:
-            logger.warning(f"Unknown metabolite: {metabolite}")
-            return False
+        found = self.metabolites.get(metabolite)
+        if found is not None:
+            return found.quantity >= amount
+        logger.warning("Unknown metabolite: %s", metabolite)
+        return False
 
     def atp_synthase(self) -> int:
         """
@@ -500,15 +842,16 @@ class Mitochondrion(Organelle):
         int
             The amount of ATP produced.
         """
-        protons_required_per_atp = PROTONS_PER_ATP
-        possible_atp = int(self.proton_gradient / protons_required_per_atp)
-        atp_produced = min(possible_atp, self.metabolites["adp"].quantity)
-        if self.consume_metabolites(adp=atp_produced):
-            self.produce_metabolites(atp=atp_produced)
-            self.proton_gradient -= atp_produced * protons_required_per_atp
-            logger.info(f"ATP Synthase: Produced {atp_produced} ATP")
+        adp = self.metabolites["adp"]
+        atp_produced = min(int(self.proton_gradient // PROTONS_PER_ATP), adp.quantity)
+        if atp_produced > 0:
+            adp.quantity -= atp_produced
+            self.apply_deltas(ATP_SYNTHASE_PRODUCTS, (atp_produced,))
+            # Protons not used for lack of ADP stay in the gradient
+            self.proton_gradient -= atp_produced * PROTONS_PER_ATP
+            logger.info("ATP Synthase: Produced %s ATP", atp_produced)
             return atp_produced
-        logger.warning("Insufficient ADP for ATP synthesis")
+        logger.warning("Insufficient ADP or proton gradient for ATP synthesis")
         return 0
 
     def replenish_ubiquinone(self) -> int:
@@ -520,14 +863,15 @@ class Mitochondrion(Organelle):
         int
             The amount of ubiquinone replenished.
         """
+        ubiquinone = self.metabolites["ubiquinone"]
         replenish_amount = min(
             self.metabolites["ubiquinol"].quantity,
-            self.metabolites["ubiquinone"].max_quantity
-            - self.metabolites["ubiquinone"].quantity,
+            ubiquinone.max_quantity - ubiquinone.quantity,
+        )
+        self.apply_deltas(
+            ("ubiquinone", "ubiquinol"), (replenish_amount, -replenish_amount)
         )
-        self.change_metabolite_quantity("ubiquinone", replenish_amount)
-        self.change_metabolite_quantity("ubiquinol", -replenish_amount)
-        logger.info(f"Replenished {replenish_amount} ubiquinone")
+        logger.info("Replenished %s ubiquinone", replenish_amount)
 
     def replenish_cytochrome_c(self) -> int:
         """
@@ -538,19 +882,25 @@ class Mitochondrion(Organelle):
         int
             The amount of oxidized cytochrome c replenished.
         """
+        cytochrome_c_oxidized = self.metabolites["cytochrome_c_oxidized"]
         replenish_amount = min(
             self.metabolites["cytochrome_c_reduced"].quantity,
-            self.metabolites["cytochrome_c_oxidized"].max_quantity
-            - self.metabolites["cytochrome_c_oxidized"].quantity,
+            cytochrome_c_oxidized.max_quantity - cytochrome_c_oxidized.quantity,
         )
-        self.change_metabolite_quantity("cytochrome_c_oxidized", replenish_amount)
-        self.change_metabolite_quantity("cytochrome_c_reduced", -replenish_amount)
-        logger.info(f"Replenished {replenish_amount} oxidized cytochrome c")
+        self.apply_deltas(
+            ("cytochrome_c_oxidized", "cytochrome_c_reduced"),
+            (replenish_amount, -replenish_amount),
+        )
+        logger.info("Replenished %s oxidized cytochrome c", replenish_amount)
 
     def oxidative_phosphorylation(self, cytoplasmic_nadh_used: int = 0) -> int:
         """
         Simulates oxidative phosphorylation with the electron transport chain.
 
+        Runs Complexes I to IV, ATP synthase and the replenishment of
+        ubiquinone and cytochrome c in a single call to a kernel that is
+        compiled with Numba when it is installed.
+
         Parameters
         ----------
         cytoplasmic_nadh_used: int
@@ -561,31 +911,42 @@ class Mitochondrion(Organelle):
         int
             The amount of ATP produced.
         """
-        if self.metabolites["oxygen"].quantity <= 0:
+        metabolites = [
+            self.metabolites[name] for name in OXIDATIVE_PHOSPHORYLATION_METABOLITES
+        ]
+        _, _, ubiquinone, _, cytochrome_c_oxidized, _, oxygen, _, _ = metabolites
+
+        if oxygen.quantity <= 0:
             logger.warning("No oxygen available. Oxidative phosphorylation halted.")
             return 0
 
-        total_nadh = self.metabolites["nadh"].quantity + cytoplasmic_nadh_used
-
-        # Run the electron transport chain
-        electrons_through_complex_I = self.complex_I()
-        electrons_through_complex_II = self.complex_II()
-        electrons_through_complex_III = self.complex_III()
-        electrons_through_complex_IV = self.complex_IV()
-
-        # ATP production via ATP synthase
-        atp_produced = self.atp_synthase()
-
-        # Replenish ubiquinone and cytochrome c
-        self.replenish_ubiquinone()
-        self.replenish_cytochrome_c()
-
-        # Calculate efficiency
+        result = _oxidative_phosphorylation(
+            *(metabolite.quantity for metabolite in metabolites),
+            float(self.proton_gradient),
+            ubiquinone.max_quantity,
+            cytochrome_c_oxidized.max_quantity,
+            self.leak_rate,
+            self.leak_steepness,
+            self.leak_midpoint,
+        )
+        for metabolite, quantity in zip(metabolites, result):
+            metabolite.quantity = quantity
+        (
+            self.proton_gradient,
+            electrons_through_complex_I,
+            electrons_through_complex_II,
+            electrons_through_complex_III,
+            electrons_through_complex_IV,
+            atp_produced,
+        ) = result[len(metabolites) :]
+
+        # The efficiency is only reported, so skip it when nobody is listening
         total_electrons = electrons_through_complex_I + electrons_through_complex_II
-        if total_electrons > 0:
+        if total_electrons > 0 and logger.isEnabledFor(logging.INFO):
             efficiency = atp_produced / total_electrons
             logger.info(
-                f"Oxidative phosphorylation efficiency: {efficiency:.2f} ATP per electron pair"
+                "Oxidative phosphorylation efficiency: %.2f ATP per electron pair",
+                efficiency,
             )
 
         return atp_produced
@@ -604,15 +965,14 @@ class Mitochondrion(Organelle):
         float
             The amount of calcium buffered.
         """
+        calcium = self.metabolites["calcium"]
         calcium_uptake = min(
-            cytoplasmic_calcium,
-            self.metabolites["calcium"].max_quantity
-            - self.metabolites["calcium"].quantity,
+            cytoplasmic_calcium, calcium.max_quantity - calcium.quantity
         )
         self.change_metabolite_quantity("calcium", calcium_uptake)
-        logger.info(f"Mitochondrion buffered {calcium_uptake:.2f} units of calcium")
+        logger.info("Mitochondrion buffered %.2f units of calcium", calcium_uptake)
 
-        if self.metabolites["calcium"].quantity > self.calcium_threshold:
+        if calcium.quantity > self.calcium_threshold:
             logger.warning(
                 "Calcium overload detected. Risk of mitochondrial dysfunction."
             )
@@ -635,12 +995,18 @@ class Mitochondrion(Organelle):
         """
         released = min(amount, self.metabolites["calcium"].quantity)
         self.change_metabolite_quantity("calcium", -released)
-        logger.info(f"Mitochondrion released {released:.2f} units of calcium")
+        logger.info("Mitochondrion released %.2f units of calcium", released)
         return released
 
     def reset(self) -> None:
-        """Reset mitochondrion state."""
-        self.__init__()
+        """
+        Reset mitochondrion state.
+
+        The proton gradient and every metabolite are reset in place, keeping
+        the existing metabolite objects and configuration.
+        """
+        self.proton_gradient = 0
+        self.metabolites.reset()
         logger.info("Mitochondrion state reset")
 
     def transfer_cytoplasmic_nadh(self, cytoplasmic_nadh: float) -> float:
@@ -662,6 +1028,8 @@ class Mitochondrion(Organelle):
         mitochondrial_nadh = int(cytoplasmic_nadh * shuttle_efficiency)
         self.metabolites["nadh"].quantity += mitochondrial_nadh
         logger.info(
-            f"Transferred {cytoplasmic_nadh} cytoplasmic NADH, produced {mitochondrial_nadh} mitochondrial NADH"
+            "Transferred %s cytoplasmic NADH, produced %s mitochondrial NADH",
+            cytoplasmic_nadh,
+            mitochondrial_nadh,
         )
         return mitochondrial_nadh
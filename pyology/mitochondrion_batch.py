@@ -0,0 +1,591 @@
+import logging
+from typing import Tuple
+
+import numpy as np
+
+from .constants import (
+    FADH2_PER_ACETYL_COA,
+    GTP_PER_ACETYL_COA,
+    LEAK_MIDPOINT,
+    LEAK_RATE,
+    LEAK_STEEPNESS,
+    MAX_METABOLITE,
+    NADH_PER_ACETYL_COA,
+    PROTONS_PER_ATP,
+    PROTONS_PER_COMPLEX_III,
+    PROTONS_PER_COMPLEX_IV,
+    PROTONS_PER_NADH,
+)
+
+logger = logging.getLogger(__name__)
+
+FIELDS = (
+    "nadh",
+    "fadh2",
+    "atp",
+    "adp",
+    "co2",
+    "oxygen",
+    "ubiquinone",
+    "ubiquinol",
+    "cytochrome_c_oxidized",
+    "cytochrome_c_reduced",
+    "proton_gradient",
+)
+(
+    NADH,
+    FADH2,
+    ATP,
+    ADP,
+    CO2,
+    OXYGEN,
+    UBIQUINONE,
+    UBIQUINOL,
+    CYTOCHROME_C_OXIDIZED,
+    CYTOCHROME_C_REDUCED,
+    PROTON_GRADIENT,
+) = range(len(FIELDS))
+
+
+def _field(index: int, doc: str) -> property:
+    """Property exposing one row of the batch state as a named array."""
+
+    def fget(self) -> np.ndarray:
+        return self.state[index]
+
+    def fset(self, value) -> None:
+        self.state[index] = value
+
+    return property(fget, fset, doc=doc)
+
+
+class MitochondrionBatch:
+    """
+    Simulates many independent mitochondria at once.
+
+    State is kept as a structure of arrays: ``state`` holds one row per
+    metabolite (and the proton gradient) with one column per mitochondrion,
+    and each row is exposed as a named attribute (``nadh``, ``atp``, ...).
+    Each pathway step is a handful of vectorized operations instead of one
+    Python call per organelle. The steps mirror the scalar ``Mitochondrion``
+    methods of the same name; the scalar ``if`` guards become boolean masks
+    that are multiplied into the reaction rates.
+
+    Parameters
+    ----------
+    size : int
+        The number of mitochondria in the batch.
+    max_quantity : float
+        The maximum quantity of ubiquinone and oxidized cytochrome c used
+        when replenishing them.
+    xp : module, optional
+        The array module holding the state, NumPy by default. Any module
+        with NumPy's interface can be passed; with ``cupy`` the whole batch
+        lives and is stepped on the GPU.
+    **initial_quantities : float or array_like
+        Initial values for any of the fields, broadcast to ``size``.
+
+    Attributes
+    ----------
+    fields : tuple of str
+        The names of the rows of ``state``.
+    state : np.ndarray
+        The batch state, of shape ``(len(fields), size)``.
+
+    Methods
+    -------
+    from_mitochondria:
+        Builds a batch from the state of ``Mitochondrion`` objects
+    to_mitochondria:
+        Writes the batch state back to ``Mitochondrion`` objects
+    reset:
+        Resets every field to zero
+    krebs_cycle_process:
+        Processes acetyl-CoA through the Krebs cycle
+    pyruvate_to_acetyl_coa:
+        Converts pyruvate to Acetyl-CoA
+    calculate_proton_leak:
+        Calculates the proton leak using a logistic function
+    update_proton_gradient:
+        Updates the proton gradient considering nonlinear leak
+    complex_I, complex_II, complex_III, complex_IV:
+        Simulate the activity of each complex of the electron transport chain
+    atp_synthase:
+        Synthesizes ATP using the proton gradient
+    replenish_carriers:
+        Replenishes ubiquinone and oxidized cytochrome c in one pass
+    oxidative_phosphorylation:
+        Runs the electron transport chain and ATP synthase
+    cellular_respiration:
+        Respires pyruvate to completion, stopping each mitochondrion on its own
+    """
+
+    fields = FIELDS
+
+    leak_rate = LEAK_RATE
+    leak_steepness = LEAK_STEEPNESS
+    leak_midpoint = LEAK_MIDPOINT
+
+    nadh = _field(NADH, "NADH per mitochondrion.")
+    fadh2 = _field(FADH2, "FADH2 per mitochondrion.")
+    atp = _field(ATP, "ATP per mitochondrion.")
+    adp = _field(ADP, "ADP per mitochondrion.")
+    co2 = _field(CO2, "CO2 per mitochondrion.")
+    oxygen = _field(OXYGEN, "Oxygen per mitochondrion.")
+    ubiquinone = _field(UBIQUINONE, "Ubiquinone per mitochondrion.")
+    ubiquinol = _field(UBIQUINOL, "Ubiquinol per mitochondrion.")
+    cytochrome_c_oxidized = _field(
+        CYTOCHROME_C_OXIDIZED, "Oxidized cytochrome c per mitochondrion."
+    )
+    cytochrome_c_reduced = _field(
+        CYTOCHROME_C_REDUCED, "Reduced cytochrome c per mitochondrion."
+    )
+    proton_gradient = _field(PROTON_GRADIENT, "Proton gradient per mitochondrion.")
+
+    def __init__(
+        self, size: int, max_quantity: float = 100, xp=np, **initial_quantities
+    ) -> None:
+        unknown = set(initial_quantities) - set(self.fields)
+        if unknown:
+            raise ValueError(f"Unknown fields: {sorted(unknown)}")
+
+        self.size = size
+        self.max_quantity = max_quantity
+
+        self.xp = xp
+        self.state = xp.zeros((len(self.fields), size), dtype=np.float64)
+        for field, value in initial_quantities.items():
+            setattr(self, field, value)
+
+    @classmethod
+    def from_mitochondria(
+        cls, mitochondria, max_quantity: float = 100, xp=np
+    ) -> "MitochondrionBatch":
+        """
+        Builds a batch from the current state of individual mitochondria.
+
+        Metabolites a mitochondrion does not have are taken as zero.
+
+        Parameters
+        ----------
+        mitochondria : sequence of Mitochondrion
+            The mitochondria to stack, one per column.
+        max_quantity, xp
+            See the class parameters.
+
+        Returns
+        -------
+        MitochondrionBatch
+            A batch with one column per mitochondrion.
+        """
+        state = np.zeros((len(cls.fields), len(mitochondria)), dtype=np.float64)
+        for column, mitochondrion in enumerate(mitochondria):
+            metabolites = mitochondrion.metabolites
+            for row, field in enumerate(cls.fields[:PROTON_GRADIENT]):
+                metabolite = metabolites.get(field)
+                if metabolite is not None:
+                    state[row, column] = metabolite.quantity
+            state[PROTON_GRADIENT, column] = mitochondrion.proton_gradient
+        batch = cls(len(mitochondria), max_quantity=max_quantity, xp=xp)
+        batch.state[...] = xp.asarray(state)
+        return batch
+
+    def to_mitochondria(self, mitochondria) -> None:
+        """
+        Writes the batch state back to individual mitochondria.
+
+        Metabolites a mitochondrion does not have yet are registered.
+
+        Parameters
+        ----------
+        mitochondria : sequence of Mitochondrion
+            The mitochondria to update, in the same order as the columns.
+        """
+        if len(mitochondria) != self.size:
+            raise ValueError(
+                f"Expected {self.size} mitochondria, got {len(mitochondria)}"
+            )
+        columns = self.state.T.tolist()
+        for mitochondrion, values in zip(mitochondria, columns):
+            metabolites = mitochondrion.metabolites
+            for field, value in zip(self.fields[:PROTON_GRADIENT], values):
+                metabolite = metabolites.get(field)
+                if metabolite is not None:
+                    metabolite.quantity = value
+                elif value:
+                    metabolites.register(field, value, max(MAX_METABOLITE, value))
+            mitochondrion.proton_gradient = values[PROTON_GRADIENT]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def reset(self) -> None:
+        """Reset every field of every mitochondrion to zero."""
+        self.state.fill(0)
+
+    def krebs_cycle_process(self, acetyl_coa_amount: np.ndarray) -> np.ndarray:
+        """
+        Processes acetyl-CoA through the Krebs cycle.
+
+        Parameters
+        ----------
+        acetyl_coa_amount: array_like
+            The amount of acetyl-CoA to process in each mitochondrion.
+
+        Returns
+        -------
+        np.ndarray
+            The total amount of NADH and FADH2 produced per mitochondrion.
+        """
+        acetyl_coa_amount = self.xp.asarray(acetyl_coa_amount, dtype=np.float64)
+        self.nadh += NADH_PER_ACETYL_COA * acetyl_coa_amount
+        self.fadh2 += FADH2_PER_ACETYL_COA * acetyl_coa_amount
+        self.atp += GTP_PER_ACETYL_COA * acetyl_coa_amount
+        return (NADH_PER_ACETYL_COA + FADH2_PER_ACETYL_COA) * acetyl_coa_amount
+
+    def pyruvate_to_acetyl_coa(self, pyruvate_amount: np.ndarray) -> np.ndarray:
+        """
+        Converts pyruvate to Acetyl-CoA.
+
+        Parameters
+        ----------
+        pyruvate_amount: array_like
+            The amount of pyruvate to convert in each mitochondrion.
+
+        Returns
+        -------
+        np.ndarray
+            The amount of acetyl-CoA produced per mitochondrion.
+        """
+        pyruvate_amount = self.xp.asarray(pyruvate_amount, dtype=np.float64)
+        self.nadh += pyruvate_amount
+        self.co2 += pyruvate_amount
+        return pyruvate_amount.copy()
+
+    def calculate_proton_leak(self) -> np.ndarray:
+        """
+        Calculate the proton leak using a logistic function.
+
+        Returns
+        -------
+        np.ndarray
+            The amount of proton leak per mitochondrion.
+        """
+        # Evaluated in one buffer to avoid a temporary array per operation
+        xp = self.xp
+        leak = xp.subtract(self.leak_midpoint, self.proton_gradient)
+        leak *= self.leak_steepness
+        xp.exp(leak, out=leak)
+        leak += 1
+        return xp.divide(self.leak_rate, leak, out=leak)
+
+    def update_proton_gradient(
+        self, protons_pumped: np.ndarray, where: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Update the proton gradient considering nonlinear leak.
+
+        Parameters
+        ----------
+        protons_pumped: np.ndarray
+            The amount of protons pumped in each mitochondrion.
+        where: np.ndarray, optional
+            Boolean mask of the mitochondria that pumped protons. The leak is
+            only applied to these, matching the scalar model where the
+            gradient is only updated after a complex runs.
+
+        Returns
+        -------
+        np.ndarray
+            The updated proton gradient.
+        """
+        self.proton_gradient += protons_pumped
+        leak = self.calculate_proton_leak()
+        if where is not None:
+            leak *= where
+        self.xp.maximum(self.proton_gradient - leak, 0, out=self.proton_gradient)
+        return self.proton_gradient
+
+    def _active(self, condition: np.ndarray, where: np.ndarray) -> np.ndarray:
+        return condition if where is None else condition & where
+
+    def _rate(
+        self, first: np.ndarray, second: np.ndarray, where: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        # A complex runs where both substrates are at least 1, which is where
+        # their minimum, the reaction rate, is at least 1
+        reaction_rate = self.xp.minimum(first, second)
+        active = self._active(reaction_rate >= 1, where)
+        reaction_rate *= active
+        return reaction_rate, active
+
+    def complex_I(self, where: np.ndarray = None) -> np.ndarray:
+        """
+        Simulates Complex I activity.
+
+        Parameters
+        ----------
+        where: np.ndarray, optional
+            Boolean mask restricting which mitochondria take part.
+
+        Returns
+        -------
+        np.ndarray
+            The amount of electrons transferred per mitochondrion.
+        """
+        reaction_rate, active = self._rate(self.nadh, self.ubiquinone, where)
+        self.nadh -= reaction_rate
+        self.ubiquinone -= reaction_rate
+        self.ubiquinol += reaction_rate
+        self.update_proton_gradient(PROTONS_PER_NADH * reaction_rate, active)
+        return reaction_rate
+
+    def complex_II(self, where: np.ndarray = None) -> np.ndarray:
+        """
+        Simulates Complex II activity.
+
+        Parameters
+        ----------
+        where: np.ndarray, optional
+            Boolean mask restricting which mitochondria take part.
+
+        Returns
+        -------
+        np.ndarray
+            The amount of electrons transferred per mitochondrion.
+        """
+        reaction_rate, _ = self._rate(self.fadh2, self.ubiquinone, where)
+        self.fadh2 -= reaction_rate
+        self.ubiquinone -= reaction_rate
+        self.ubiquinol += reaction_rate
+        return reaction_rate
+
+    def complex_III(self, where: np.ndarray = None) -> np.ndarray:
+        """
+        Simulates Complex III activity.
+
+        Parameters
+        ----------
+        where: np.ndarray, optional
+            Boolean mask restricting which mitochondria take part.
+
+        Returns
+        -------
+        np.ndarray
+            The amount of electrons transferred per mitochondrion.
+        """
+        reaction_rate, active = self._rate(
+            self.ubiquinol, self.cytochrome_c_oxidized, where
+        )
+        self.ubiquinol -= reaction_rate
+        self.cytochrome_c_oxidized -= reaction_rate
+        self.ubiquinone += reaction_rate
+        self.cytochrome_c_reduced += reaction_rate
+        self.update_proton_gradient(PROTONS_PER_COMPLEX_III * reaction_rate, active)
+        return reaction_rate
+
+    def complex_IV(self, where: np.ndarray = None) -> np.ndarray:
+        """
+        Simulates Complex IV activity.
+
+        Parameters
+        ----------
+        where: np.ndarray, optional
+            Boolean mask restricting which mitochondria take part.
+
+        Returns
+        -------
+        np.ndarray
+            The amount of electrons transferred per mitochondrion.
+        """
+        # 2 cytochrome c per O2, so at least 0.5 O2 is needed
+        reaction_rate, active = self._rate(
+            self.cytochrome_c_reduced, self.oxygen * 2, where
+        )
+        self.cytochrome_c_reduced -= reaction_rate
+        self.oxygen -= reaction_rate / 2
+        self.cytochrome_c_oxidized += reaction_rate
+        self.update_proton_gradient(PROTONS_PER_COMPLEX_IV * reaction_rate, active)
+        return reaction_rate
+
+    def atp_synthase(self, where: np.ndarray = None) -> np.ndarray:
+        """
+        Synthesizes ATP using the proton gradient.
+
+        Parameters
+        ----------
+        where: np.ndarray, optional
+            Boolean mask restricting which mitochondria take part.
+
+        Returns
+        -------
+        np.ndarray
+            The amount of ATP produced per mitochondrion.
+        """
+        atp_produced = self.xp.floor_divide(self.proton_gradient, PROTONS_PER_ATP)
+        self.xp.minimum(atp_produced, self.adp, out=atp_produced)
+        if where is not None:
+            atp_produced *= where
+        self.adp -= atp_produced
+        self.atp += atp_produced
+        # Protons not used for lack of ADP stay in the gradient
+        self.proton_gradient -= atp_produced * PROTONS_PER_ATP
+        return atp_produced
+
+    def replenish_ubiquinone(self, where: np.ndarray = None) -> np.ndarray:
+        """
+        Replenishes ubiquinone from ubiquinol.
+
+        Returns
+        -------
+        np.ndarray
+            The amount of ubiquinone replenished per mitochondrion.
+        """
+        replenish_amount = self.xp.minimum(
+            self.ubiquinol, self.max_quantity - self.ubiquinone
+        )
+        if where is not None:
+            replenish_amount *= where
+        self.ubiquinone += replenish_amount
+        self.ubiquinol -= replenish_amount
+        return replenish_amount
+
+    def replenish_cytochrome_c(self, where: np.ndarray = None) -> np.ndarray:
+        """
+        Replenishes oxidized cytochrome c from reduced form.
+
+        Returns
+        -------
+        np.ndarray
+            The amount of oxidized cytochrome c replenished per mitochondrion.
+        """
+        replenish_amount = self.xp.minimum(
+            self.cytochrome_c_reduced,
+            self.max_quantity - self.cytochrome_c_oxidized,
+        )
+        if where is not None:
+            replenish_amount *= where
+        self.cytochrome_c_oxidized += replenish_amount
+        self.cytochrome_c_reduced -= replenish_amount
+        return replenish_amount
+
+    def replenish_carriers(self, where: np.ndarray = None) -> np.ndarray:
+        """
+        Replenishes ubiquinone and oxidized cytochrome c in one pass.
+
+        Same as :meth:`replenish_ubiquinone` followed by
+        :meth:`replenish_cytochrome_c`, done on both carriers at once.
+
+        Returns
+        -------
+        np.ndarray
+            The amount of ubiquinone and of oxidized cytochrome c replenished
+            per mitochondrion, as two rows.
+        """
+        # Oxidized and reduced forms alternate in the state, so both pairs
+        # are strided views over the same rows
+        oxidized = self.state[UBIQUINONE:PROTON_GRADIENT:2]
+        reduced = self.state[UBIQUINOL:PROTON_GRADIENT:2]
+        replenish_amount = self.xp.subtract(self.max_quantity, oxidized)
+        self.xp.minimum(reduced, replenish_amount, out=replenish_amount)
+        if where is not None:
+            replenish_amount *= where
+        oxidized += replenish_amount
+        reduced -= replenish_amount
+        return replenish_amount
+
+    def oxidative_phosphorylation(self, where: np.ndarray = None) -> np.ndarray:
+        """
+        Simulates oxidative phosphorylation with the electron transport chain.
+
+        Mitochondria without oxygen are left untouched, as in the scalar model.
+        Only those taking part are warned about, so mitochondria a caller has
+        already stopped are not reported again on every step.
+
+        Parameters
+        ----------
+        where: np.ndarray, optional
+            Boolean mask restricting which mitochondria take part.
+
+        Returns
+        -------
+        np.ndarray
+            The amount of ATP produced per mitochondrion.
+        """
+        has_oxygen = self.oxygen > 0
+        anoxic = self._active(~has_oxygen, where)
+        if anoxic.any():
+            logger.warning(
+                "No oxygen available in %d of %d mitochondria. "
+                "Oxidative phosphorylation halted for them.",
+                self.xp.count_nonzero(anoxic),
+                self.size,
+            )
+        has_oxygen = self._active(has_oxygen, where)
+
+        self.complex_I(has_oxygen)
+        self.complex_II(has_oxygen)
+        self.complex_III(has_oxygen)
+        self.complex_IV(has_oxygen)
+
+        atp_produced = self.atp_synthase(has_oxygen)
+
+        self.replenish_carriers(has_oxygen)
+
+        return atp_produced
+
+    def cellular_respiration(
+        self, pyruvate_amount: np.ndarray, max_steps=1000
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Respires pyruvate to completion in every mitochondrion at once.
+
+        Pyruvate is converted to acetyl-CoA and run through the Krebs cycle,
+        then oxidative phosphorylation is stepped until the NADH and FADH2
+        are used up. Each mitochondrion stops on its own once it has nothing
+        left to oxidize, runs out of oxygen or reaches its step budget, so
+        different pyruvate amounts can be respired in one batch. The stopping
+        rule is a single per-mitochondrion mask with no branching on
+        individual lanes; the loop ends when every one has stopped. The
+        mitochondria that stopped for lack of oxygen are warned about once,
+        at the end.
+
+        Parameters
+        ----------
+        pyruvate_amount: array_like
+            The amount of pyruvate to respire in each mitochondrion.
+        max_steps: int or array_like, optional
+            The most oxidative phosphorylation steps to run, either for the
+            whole batch or per mitochondrion. Defaults to 1000.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            The ATP produced and the number of oxidative phosphorylation
+            steps run, per mitochondrion.
+        """
+        xp = self.xp
+        max_steps = xp.broadcast_to(xp.asarray(max_steps, dtype=np.int64), self.size)
+        acetyl_coa = self.pyruvate_to_acetyl_coa(pyruvate_amount)
+        self.krebs_cycle_process(acetyl_coa)
+        atp_produced = xp.zeros(self.size, dtype=np.float64)
+        steps = xp.zeros(self.size, dtype=np.int64)
+        while True:
+            active = (
+                ((self.nadh >= 1) | (self.fadh2 >= 1))
+                & (self.oxygen > 0)
+                & (steps < max_steps)
+            )
+            if not active.any():
+                break
+            atp_produced += self.oxidative_phosphorylation(active)
+            steps += active
+        anoxic = ((self.nadh >= 1) | (self.fadh2 >= 1)) & (self.oxygen <= 0)
+        if anoxic.any():
+            logger.warning(
+                "No oxygen available in %d of %d mitochondria. "
+                "Cellular respiration stopped early for them.",
+                xp.count_nonzero(anoxic),
+                self.size,
+            )
+        return atp_produced, steps
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from .energy_calculations import sum_adenine_nucleotides
+
 if TYPE_CHECKING:
     from .cell import Cell
     from .simulation import Reporter
@@ -15,12 +17,22 @@ class Observer(ABC):
 class NegativeMetaboliteObserver(Observer):
     def observe(self, cell: "Cell", reporter: "Reporter"):
         for compartment in [cell.cytoplasm, cell.mitochondrion]:
-            for metabolite, quantity in compartment.metabolites.items():
-                if quantity.quantity < 0:
+            metabolites = compartment.metabolites
+            quantities = metabolites.quantity_array
+            negative = quantities < 0
+            # One comparison over the quantity array; only negative
+            # metabolites are visited by name
+            if not negative.any():
+                continue
+            for metabolite, slot in metabolites._index.items():
+                if negative[slot]:
                     reporter.log_warning(
-                        f"Negative {metabolite} quantity detected in {compartment.__class__.__name__}: {quantity.quantity}"
+                        "Negative %s quantity detected in %s: %s",
+                        metabolite,
+                        compartment.__class__.__name__,
+                        quantities.item(slot),
                     )
-                    quantity.quantity = 0
+                    quantities[slot] = 0
 
 
 class AdenineNucleotideBalanceObserver(Observer):
@@ -35,16 +47,14 @@ class AdenineNucleotideBalanceObserver(Observer):
 
         if abs(current_balance - self.initial_balance) > 1e-6:
             reporter.log_warning(
-                f"Adenine nucleotide imbalance detected. "
-                f"Current: {current_balance:.6f}, "
-                f"Initial: {self.initial_balance:.6f}, "
-                f"Difference: {current_balance - self.initial_balance:.6f}"
+                "Adenine nucleotide imbalance detected. "
+                "Current: %.6f, Initial: %.6f, Difference: %.6f",
+                current_balance,
+                self.initial_balance,
+                current_balance - self.initial_balance,
             )
 
     def _calculate_total_adenine_nucleotides(self, cell: "Cell") -> float:
-        total = 0
-        for compartment in [cell.cytoplasm, cell.mitochondrion]:
-            total += sum(
-                compartment.metabolites[m].quantity for m in ["ATP", "ADP", "AMP"]
-            )
-        return total
+        return sum_adenine_nucleotides(
+            cell.cytoplasm.metabolites
+        ) + sum_adenine_nucleotides(cell.mitochondrion.metabolites)
@@ -1,10 +1,11 @@
 import json
 import os
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Sequence
 
 import yaml
 
+from .constants import MAX_GLYCOLYSIS_RATE
 from .exceptions import (
     GlycolysisRateError,
     InsufficientMetaboliteError,
@@ -126,6 +127,8 @@ class Organelle(metaclass=OrganelleMeta):
         Adds a metabolite to the organelle or increases its quantity if it already exists.
     change_metabolite_quantity(self, metabolite_name: str, amount: float) -> None:
         Changes the quantity of a metabolite in the organelle.
+    apply_deltas(self, names: Sequence[str], deltas: Sequence[float]) -> None:
+        Changes the quantities of several metabolites in one update.
     is_metabolite_available(self, metabolite: str, amount: float) -> bool:
         Checks if a metabolite is available in the organelle.
     consume_metabolites(self, **metabolites: float) -> None:
@@ -136,6 +139,8 @@ class Organelle(metaclass=OrganelleMeta):
 
     name = "Organelle"
 
+    __slots__ = ("metabolites", "_glycolysis_rate", "__weakref__")
+
     def __init__(self, metabolites_list: List[str] = None, logger=None, debug=False):
         self.metabolites = Metabolites.from_list(metabolites_list)
         self._glycolysis_rate = 1.0
@@ -147,7 +152,7 @@ class Organelle(metaclass=OrganelleMeta):
 
     @glycolysis_rate.setter
     def glycolysis_rate(self, value):
-        if value <= 0:
+        if value <= 0 or value > MAX_GLYCOLYSIS_RATE:
             raise GlycolysisRateError(f"Invalid glycolysis rate: {value}")
         self._glycolysis_rate = value
 
@@ -234,10 +239,7 @@ class Organelle(metaclass=OrganelleMeta):
             raise MetaboliteError("Metabolite name must be a string.")
         if not isinstance(amount, (int, float)):
             raise MetaboliteError("Amount must be a number.")
-        if metabolite_name not in self.metabolites:
-            raise UnknownMetaboliteError(f"Unknown metabolite: {metabolite_name}")
-
-        metabolite = self.metabolites[metabolite_name]
+        metabolite = self.get_metabolite(metabolite_name)
         new_quantity = metabolite.quantity + amount
 
         if new_quantity < 0:
@@ -251,6 +253,41 @@ class Organelle(metaclass=OrganelleMeta):
 
         metabolite.quantity = new_quantity
 
+    def apply_deltas(self, names: Sequence[str], deltas: Sequence[float]) -> None:
+        """
+        Changes the quantities of several metabolites in one update.
+
+        Every change is checked before any is applied, so a change that would
+        take a metabolite below zero or above its maximum leaves all
+        quantities untouched.
+
+        Parameters
+        ----------
+        names : Sequence[str]
+            The names of the metabolites, each given at most once.
+        deltas : Sequence[float]
+            The amount to change each metabolite by.
+
+        Raises
+        ------
+        UnknownMetaboliteError
+            If a metabolite is not found in the organelle.
+        QuantityError
+            If a change would take a metabolite out of its bounds.
+        """
+        # Look each metabolite up once and check every change before applying any
+        changes = []
+        for name, amount in zip(names, deltas):
+            metabolite = self.get_metabolite(name)
+            new_quantity = metabolite.quantity + amount
+            if new_quantity < 0 or new_quantity > metabolite.max_quantity:
+                raise QuantityError(
+                    f"Cannot change {name} by {amount}. Current: {metabolite.quantity}, Max: {metabolite.max_quantity}"
+                )
+            changes.append((metabolite, new_quantity))
+        for metabolite, new_quantity in changes:
+            metabolite.quantity = new_quantity
+
     def is_metabolite_available(self, metabolite: str, amount: float) -> bool:
         """
         Checks if a metabolite is available in the organelle.
@@ -272,9 +309,7 @@ class Organelle(metaclass=OrganelleMeta):
         UnknownMetaboliteError
             If the metabolite is not found in the organelle.
         """
-        if metabolite not in self.metabolites:
-            raise UnknownMetaboliteError(f"Unknown metabolite: {metabolite}")
-        return self.metabolites[metabolite].quantity >= amount
+        return self.get_metabolite(metabolite).quantity >= amount
 
     def consume_metabolites(self, **metabolites: float) -> None:
         """
@@ -284,13 +319,25 @@ class Organelle(metaclass=OrganelleMeta):
         ----------
         metabolites : dict
             A dictionary of metabolites to consume.
+
+        Raises
+        ------
+        UnknownMetaboliteError
+            If a metabolite is not found in the organelle.
+        InsufficientMetaboliteError
+            If any metabolite is insufficient. Nothing is consumed in that case.
         """
-        for metabolite, amount in metabolites.items():
-            if not self.is_metabolite_available(metabolite, amount):
+        # Look each metabolite up once and check them all before consuming any
+        consumed = [
+            (self.get_metabolite(name), amount) for name, amount in metabolites.items()
+        ]
+        for metabolite, amount in consumed:
+            if metabolite.quantity < amount:
                 raise InsufficientMetaboliteError(
-                    f"Insufficient {metabolite} for reaction. Required: {amount}, Available: {self.metabolites[metabolite].quantity}"
+                    f"Insufficient {metabolite.name} for reaction. Required: {amount}, Available: {metabolite.quantity}"
                 )
-            self.change_metabolite_quantity(metabolite, -amount)
+        for metabolite, amount in consumed:
+            metabolite.quantity -= amount
 
     def produce_metabolites(self, **metabolites: float) -> None:
         """
@@ -318,9 +365,7 @@ class Organelle(metaclass=OrganelleMeta):
         float
             The quantity of the metabolite.
         """
-        if metabolite not in self.metabolites:
-            raise UnknownMetaboliteError(f"Unknown metabolite: {metabolite}")
-        return self.metabolites[metabolite].quantity
+        return self.get_metabolite(metabolite).quantity
 
     def set_metabolite_quantity(self, metabolite: str, quantity: float) -> None:
         """
@@ -333,9 +378,7 @@ class Organelle(metaclass=OrganelleMeta):
         quantity : float
             The quantity of the metabolite.
         """
-        if metabolite not in self.metabolites:
-            raise UnknownMetaboliteError(f"Unknown metabolite: {metabolite}")
-        self.metabolites[metabolite].quantity = quantity
+        self.get_metabolite(metabolite).quantity = quantity
 
     def get_metabolite(self, metabolite_name: str) -> Metabolite:
         """
@@ -356,6 +399,7 @@ class Organelle(metaclass=OrganelleMeta):
         UnknownMetaboliteError
             If the metabolite is not found in the organelle.
         """
-        if metabolite_name not in self.metabolites:
+        metabolite = self.metabolites.get(metabolite_name)
+        if metabolite is None:
             raise UnknownMetaboliteError(f"Unknown metabolite: {metabolite_name}")
-        return self.metabolites[metabolite_name]
+        return metabolite
@@ -1,7 +1,10 @@
+import logging
 from typing import Dict
 
 from .reaction import Reaction
 
+logger = logging.getLogger(__name__)
+
 
 class Pathway:
     def __init__(self, name: str):
@@ -22,7 +25,7 @@ class Pathway:
             reaction (Reaction): The reaction to add.
         """
         self.reactions.append(reaction)
-        print(f"Added reaction '{reaction.name}' to pathway '{self.name}'.")
+        logger.debug("Added reaction '%s' to pathway '%s'.", reaction.name, self.name)
 
     def execute(self, metabolites: Dict[str, float]) -> None:
         """
@@ -31,7 +34,7 @@ class Pathway:
         Args:
             metabolites (dict): Dictionary of metabolite concentrations.
         """
-        print(f"\nExecuting Pathway: {self.name}")
+        logger.debug("Executing Pathway: %s", self.name)
         for reaction in self.reactions:
             # Assuming forward direction for glycolysis
             reaction.execute(metabolites, direction="forward")
@@ -1,17 +1,88 @@
 import logging
-from typing import TYPE_CHECKING, Dict
+import weakref
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Tuple
 
+import numpy as np
+
+from .enzymes import Enzyme
 from .exceptions import InsufficientSubstrateError, ReactionError
+from .jit import njit
+from .metabolite import MAX_QUANTITY, QUANTITY
+from .reaction_compiler import CompiledReactions
 
 if TYPE_CHECKING:
-    from .enzymes import Enzyme
+    from .metabolite import Metabolites
     from .organelle import Organelle
 
 
 logger = logging.getLogger(__name__)
 
 
+@njit(cache=True)
+def _apply_scaled(state, idx, coef, rate):
+    """
+    Add ``coef * rate`` to the quantities at ``idx`` of a state array.
+
+    Nothing changes unless every new quantity stays between zero and its
+    maximum. Returns whether the change was applied.
+    """
+    q = state[QUANTITY]
+    q_max = state[MAX_QUANTITY]
+    for i in range(idx.shape[0]):
+        new_quantity = q[idx[i]] + coef[i] * rate
+        if new_quantity < 0 or new_quantity > q_max[idx[i]]:
+            return False
+    for i in range(idx.shape[0]):
+        q[idx[i]] += coef[i] * rate
+    return True
+
+
+@njit(cache=True)
+def _apply_reaction(
+    state, idx, coef, n_substrates, kinetics_idx, k_m_n, hill, vmax, time_step
+):
+    """
+    Run a reaction at its Michaelis-Menten rate on a state array.
+
+    The enzyme rate is ``vmax`` times the Hill-scaled saturation of each
+    metabolite in ``kinetics_idx``. Over ``time_step`` it is capped by the
+    supply of the first ``n_substrates`` entries of ``idx``, whose
+    coefficients are negative, and the capped rate is applied as in
+    :func:`_apply_scaled`.
+
+    Returns the enzyme rate, the applied rate, and whether the change was
+    applied.
+    """
+    q = state[QUANTITY]
+    kinetics_factor = 1.0
+    for i in range(kinetics_idx.shape[0]):
+        conc_n = q[kinetics_idx[i]] ** hill[i]
+        kinetics_factor *= conc_n / (k_m_n[i] + conc_n)
+    reaction_rate = vmax * kinetics_factor
+    actual_rate = reaction_rate * time_step
+    for i in range(n_substrates):
+        if coef[i] < 0:
+            actual_rate = min(actual_rate, q[idx[i]] / -coef[i])
+    return reaction_rate, actual_rate, _apply_scaled(state, idx, coef, actual_rate)
+
+
 class Reaction:
+    __slots__ = (
+        "name",
+        "enzyme",
+        "substrates",
+        "products",
+        "reversible",
+        "_stoichiometries",
+        "_substrate_arrays",
+        "_changes",
+        "_kinetics",
+        "_compiled",
+        "_disjoint",
+        "_net_changes",
+        "_limiting",
+    )
+
     def __init__(
         self,
         name: str,
@@ -41,6 +112,212 @@ class Reaction:
         self.substrates = substrates
         self.products = products
         self.reversible = reversible
+        self._stoichiometries = weakref.WeakKeyDictionary()
+        self._substrate_arrays = weakref.WeakKeyDictionary()
+        self._changes = weakref.WeakKeyDictionary()
+        self._kinetics = weakref.WeakKeyDictionary()
+        self._compiled = None
+        # Whether no metabolite is both a substrate and a product, so the
+        # change of each is a single signed coefficient
+        self._disjoint = not {name.lower() for name in substrates} & {
+            name.lower() for name in products
+        }
+        # Net change of each metabolite for one turn, forward and reversed,
+        # as the (names, deltas) tuples Organelle.apply_deltas takes
+        self._net_changes = (
+            self._net_change(substrates, products),
+            self._net_change(products, substrates),
+        )
+        # Substrates that can limit the rate (those actually consumed), per
+        # direction
+        self._limiting = tuple(
+            tuple((met, amount) for met, amount in side.items() if amount > 0)
+            for side in (substrates, products)
+        )
+
+    @staticmethod
+    def _net_change(
+        substrates: Dict[str, float], products: Dict[str, float]
+    ) -> Tuple[Tuple[str, ...], Tuple[float, ...]]:
+        deltas = {}
+        for metabolite, amount in substrates.items():
+            deltas[metabolite] = deltas.get(metabolite, 0) - amount
+        for metabolite, amount in products.items():
+            deltas[metabolite] = deltas.get(metabolite, 0) + amount
+        return tuple(deltas), tuple(deltas.values())
+
+    @property
+    def compiled(self) -> CompiledReactions:
+        """The forward reaction as a generated function, built on first use."""
+        if self._compiled is None:
+            self._compiled = CompiledReactions((self,))
+        return self._compiled
+
+    def stoichiometry(
+        self, metabolites: "Metabolites", reverse: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Resolve the reaction's metabolites to indices into a collection.
+
+        The lookup is done once per collection and cached, so repeated
+        executions reuse the same index and coefficient arrays.
+
+        Parameters
+        ----------
+        metabolites : Metabolites
+            The collection whose ``quantity_array`` the indices refer to.
+        reverse : bool, optional
+            Whether to swap substrates and products. Defaults to False.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            Substrate indices, substrate coefficients, product indices and
+            product coefficients.
+
+        Raises
+        ------
+        UnknownMetaboliteError
+            If a substrate or product is not in the collection.
+        """
+        cached = self._stoichiometries.get(metabolites)
+        if cached is None or cached[0] != metabolites._generation:
+            cached = (
+                metabolites._generation,
+                metabolites.indices(self.substrates),
+                np.fromiter(self.substrates.values(), dtype=float),
+                metabolites.indices(self.products),
+                np.fromiter(self.products.values(), dtype=float),
+            )
+            self._stoichiometries[metabolites] = cached
+        _, substrate_idx, substrate_coef, product_idx, product_coef = cached
+        if reverse:
+            return product_idx, product_coef, substrate_idx, substrate_coef
+        return substrate_idx, substrate_coef, product_idx, product_coef
+
+    def substrate_arrays(
+        self, metabolites: "Metabolites", reverse: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Resolve only the reaction's substrates to indices into a collection.
+
+        Unlike :meth:`stoichiometry`, the products need not be in the
+        collection yet. Cached per collection and direction.
+
+        Parameters
+        ----------
+        metabolites : Metabolites
+            The collection whose ``quantity_array`` the indices refer to.
+        reverse : bool, optional
+            Whether to swap substrates and products. Defaults to False.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            Substrate indices and substrate coefficients.
+
+        Raises
+        ------
+        UnknownMetaboliteError
+            If a substrate is not in the collection.
+        """
+        cached = self._substrate_arrays.get(metabolites)
+        if cached is None or cached[0] != metabolites._generation:
+            cached = [metabolites._generation, None, None]
+            self._substrate_arrays[metabolites] = cached
+        arrays = cached[1 + reverse]
+        if arrays is None:
+            substrates = self.products if reverse else self.substrates
+            arrays = (
+                metabolites.indices(substrates),
+                np.fromiter(substrates.values(), dtype=float),
+            )
+            cached[1 + reverse] = arrays
+        return arrays
+
+    def changes(
+        self, metabolites: "Metabolites", reverse: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Indices and signed coefficients of every metabolite the reaction uses.
+
+        Substrates come first with negative coefficients, then products, so a
+        reaction running at ``rate`` changes the quantities by ``coef * rate``.
+        Cached per collection like :meth:`stoichiometry`.
+
+        Parameters
+        ----------
+        metabolites : Metabolites
+            The collection whose ``quantity_array`` the indices refer to.
+        reverse : bool, optional
+            Whether to swap substrates and products. Defaults to False.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            The indices and the coefficients.
+
+        Raises
+        ------
+        UnknownMetaboliteError
+            If a substrate or product is not in the collection.
+        """
+        substrate_idx, substrate_coef, product_idx, product_coef = self.stoichiometry(
+            metabolites, reverse
+        )
+        cached = self._changes.get(metabolites)
+        if cached is None or cached[0] is not substrate_idx:
+            cached = (
+                substrate_idx,
+                np.concatenate((substrate_idx, product_idx)),
+                np.concatenate((-substrate_coef, product_coef)),
+            )
+            self._changes[metabolites] = cached
+        return cached[1], cached[2]
+
+    def _kinetics_arrays(
+        self, metabolites: "Metabolites"
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        The enzyme's Michaelis-Menten parameters as arrays for a collection.
+
+        Cached per collection like :meth:`stoichiometry`.
+
+        Parameters
+        ----------
+        metabolites : Metabolites
+            The collection whose ``quantity_array`` the indices refer to.
+
+        Returns
+        -------
+        tuple of np.ndarray or None
+            The indices of the metabolites in ``k_m``, their Hill-scaled
+            Michaelis constants and their Hill coefficients. None when the
+            rate also depends on inhibitors or activators, or the enzyme
+            computes its rate some other way.
+        """
+        enzyme = self.enzyme
+        if (
+            type(enzyme).calculate_rate is not Enzyme.calculate_rate
+            or enzyme._regulation
+        ):
+            return None
+        cached = self._kinetics.get(metabolites)
+        if (
+            cached is None
+            or cached[0] != metabolites._generation
+            or cached[1] is not enzyme._kinetics
+        ):
+            kinetics = enzyme._kinetics
+            cached = (
+                metabolites._generation,
+                kinetics,
+                metabolites.indices(name for name, _, _ in kinetics),
+                np.array([k_m_n for _, k_m_n, _ in kinetics], dtype=float),
+                np.array([n for _, _, n in kinetics], dtype=float),
+            )
+            self._kinetics[metabolites] = cached
+        return cached[2:]
 
     def can_react(self, organelle: "Organelle") -> bool:
         """
@@ -55,15 +332,23 @@ class Reaction:
         -------
         bool: True if all substrates are available in sufficient quantities, False otherwise.
         """
-        for substrate, required_amount in self.substrates.items():
-            available_amount = organelle.get_metabolite_quantity(substrate)
+        substrate_idx, substrate_coef = self.substrate_arrays(organelle.metabolites)
+        available = organelle.metabolites.quantity_array[substrate_idx]
+        if (available >= substrate_coef).all():
+            return True
+        for substrate, required_amount, available_amount in zip(
+            self.substrates, substrate_coef, available
+        ):
             if available_amount < required_amount:
                 logger.debug(
-                    f"Insufficient {substrate} for reaction '{self.name}': "
-                    f"Required {required_amount}, Available {available_amount}"
+                    "Insufficient %s for reaction '%s': Required %s, Available %s",
+                    substrate,
+                    self.name,
+                    required_amount,
+                    available_amount,
                 )
-                return False
-        return True
+                break
+        return False
 
     def transform(
         self,
@@ -103,19 +388,30 @@ class Reaction:
 
         substrates, products = self._get_reaction_direction(reverse)
 
-        logger.info(f"Executing {self.name} reaction {'(reversed)' if reverse else ''}")
-        logger.info(f"Substrates: {substrates}")
-        logger.info(f"Products: {products}")
-        for substrate, amount in substrates.items():
-            available = organelle.get_metabolite_quantity(substrate)
-            logger.info(f"{substrate} - Required: {amount}, Available: {available}")
+        # Gather the substrate quantities once from the quantity array
+        substrate_idx, _ = self.substrate_arrays(organelle.metabolites, reverse)
+        substrate_quantities = dict(
+            zip(
+                substrates,
+                organelle.metabolites.quantity_array[substrate_idx].tolist(),
+            )
+        )
 
-        try:
-            # Cache substrate quantities
-            substrate_quantities = {
-                met: organelle.get_metabolite_quantity(met) for met in substrates
-            }
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Executing %s reaction %s", self.name, "(reversed)" if reverse else ""
+            )
+            logger.info("Substrates: %s", substrates)
+            logger.info("Products: %s", products)
+            for substrate, amount in substrates.items():
+                logger.info(
+                    "%s - Required: %s, Available: %s",
+                    substrate,
+                    amount,
+                    substrate_quantities[substrate],
+                )
 
+        try:
             if use_rates:
                 result = self._execute_with_rates(
                     organelle, time_step, substrates, products, substrate_quantities
@@ -189,41 +485,68 @@ class Reaction:
         -------
         float: The actual rate at which the reaction proceeded.
         """
-        # Calculate reaction rate using the updated Enzyme.calculate_rate method
-        metabolites = {met: organelle.get_metabolite(met) for met in substrates}
-
-        # Check if k_m is a dictionary or a single value
-        if isinstance(self.enzyme.k_m, dict):
-            metabolites.update(
-                {met: organelle.get_metabolite(met) for met in self.enzyme.k_m.keys()}
+        metabolites = organelle.metabolites
+        reverse = substrates is not self.substrates
+        limiting = self._limiting[reverse]
+        kinetics = self._kinetics_arrays(metabolites) if self._disjoint else None
+        if kinetics is not None:
+            # Compute the rate and apply the change in one compiled call
+            idx, coef = self.changes(metabolites, reverse)
+            reaction_rate, actual_rate, applied = _apply_reaction(
+                metabolites._state,
+                idx,
+                coef,
+                len(substrates),
+                *kinetics,
+                self.enzyme.vmax,
+                time_step,
             )
-
-        reaction_rate = self.enzyme.calculate_rate(metabolites)
-
-        # Log intermediate values
-        logger.debug(
-            f"Reaction '{self.name}': Initial reaction rate: {reaction_rate:.6f}"
-        )
-
-        # Calculate potential limiting factors
-        limiting_factors = {"reaction_rate": reaction_rate * time_step}
-        for met, amount in substrates.items():
-            if amount > 0:
+        else:
+            # Calculate reaction rate using the updated Enzyme.calculate_rate method
+            get_metabolite = organelle.get_metabolite
+            rate_metabolites = {met: get_metabolite(met) for met in substrates}
+
+            # Check if k_m is a dictionary or a single value; substrates
+            # fetched above are not looked up again
+            if isinstance(self.enzyme.k_m, Mapping):
+                for met in self.enzyme.k_m:
+                    if met not in rate_metabolites:
+                        rate_metabolites[met] = get_metabolite(met)
+
+            reaction_rate = self.enzyme.calculate_rate(rate_metabolites)
+
+            # Supply-limited rate: the scarcest substrate caps the rate, so the
+            # reaction always proceeds at a rate the substrates can sustain
+            actual_rate = reaction_rate * time_step
+            for met, amount in limiting:
+                supply_rate = substrate_quantities[met] / amount
+                if supply_rate < actual_rate:
+                    actual_rate = supply_rate
+
+            applied = False
+            if self._disjoint:
+                # Apply the change on the state array when it stays in bounds;
+                # otherwise let the organelle decide, below
+                idx, coef = self.changes(metabolites, reverse)
+                applied = _apply_scaled(metabolites._state, idx, coef, actual_rate)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            # Log intermediate values
+            logger.debug(
+                "Reaction '%s': Initial reaction rate: %.6f", self.name, reaction_rate
+            )
+            limiting_factors = {"reaction_rate": reaction_rate * time_step}
+            for met, amount in limiting:
                 limiting_factors[f"{met}_conc"] = substrate_quantities[met] / amount
+            self._log_limiting_factors(limiting_factors, actual_rate)
 
-        # Determine actual rate based on available metabolites
-        actual_rate = min(limiting_factors.values())
-
-        # Log all limiting factors
-        self._log_limiting_factors(limiting_factors, actual_rate)
-
-        # Consume metabolites
-        for metabolite, amount in substrates.items():
-            organelle.change_metabolite_quantity(metabolite, -amount * actual_rate)
+        if applied:
+            self._log_metabolite_changes(substrates, products, actual_rate)
+            return actual_rate
 
-        # Produce metabolites
-        for metabolite, amount in products.items():
-            organelle.change_metabolite_quantity(metabolite, amount * actual_rate)
+        # Consume and produce in one update
+        names, deltas = self._net_changes[substrates is not self.substrates]
+        organelle.apply_deltas(names, tuple(delta * actual_rate for delta in deltas))
 
         # Add log entry
         self._log_metabolite_changes(substrates, products, actual_rate)
@@ -258,24 +581,26 @@ class Reaction:
         -------
         float: 1.0 if the reaction occurred, 0.0 otherwise.
         """
+        if substrates is self.substrates and self.compiled.apply(organelle.metabolites):
+            # The generated function applied the forward reaction in place
+            self._log_metabolite_changes(substrates, products, 1.0)
+            return 1.0
+
+        # Reversed, or the reaction cannot run: find out why
         for metabolite, amount in substrates.items():
             available = substrate_quantities[metabolite]
             if available < amount:
                 logger.error(
-                    f"Reaction '{self.name}': Insufficient {metabolite}. "
-                    f"Required: {amount}, Available: {available}"
+                    "Reaction '%s': Insufficient %s. Required: %s, Available: %s",
+                    self.name,
+                    metabolite,
+                    amount,
+                    available,
                 )
                 return 0.0
 
-        # Consume substrates
-        for metabolite, amount in substrates.items():
-            organelle.change_metabolite_quantity(metabolite, -amount)
-            logger.debug(f"Reaction '{self.name}': Consumed {amount} {metabolite}")
-
-        # Produce products
-        for metabolite, amount in products.items():
-            organelle.change_metabolite_quantity(metabolite, amount)
-            logger.debug(f"Reaction '{self.name}': Produced {amount} {metabolite}")
+        # Consume and produce in one update
+        organelle.apply_deltas(*self._net_changes[substrates is not self.substrates])
 
         # Add log entry
         self._log_metabolite_changes(substrates, products, 1.0)
@@ -284,34 +609,40 @@ class Reaction:
 
     def _log_reaction_success(self, rate: float):
         logger.info(
-            f"Reaction '{self.name}' executed successfully with rate {rate:.4f}"
+            "Reaction '%s' executed successfully with rate %.4f", self.name, rate
         )
 
     def _log_reaction_error(self, error_message: str):
-        logger.error(f"Error during '{self.name}' execution: {error_message}")
+        logger.error("Error during '%s' execution: %s", self.name, error_message)
 
     def _log_limiting_factors(
         self, limiting_factors: Dict[str, float], actual_rate: float
     ):
-        logger.debug(f"Reaction '{self.name}': Potential limiting factors:")
+        logger.debug("Reaction '%s': Potential limiting factors:", self.name)
         for factor_name, factor_value in limiting_factors.items():
-            logger.debug(f"  - {factor_name}: {factor_value:.6f}")
+            logger.debug("  - %s: %.6f", factor_name, factor_value)
 
         limiting_factor_names = [
             name for name, value in limiting_factors.items() if value == actual_rate
         ]
         logger.debug(
-            f"Reaction '{self.name}': Rate limited by {', '.join(limiting_factor_names)}. Actual rate: {actual_rate:.6f}"
+            "Reaction '%s': Rate limited by %s. Actual rate: %.6f",
+            self.name,
+            ", ".join(limiting_factor_names),
+            actual_rate,
         )
 
     def _log_metabolite_changes(
         self, substrates: Dict[str, float], products: Dict[str, float], rate: float
     ):
-        logger.info(
-            f"Executed reaction '{self.name}' with rate {rate:.4f}. "
-            f"Consumed: {self._format_metabolite_changes(substrates, rate)}. "
-            f"Produced: {self._format_metabolite_changes(products, rate)}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Executed reaction '%s' with rate %.4f. Consumed: %s. Produced: %s",
+                self.name,
+                rate,
+                self._format_metabolite_changes(substrates, rate),
+                self._format_metabolite_changes(products, rate),
+            )
 
     def _format_metabolite_changes(
         self, metabolites: Dict[str, float], rate: float
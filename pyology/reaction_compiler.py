@@ -0,0 +1,419 @@
+"""
+Compile a fixed sequence of reactions into a single generated function.
+
+A pathway such as glycolysis runs the same reactions, with the same
+stoichiometry, in the same order every time. :class:`CompiledReactions`
+turns such a sequence into Python source with every coefficient written in
+as a literal, so running the whole sequence, any number of times, is one
+call that only does arithmetic on the organelle's metabolite state array.
+The generated function is compiled with Numba when it is installed, once it
+has been called often enough to pay for the compile.
+
+Every pass applies the same net change, so when the starting quantities
+are enough for all passes the generated function applies that change once,
+scaled by the number of passes. When they are not, it works out from the
+same bounds how many passes fit, applies those at once and only steps
+through the pass that stops. A sequence can also be split into phases run
+one after the other at different multiples of the count, such as the two
+phases of glycolysis, which then share one call.
+
+Only the kinetics-free path of :meth:`Reaction.transform` is covered: each
+reaction runs once per pass when all of its substrates are available.
+"""
+
+import logging
+import weakref
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from .exceptions import InsufficientSubstrateError, QuantityError
+from .jit import njit
+from .metabolite import MAX_QUANTITY, QUANTITY
+
+if TYPE_CHECKING:
+    from .metabolite import Metabolites
+    from .organelle import Organelle
+    from .reaction import Reaction
+
+logger = logging.getLogger(__name__)
+
+# Generated kernels cannot use Numba's on-disk cache, so each one compiles
+# afresh (~0.6 s) in every process. Jitted, a call saves ~6 us over Python,
+# so compiling only pays off after about this many calls.
+KERNEL_MIN_CALLS = 100_000
+
+
+def _net_changes(reaction: "Reaction") -> Dict[str, float]:
+    """
+    Net change of each metabolite when ``reaction`` runs once.
+    """
+    changes = {}
+    for name, coef in reaction.substrates.items():
+        key = name.lower()
+        changes[key] = changes.get(key, 0) - coef
+    for name, coef in reaction.products.items():
+        key = name.lower()
+        changes[key] = changes.get(key, 0) + coef
+    return changes
+
+
+def _phase_source(
+    reactions: Tuple["Reaction", ...], passes: str, offset: str, slot: Callable
+) -> List[str]:
+    """
+    Generates the lines running ``reactions`` in order ``passes`` times.
+
+    ``passes`` and ``offset`` are expressions for the number of passes and
+    the number of reactions run before the phase; a reaction that cannot
+    run returns how many ran in total.
+    """
+    body = []
+    # Level of each metabolite relative to the start of a pass, and the
+    # lowest and highest level reached during the pass
+    level = {}
+    low = {}
+    high = {}
+    for step, reaction in enumerate(reactions):
+        done = f"{offset}unit * {len(reactions)} + {step}"
+        body.append(f"# {reaction.name}")
+        required = [
+            f"q[{slot(name)}] < {float(coef)!r}"
+            for name, coef in reaction.substrates.items()
+        ]
+        for name, coef in reaction.substrates.items():
+            var = slot(name)
+            level[var] = level.get(var, 0) - coef
+            low[var] = min(low.get(var, 0), level[var])
+        for name, coef in reaction.products.items():
+            var = slot(name)
+            level[var] = level.get(var, 0) + coef
+            high[var] = max(high.get(var, 0), level[var])
+        changes = {
+            slot(name): change for name, change in _net_changes(reaction).items()
+        }
+        bounded = [
+            f"q[{var}] + {float(change)!r} > q_max[{var}]"
+            for var, change in changes.items()
+            if change > 0
+        ]
+        if required or bounded:
+            body.append(f"if {' or '.join(required + bounded)}:")
+            body.append(f"    return {done}")
+        for var, change in changes.items():
+            if change:
+                body.append(f"q[{var}] += {float(change)!r}")
+
+    # All passes fit when each metabolite stays in bounds over the first and
+    # the last pass, as its level changes linearly from one pass to the next
+    fits = []
+    # Number of passes ``n`` that fit, from the pass at which each bound is
+    # first crossed
+    headroom = []
+    for var, change in level.items():
+        last = f"q[{var}] + (passes - 1) * {float(change)!r}"
+        if low.get(var, 0) < 0:
+            lowest = f"min(q[{var}], {last})" if change < 0 else f"q[{var}]"
+            fits.append(f"{lowest} >= {-float(low[var])!r}")
+            if change < 0:
+                headroom.append(
+                    f"n = min(n, (q[{var}] + {float(low[var])!r})"
+                    f" // {-float(change)!r} + 1)"
+                )
+            else:
+                headroom.append(f"if q[{var}] < {-float(low[var])!r}: n = 0")
+        if high.get(var, 0) > 0:
+            highest = f"max(q[{var}], {last})" if change > 0 else f"q[{var}]"
+            fits.append(f"{highest} + {float(high[var])!r} <= q_max[{var}]")
+            if change > 0:
+                headroom.append(
+                    f"n = min(n, (q_max[{var}] - q[{var}] - {float(high[var])!r})"
+                    f" // {float(change)!r} + 1)"
+                )
+            else:
+                headroom.append(
+                    f"if q[{var}] + {float(high[var])!r} > q_max[{var}]: n = 0"
+                )
+
+    lines = [f"passes = {passes}"]
+    if not fits:
+        lines.append("for unit in range(passes):")
+        lines += [f"    {line}" for line in body or ["pass"]]
+        return lines
+    lines.append(f"if passes > 0 and {' and '.join(fits)}:")
+    lines += [
+        f"    q[{var}] += passes * {float(change)!r}"
+        for var, change in level.items()
+        if change
+    ]
+    # Otherwise the passes that fit are counted the same way, so only the
+    # one that stops is stepped through
+    lines.append("else:")
+    lines.append("    n = passes")
+    lines += [f"    {line}" for line in headroom]
+    # One pass of margin against rounding in the divisions
+    lines.append("    n = int(max(n - 1, 0))")
+    lines += [
+        f"    q[{var}] += n * {float(change)!r}"
+        for var, change in level.items()
+        if change
+    ]
+    lines.append("    for unit in range(n, passes):")
+    lines += [f"        {line}" for line in body]
+    return lines
+
+
+def generate_source(
+    reactions: Iterable["Reaction"], phases: Iterable[Tuple[int, int]] = None
+) -> Tuple[str, List[str]]:
+    """
+    Generates the source of a function running ``reactions`` in order.
+
+    The function has the signature ``run(state, idx, count)``: ``state`` is
+    the state array of a :class:`Metabolites` collection, whose quantity and
+    maximum quantity rows it works on, ``idx`` maps the metabolites the
+    reactions use, in the order returned alongside the source, to columns
+    of that array, and ``count`` is the number of passes through the
+    sequence. It returns the number of reactions that ran; fewer than
+    ``count`` times the reactions per count means the next one could not.
+
+    Parameters
+    ----------
+    reactions : Iterable[Reaction]
+        The reactions, in the order they run.
+    phases : Iterable[Tuple[int, int]], optional
+        Splits ``reactions`` into phases run one after the other, as the
+        number of reactions in each phase and its passes per count. By
+        default all reactions are one phase with one pass per count.
+
+    Returns
+    -------
+    Tuple[str, List[str]]
+        The function source and the metabolite names ``idx`` refers to.
+    """
+    reactions = tuple(reactions)
+    if phases is None:
+        phases = ((len(reactions), 1),)
+    names = []
+    slots = {}
+
+    def slot(name):
+        key = name.lower()
+        if key not in slots:
+            slots[key] = len(names)
+            names.append(key)
+        return f"m{slots[key]}"
+
+    body = []
+    start = 0
+    ran = 0
+    for size, passes in phases:
+        offset = f"count * {ran} + " if ran else ""
+        body += _phase_source(
+            reactions[start : start + size],
+            "count" if passes == 1 else f"count * {passes}",
+            offset,
+            slot,
+        )
+        start += size
+        ran += size * passes
+
+    lines = [
+        "def run(state, idx, count):",
+        f"    q = state[{QUANTITY}]",
+        f"    q_max = state[{MAX_QUANTITY}]",
+    ]
+    lines += [f"    m{i} = idx[{i}]" for i in range(len(names))]
+    lines += [f"    {line}" for line in body]
+    lines.append(f"    return count * {ran}")
+    return "\n".join(lines) + "\n", names
+
+
+@njit
+def _run_lanes(kernel, states, idx, counts, done):
+    """Runs ``kernel`` on each lane of a stack of state arrays."""
+    for lane in range(states.shape[0]):
+        done[lane] = kernel(states[lane], idx, counts[lane])
+
+
+class CompiledReactions:
+    """
+    A fixed sequence of reactions run by one generated function.
+
+    Parameters
+    ----------
+    reactions : Iterable[Reaction]
+        The reactions, in the order they run.
+    phases : Iterable[Tuple[int, int]], optional
+        Splits ``reactions`` into phases run one after the other, as the
+        number of reactions in each phase and its passes per count, so a
+        pathway whose steps run at different multiples is one call. By
+        default all reactions are one phase with one pass per count.
+
+    Attributes
+    ----------
+    reactions : Tuple[Reaction, ...]
+        The reactions, in the order they run.
+    phases : Tuple[Tuple[int, int], ...]
+        The size and passes per count of each phase.
+    steps : int
+        The number of reactions run per count.
+    names : List[str]
+        The metabolites the reactions use.
+    source : str
+        The generated source.
+
+    Methods
+    -------
+    apply(metabolites, count=1) -> int:
+        Runs the sequence ``count`` times on a collection, without raising.
+    run(organelle, count=1) -> None:
+        Runs the sequence ``count`` times on an organelle.
+    run_lanes(quantities, max_quantities, counts) -> np.ndarray:
+        Runs the sequence on many independent sets of quantities at once.
+    """
+
+    def __init__(
+        self, reactions: Iterable["Reaction"], phases: Iterable[Tuple[int, int]] = None
+    ) -> None:
+        self.reactions = tuple(reactions)
+        if phases is None:
+            phases = ((len(self.reactions), 1),)
+        self.phases = tuple(phases)
+        self.steps = sum(size * passes for size, passes in self.phases)
+        self.source, self.names = generate_source(self.reactions, self.phases)
+        namespace = {}
+        exec(compile(self.source, f"<compiled {self!r}>", "exec"), namespace)
+        self._kernel: Callable = njit(min_calls=KERNEL_MIN_CALLS)(namespace["run"])
+        self._indices = weakref.WeakKeyDictionary()
+
+    def __repr__(self) -> str:
+        return f"CompiledReactions({', '.join(r.name for r in self.reactions)})"
+
+    def indices(self, metabolites: "Metabolites") -> np.ndarray:
+        """
+        Positions of :attr:`names` in a collection, cached per collection.
+
+        Raises
+        ------
+        UnknownMetaboliteError
+            If a metabolite is not in the collection.
+        """
+        cached = self._indices.get(metabolites)
+        if cached is None or cached[0] != metabolites._generation:
+            cached = (metabolites._generation, metabolites.indices(self.names))
+            self._indices[metabolites] = cached
+        return cached[1]
+
+    def apply(self, metabolites: "Metabolites", count: int = 1) -> int:
+        """
+        Runs the sequence ``count`` times on a collection, without raising.
+
+        Parameters
+        ----------
+        metabolites : Metabolites
+            The collection holding the metabolites.
+        count : int, optional
+            The number of passes through the sequence. Defaults to 1.
+
+        Returns
+        -------
+        int
+            The number of reactions that ran; fewer than ``count * steps``
+            means the next one could not, and it changed nothing.
+
+        Raises
+        ------
+        UnknownMetaboliteError
+            If a metabolite is not in the collection.
+        """
+        idx = self.indices(metabolites)
+        # The kernel reads the rows it needs from the state array itself,
+        # which is cheaper than passing it two views
+        return self._kernel(metabolites._state, idx, int(count))
+
+    def run(self, organelle: "Organelle", count: int = 1) -> None:
+        """
+        Runs the sequence ``count`` times on an organelle.
+
+        Every reaction that can run is applied, in order, before the first
+        one that cannot; that reaction changes nothing.
+
+        Parameters
+        ----------
+        organelle : Organelle
+            The organelle holding the metabolites.
+        count : int, optional
+            The number of passes through the sequence. Defaults to 1.
+
+        Raises
+        ------
+        InsufficientSubstrateError
+            If a reaction is short of a substrate.
+        QuantityError
+            If a reaction would take a product above its maximum.
+        """
+        done = self.apply(organelle.metabolites, count)
+        if done < count * self.steps:
+            # Find the phase, pass and reaction the run stopped at
+            start = 0
+            for size, passes in self.phases:
+                if done < count * size * passes:
+                    unit, step = divmod(done, size)
+                    self._raise_failure(organelle, self.reactions[start + step], unit)
+                done -= count * size * passes
+                start += size
+        logger.debug("Ran %s %d times", self, count)
+
+    def run_lanes(self, quantities: np.ndarray, max_quantities, counts) -> np.ndarray:
+        """
+        Runs the sequence on many independent sets of quantities at once.
+
+        Each column of ``quantities`` is one lane, such as one organelle,
+        with a row per metabolite in :attr:`names`. Every lane runs its own
+        number of passes and, like :meth:`run`, stops before the first
+        reaction that cannot run, but a lane that stops early does not
+        raise; it shows in the returned counts instead. All lanes are one
+        compiled call.
+
+        Parameters
+        ----------
+        quantities : np.ndarray
+            The quantities, of shape ``(len(names), lanes)``, updated in
+            place.
+        max_quantities : float or array_like
+            The maximum quantities, broadcast to the shape of
+            ``quantities``.
+        counts : int or array_like
+            The number of passes of each lane, broadcast to ``lanes``.
+
+        Returns
+        -------
+        np.ndarray
+            The number of reactions each lane ran; fewer than
+            ``counts * steps`` means the next one could not.
+        """
+        lanes = quantities.shape[1]
+        states = np.zeros((lanes, 3, len(self.names)))
+        states[:, QUANTITY] = quantities.T
+        states[:, MAX_QUANTITY] = np.broadcast_to(max_quantities, quantities.shape).T
+        counts = np.array(np.broadcast_to(counts, lanes), dtype=np.int64)
+        done = np.zeros(lanes, dtype=np.int64)
+        _run_lanes(self._kernel, states, np.arange(len(self.names)), counts, done)
+        quantities[...] = states[:, QUANTITY].T
+        return done
+
+    @staticmethod
+    def _raise_failure(organelle: "Organelle", reaction: "Reaction", unit: int):
+        insufficient_substrates = [
+            f"{name}: required {coef}, available {organelle.get_metabolite_quantity(name):.4f}"
+            for name, coef in reaction.substrates.items()
+            if organelle.get_metabolite_quantity(name) < coef
+        ]
+        if insufficient_substrates:
+            raise InsufficientSubstrateError(
+                f"Reaction '{reaction.name}' failed to execute due to insufficient substrates: {', '.join(insufficient_substrates)} (pass {unit + 1})"
+            )
+        raise QuantityError(
+            f"Reaction '{reaction.name}' would exceed the max quantity of a product (pass {unit + 1})"
+        )
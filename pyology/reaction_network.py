@@ -0,0 +1,367 @@
+"""
+Step a set of enzyme-catalyzed reactions together with one matrix update.
+
+:meth:`Reaction.transform` with ``use_rates=True`` runs one reaction per
+call. :class:`ReactionNetwork` stacks the stoichiometry of many reactions
+into an ``R x M`` matrix over a metabolite collection, computes the
+Michaelis-Menten rate of every reaction from the same starting quantities,
+caps each by the supply of its own substrates and applies all of them as
+one ``S.T @ rates`` update.
+
+The reactions therefore run simultaneously rather than one after the
+other: each sees the quantities from before the step. When their combined
+change would take a metabolite out of bounds, nothing is changed and
+:class:`QuantityError` is raised, as with :meth:`Organelle.apply_deltas`.
+:meth:`ReactionNetwork.run` takes many steps in one compiled call.
+"""
+
+import logging
+import weakref
+from typing import TYPE_CHECKING, Sequence, Tuple
+
+import numpy as np
+
+from .enzymes import Enzyme
+from .exceptions import QuantityError
+from .jit import njit
+
+if TYPE_CHECKING:
+    from .metabolite import Metabolites
+    from .organelle import Organelle
+    from .reaction import Reaction
+
+logger = logging.getLogger(__name__)
+
+
+def _padded(rows, fill=0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stack rows of different lengths into a matrix padded with ``fill``.
+
+    Returns the matrix and a mask of the entries that came from ``rows``.
+    """
+    width = max((len(row) for row in rows), default=0)
+    matrix = np.full((len(rows), width), fill, dtype=np.result_type(fill, float))
+    mask = np.zeros((len(rows), width), dtype=bool)
+    for i, row in enumerate(rows):
+        matrix[i, : len(row)] = row
+        mask[i, : len(row)] = True
+    return matrix, mask
+
+
+@njit(cache=True)
+def _run_steps(
+    q,
+    q_max,
+    matrix,
+    substrate_idx,
+    substrate_coef,
+    substrate_mask,
+    kinetics_idx,
+    k_m_n,
+    hill,
+    kinetics_mask,
+    vmax,
+    time_step,
+    n_steps,
+):
+    """
+    Take up to ``n_steps`` network steps on the quantities ``q`` in place.
+
+    Each step is :meth:`ReactionNetwork.step` written out as loops. The
+    arrays are those of :meth:`ReactionNetwork._layout`. Stops before the
+    first step that would take a quantity out of bounds. Returns the number
+    of steps taken and the summed rates of each reaction.
+    """
+    n_reactions, n_metabolites = matrix.shape
+    rates = np.empty(n_reactions)
+    totals = np.zeros(n_reactions)
+    new_q = np.empty(n_metabolites)
+    for step in range(n_steps):
+        for r in range(n_reactions):
+            factor = 1.0
+            for j in range(kinetics_idx.shape[1]):
+                if kinetics_mask[r, j]:
+                    conc_n = q[kinetics_idx[r, j]] ** hill[r, j]
+                    factor *= conc_n / (k_m_n[r, j] + conc_n)
+            rate = vmax[r] * factor * time_step
+            for j in range(substrate_idx.shape[1]):
+                if substrate_mask[r, j]:
+                    rate = min(rate, q[substrate_idx[r, j]] / substrate_coef[r, j])
+            rates[r] = rate
+        for m in range(n_metabolites):
+            value = q[m]
+            for r in range(n_reactions):
+                value += rates[r] * matrix[r, m]
+            if value < 0 or value > q_max[m]:
+                return step, totals
+            new_q[m] = value
+        q[:] = new_q
+        totals += rates
+    return n_steps, totals
+
+
+class ReactionNetwork:
+    """
+    Reactions stepped together at their enzyme rates.
+
+    Parameters
+    ----------
+    reactions : Sequence[Reaction]
+        The reactions, each with an enzyme.
+
+    Methods
+    -------
+    matrix:
+        The stoichiometry matrix over a metabolite collection.
+    rates:
+        The enzyme rate of every reaction.
+    step:
+        Runs every reaction for one time step.
+    run:
+        Runs every reaction for many time steps.
+    """
+
+    def __init__(self, reactions: Sequence["Reaction"]):
+        self.reactions = tuple(reactions)
+        self.names = [reaction.name for reaction in self.reactions]
+        self._layouts = weakref.WeakKeyDictionary()
+        self._parameters = None
+        self._vectorized = None
+
+    def _check_parameters(self) -> None:
+        """
+        Work out which reactions are vectorized, again whenever an enzyme's
+        kinetic parameters have been repacked since the last call.
+        """
+        parameters = tuple(
+            (reaction.enzyme._kinetics, reaction.enzyme._regulation)
+            for reaction in self.reactions
+        )
+        if self._parameters is not None and all(
+            old[0] is new[0] and old[1] is new[1]
+            for old, new in zip(self._parameters, parameters)
+        ):
+            return
+        # Reactions whose enzymes use plain Michaelis-Menten (Hill) kinetics
+        # have their rates computed together; the rest call calculate_rate
+        self._vectorized = np.array(
+            [
+                type(reaction.enzyme).calculate_rate is Enzyme.calculate_rate
+                and not reaction.enzyme._regulation
+                for reaction in self.reactions
+            ],
+            dtype=bool,
+        )
+        self._parameters = parameters
+        self._layouts.clear()
+
+    def _layout(self, metabolites: "Metabolites") -> tuple:
+        """
+        Index arrays of the network over a collection, built once per layout.
+
+        Raises
+        ------
+        UnknownMetaboliteError
+            If a reaction or enzyme uses a metabolite not in the collection.
+        """
+        self._check_parameters()
+        cached = self._layouts.get(metabolites)
+        if cached is not None and cached[0] == (
+            metabolites._generation,
+            metabolites._size,
+        ):
+            return cached
+        matrix = np.zeros((len(self.reactions), metabolites._size))
+        substrate_idx, substrate_coef = [], []
+        kinetics_idx, k_m_n, hill = [], [], []
+        for row, reaction in enumerate(self.reactions):
+            s_idx, s_coef, p_idx, p_coef = reaction.stoichiometry(metabolites)
+            np.subtract.at(matrix[row], s_idx, s_coef)
+            np.add.at(matrix[row], p_idx, p_coef)
+            positive = s_coef > 0
+            substrate_idx.append(s_idx[positive])
+            substrate_coef.append(s_coef[positive])
+            kinetics = reaction.enzyme._kinetics if self._vectorized[row] else ()
+            kinetics_idx.append(metabolites.indices(name for name, _, _ in kinetics))
+            k_m_n.append([value for _, value, _ in kinetics])
+            hill.append([n for _, _, n in kinetics])
+        substrate_idx, substrate_mask = _padded(substrate_idx, fill=0)
+        substrate_coef, _ = _padded(substrate_coef, fill=1.0)
+        kinetics_idx, kinetics_mask = _padded(kinetics_idx, fill=0)
+        k_m_n, _ = _padded(k_m_n, fill=1.0)
+        hill, _ = _padded(hill, fill=1.0)
+        cached = (
+            (metabolites._generation, metabolites._size),
+            matrix,
+            substrate_idx.astype(np.intp),
+            substrate_coef,
+            substrate_mask,
+            kinetics_idx.astype(np.intp),
+            k_m_n,
+            hill,
+            kinetics_mask,
+        )
+        self._layouts[metabolites] = cached
+        return cached
+
+    def matrix(self, metabolites: "Metabolites") -> np.ndarray:
+        """
+        The stoichiometry matrix over a metabolite collection.
+
+        Parameters
+        ----------
+        metabolites : Metabolites
+            The collection whose ``quantity_array`` the columns follow.
+
+        Returns
+        -------
+        np.ndarray
+            One row per reaction holding the net change of each metabolite
+            when the reaction runs once.
+        """
+        return self._layout(metabolites)[1]
+
+    def rates(self, organelle: "Organelle") -> np.ndarray:
+        """
+        The enzyme rate of every reaction at the current quantities.
+
+        Parameters
+        ----------
+        organelle : Organelle
+            The organelle holding the metabolites.
+
+        Returns
+        -------
+        np.ndarray
+            The rates, in the order of :attr:`reactions`.
+        """
+        metabolites = organelle.metabolites
+        _, _, _, _, _, kinetics_idx, k_m_n, hill, kinetics_mask = self._layout(
+            metabolites
+        )
+        conc_n = metabolites.quantity_array[kinetics_idx] ** hill
+        factors = np.where(kinetics_mask, conc_n / (k_m_n + conc_n), 1.0)
+        vmax = np.fromiter(
+            (reaction.enzyme.vmax for reaction in self.reactions),
+            dtype=float,
+            count=len(self.reactions),
+        )
+        rates = vmax * factors.prod(axis=1)
+        for row in np.flatnonzero(~self._vectorized):
+            reaction = self.reactions[row]
+            enzyme_metabolites = {
+                name: organelle.get_metabolite(name)
+                for name in (*reaction.substrates, *reaction.enzyme.k_m)
+            }
+            rates[row] = reaction.enzyme.calculate_rate(enzyme_metabolites)
+        return rates
+
+    def step(self, organelle: "Organelle", time_step: float = 1.0) -> np.ndarray:
+        """
+        Runs every reaction for one time step.
+
+        Each reaction proceeds at its enzyme rate times ``time_step``, capped
+        by what its substrates can sustain, and all changes are applied at
+        once.
+
+        Parameters
+        ----------
+        organelle : Organelle
+            The organelle holding the metabolites.
+        time_step : float, optional
+            The duration of the step. Defaults to 1.0.
+
+        Returns
+        -------
+        np.ndarray
+            The rate each reaction proceeded at.
+
+        Raises
+        ------
+        QuantityError
+            If the combined changes would take a metabolite below zero or
+            above its maximum. No quantity is changed in that case.
+        """
+        if time_step < 0:
+            raise ValueError("Time step cannot be negative")
+        metabolites = organelle.metabolites
+        _, matrix, substrate_idx, substrate_coef, substrate_mask, *_ = self._layout(
+            metabolites
+        )
+        quantities = metabolites.quantity_array
+        supply = np.where(
+            substrate_mask, quantities[substrate_idx] / substrate_coef, np.inf
+        ).min(axis=1, initial=np.inf)
+        actual_rates = np.minimum(self.rates(organelle) * time_step, supply)
+
+        new_quantities = quantities + actual_rates @ matrix
+        out_of_bounds = (new_quantities < 0) | (
+            new_quantities > metabolites.max_quantity_array
+        )
+        if out_of_bounds.any():
+            names = [
+                name for name, slot in metabolites._index.items() if out_of_bounds[slot]
+            ]
+            raise QuantityError(
+                f"Reaction network step would take {', '.join(names)} out of bounds"
+            )
+        quantities[:] = new_quantities
+        logger.debug("Reaction network rates: %s", actual_rates)
+        return actual_rates
+
+    def run(
+        self, organelle: "Organelle", n_steps: int, time_step: float = 1.0
+    ) -> np.ndarray:
+        """
+        Runs every reaction for ``n_steps`` time steps.
+
+        The same as calling :meth:`step` ``n_steps`` times, but when every
+        enzyme uses plain Michaelis-Menten (Hill) kinetics the steps run in
+        one compiled loop rather than one call each.
+
+        Parameters
+        ----------
+        organelle : Organelle
+            The organelle holding the metabolites.
+        n_steps : int
+            The number of time steps.
+        time_step : float, optional
+            The duration of each step. Defaults to 1.0.
+
+        Returns
+        -------
+        np.ndarray
+            The total each reaction proceeded over the steps taken.
+
+        Raises
+        ------
+        QuantityError
+            If a step would take a metabolite below zero or above its
+            maximum. The steps before it stay applied; that step changes
+            nothing.
+        """
+        if time_step < 0:
+            raise ValueError("Time step cannot be negative")
+        metabolites = organelle.metabolites
+        _, matrix, *arrays = self._layout(metabolites)
+        if not self._vectorized.all():
+            totals = np.zeros(len(self.reactions))
+            for _ in range(n_steps):
+                totals += self.step(organelle, time_step)
+            return totals
+        vmax = np.array([reaction.enzyme.vmax for reaction in self.reactions])
+        done, totals = _run_steps(
+            metabolites.quantity_array,
+            metabolites.max_quantity_array,
+            matrix,
+            *arrays,
+            vmax,
+            float(time_step),
+            n_steps,
+        )
+        if done < n_steps:
+            raise QuantityError(
+                f"Reaction network step {done + 1} would take a metabolite "
+                "out of bounds"
+            )
+        return totals
@@ -1,121 +1,297 @@
 import logging
+import pickle
 import sys
+from typing import BinaryIO
+
+import numpy as np
+
+#: Entries the ATP production log holds before it grows
+ATP_LOG_SIZE = 4096
+
+
+class MetricHandler(logging.Handler):
+    """
+    A logging handler that writes metric records to a binary stream.
+
+    Each record logged with :meth:`Reporter.log_metric` is pickled as a
+    ``(created, name, fields)`` tuple, without formatting its message. Other
+    records are ignored. Read them back with repeated ``pickle.load`` calls.
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        The stream to write to, opened in binary mode.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        super().__init__()
+        self.stream = stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        fields = getattr(record, "metric_fields", None)
+        if fields is None:
+            return
+        try:
+            pickle.dump(
+                (record.created, record.metric_name, fields),
+                self.stream,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        except Exception:
+            self.handleError(record)
 
 
 class Reporter:
     """
     A class to report events and log messages during the simulation.
 
+    Messages may be %-style format strings followed by their arguments, as with
+    the ``logging`` module; formatting is deferred until a handler emits them.
+
+    Per-step records from :meth:`log_metric` and :meth:`log_atp_production` go
+    to :attr:`step_logger`, a child of :attr:`logger`. Setting
+    ``step_logger.disabled = True`` or raising its level silences them without
+    losing the warnings and the summary.
+
+    Parameters
+    ----------
+    console : bool, optional
+        Whether to write messages to stdout directly. Without it they are only
+        passed on to the root logger's handlers. Defaults to True.
+    step_log : str, optional
+        A file to write the per-step records to, one message per line. They
+        then go to a step logger of this reporter's own and no longer reach
+        :attr:`logger`'s handlers. Call :meth:`close`, or use the reporter as
+        a context manager, to close the file. Defaults to None.
+
     Methods
     -------
-    log_event(message: str) -> None:
+    isEnabledFor(level: int) -> bool:
+        Check whether messages of a level would be emitted.
+    isStepEnabledFor(level: int) -> bool:
+        Check whether per-step records of a level would be emitted.
+    log_event(message: str, *args) -> None:
         Log an event message.
-    log_warning(message: str) -> None:
+    log_warning(message: str, *args) -> None:
         Log a warning message.
-    log_error(message: str) -> None:
+    log_error(message: str, *args) -> None:
         Log an error message.
-    log_atp_production(step: str, atp_produced: float) -> None:
+    log_metric(name: str, **fields) -> None:
+        Log named numeric fields as a structured record.
+    log_atp_production(step: str, atp_produced: float, log: bool = True) -> None:
         Log the ATP production for a specific step.
+    clear_atp_log() -> None:
+        Remove every entry from the ATP production log.
     report_simulation_results(results: dict) -> None:
         Report the simulation results.
+    close() -> None:
+        Close the step log file, if there is one.
     """
 
-    def __init__(self):
+    def __init__(self, console: bool = True, step_log: str = None):
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.DEBUG)  # Change this line
 
-        # Create console handler and set level to DEBUG
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.DEBUG)  # Change this line
+        if console:
+            # Create console handler and set level to DEBUG
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(logging.DEBUG)  # Change this line
+
+            # Create formatter
+            formatter = logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+            )
+
+            # Add formatter to console handler
+            console_handler.setFormatter(formatter)
+
+            # Add console handler to logger
+            self.logger.addHandler(console_handler)
+
+        self._step_handler = None
+        if step_log is None:
+            self.step_logger = logging.getLogger(__name__ + ".steps")
+        else:
+            # Not registered with logging, so it has no parent to propagate
+            # to, and other reporters keep using the shared step logger
+            self.step_logger = logging.Logger(__name__ + ".steps")
+            self._step_handler = logging.FileHandler(step_log)
+            self._step_handler.setFormatter(logging.Formatter("%(message)s"))
+            self.step_logger.addHandler(self._step_handler)
+
+        # (step, ATP produced) entries, in arrays that double when full
+        self._atp_steps = np.empty(ATP_LOG_SIZE, dtype=object)
+        self._atp_values = np.empty(ATP_LOG_SIZE)
+        self._atp_count = 0
+        # Message format of each metric, by name and field names
+        self._metric_formats = {}
+
+    @property
+    def atp_production_log(self) -> tuple:
+        """
+        The (step, ATP produced) entries logged since the last report.
 
-        # Create formatter
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        The entries live in arrays, so this is a tuple built from them; to
+        change the log, assign a new sequence of entries or call
+        :meth:`clear_atp_log`.
+        """
+        count = self._atp_count
+        return tuple(
+            zip(self._atp_steps[:count].tolist(), self._atp_values[:count].tolist())
         )
 
-        # Add formatter to console handler
-        console_handler.setFormatter(formatter)
+    @atp_production_log.setter
+    def atp_production_log(self, entries) -> None:
+        self.clear_atp_log()
+        for step, atp_produced in entries:
+            self.log_atp_production(step, atp_produced, log=False)
+
+    def clear_atp_log(self) -> None:
+        """
+        Remove every entry from the ATP production log.
+        """
+        self._atp_count = 0
+
+    def isEnabledFor(self, level: int) -> bool:
+        """
+        Check whether messages of ``level`` would be emitted.
 
-        # Add console handler to logger
-        self.logger.addHandler(console_handler)
+        Lets callers handed either a Reporter or a ``logging.Logger`` skip
+        building expensive messages the same way.
+        """
+        return self.logger.isEnabledFor(level)
 
-        self.atp_production_log = []
+    def isStepEnabledFor(self, level: int) -> bool:
+        """
+        Check whether per-step records of ``level`` would be emitted.
+        """
+        return self.step_logger.isEnabledFor(level)
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args) -> None:
         """
         Log an info message.
         """
-        self.logger.info(message)
+        self.logger.info(message, *args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """
         Log a warning message.
         """
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
         """
         Log a debug message.
         """
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
 
-    def log_event(self, message: str) -> None:
+    def log_event(self, message: str, *args) -> None:
         """
         Log an event message.
         """
-        self.logger.info(message)
+        self.logger.info(message, *args)
 
-    def log_warning(self, message: str) -> None:
+    def log_warning(self, message: str, *args) -> None:
         """
         Log a warning message.
         """
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def log_error(self, message: str) -> None:
+    def log_error(self, message: str, *args) -> None:
         """
         Log an error message.
         """
-        self.logger.error(message)
+        self.logger.error(message, *args)
+
+    def log_metric(self, name: str, **fields) -> None:
+        """
+        Log named numeric fields as a structured record.
 
-    def log_atp_production(self, step: str, atp_produced: float) -> None:
+        The fields travel with the record as ``metric_name`` and
+        ``metric_fields``, so a :class:`MetricHandler` can store them without
+        formatting text. Text handlers show ``name: field=value, ...``.
+        """
+        if not self.isStepEnabledFor(logging.INFO):
+            return
+        key = (name, *fields)
+        message = self._metric_formats.get(key)
+        if message is None:
+            message = f"{name}: " + ", ".join(f"{field}=%s" for field in fields)
+            self._metric_formats[key] = message
+        self.step_logger.info(
+            message,
+            *fields.values(),
+            extra={"metric_name": name, "metric_fields": fields},
+        )
+
+    def log_atp_production(
+        self, step: str, atp_produced: float, log: bool = True
+    ) -> None:
         """
         Log the ATP production for a specific step.
+
+        The production is always recorded for the results breakdown; with
+        ``log`` False it is not logged as well. Callers that have already
+        checked :meth:`isStepEnabledFor` pass the result to skip the check.
         """
-        self.atp_production_log.append((step, atp_produced))
-        self.log_event(f"ATP produced in {step}: {atp_produced}")
+        count = self._atp_count
+        if count == len(self._atp_values):
+            self._atp_steps = np.resize(self._atp_steps, 2 * count)
+            self._atp_values = np.resize(self._atp_values, 2 * count)
+        self._atp_steps[count] = step
+        self._atp_values[count] = atp_produced
+        self._atp_count = count + 1
+        if log:
+            self.log_metric("atp_produced", step=step, atp=atp_produced)
 
     def report_simulation_results(self, results: dict) -> None:
         """
         Report the simulation results.
         """
         self.log_event(
-            f"Simulation completed in {results['simulation_time']:.2f} seconds"
+            "Simulation completed in %.2f seconds", results["simulation_time"]
         )
-        self.log_event(f"Total ATP produced: {results['total_atp_produced']:.2f}")
-        self.log_event(f"Glucose processed: {results['glucose_processed']:.2f}")
-        self.log_event(f"Glucose consumed: {results['glucose_consumed']:.2f}")
-        self.log_event(f"Pyruvate produced: {results['pyruvate_produced']:.2f}")
-        self.log_event(f"Oxygen remaining: {results['oxygen_remaining']:.2f}")
-        self.log_event(f"Final cytoplasm ATP: {results['final_cytoplasm_atp']:.2f}")
+        self.log_event("Total ATP produced: %.2f", results["total_atp_produced"])
+        self.log_event("Glucose processed: %.2f", results["glucose_processed"])
+        self.log_event("Glucose consumed: %.2f", results["glucose_consumed"])
+        self.log_event("Pyruvate produced: %.2f", results["pyruvate_produced"])
+        self.log_event("Oxygen remaining: %.2f", results["oxygen_remaining"])
+        self.log_event("Final cytoplasm ATP: %.2f", results["final_cytoplasm_atp"])
         self.log_event(
-            f"Final mitochondrion ATP: {results['final_mitochondrion_atp']:.2f}"
+            "Final mitochondrion ATP: %.2f", results["final_mitochondrion_atp"]
         )
         self.log_event(
-            f"2-Phosphoglycerate remaining: {results['final_phosphoglycerate_2']:.2f}"
+            "2-Phosphoglycerate remaining: %.2f", results["final_phosphoglycerate_2"]
         )
         self.log_event(
-            f"Phosphoenolpyruvate produced: {results['final_phosphoenolpyruvate']:.2f}"
+            "Phosphoenolpyruvate produced: %.2f", results["final_phosphoenolpyruvate"]
         )
 
         self.log_event("\nATP Production Breakdown:")
         for step, atp in self.atp_production_log:
-            self.log_event(f"  {step}: {atp:.2f}")
+            self.log_event("  %s: %.2f", step, atp)
+
+        self.clear_atp_log()  # Clear the log for the next simulation
+
+    def close(self) -> None:
+        """
+        Close the step log file, if there is one.
+        """
+        handler = self._step_handler
+        if handler is not None:
+            self.step_logger.removeHandler(handler)
+            handler.close()
+            self._step_handler = None
+
+    def __enter__(self) -> "Reporter":
+        return self
 
-        self.atp_production_log.clear()  # Clear the log for the next simulation
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     # Add this new method
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         """
         Log an error message (alias for log_error).
         """
-        self.log_error(message)
+        self.log_error(message, *args)
@@ -13,7 +13,7 @@ Modeling Considerations
         Model fidelity mechanisms to prevent translation errors.
 """
 
-from organelle import Organelle
+from .organelle import Organelle
 
 
 class Ribosome(Organelle):
@@ -1,3 +1,9 @@
+import logging
+import math
+from typing import Tuple
+
+import numpy as np
+
 from pyology.cell import Cell
 from pyology.glycolysis import Glycolysis
 from pyology.observers import (
@@ -5,19 +11,65 @@ from pyology.observers import (
     NegativeMetaboliteObserver,
 )
 
-from .constants import SIMULATION_DURATION
+from .constants import ADP_ACTIVATION_SCALE, SIMULATION_DURATION
 from .energy_calculations import (
+    ADENINE_NUCLEOTIDES,
+    adenine_slots,
     calculate_cell_energy_state,
-    calculate_total_adenine_nucleotides,
-)
-from .exceptions import (
-    GlycolysisError,
-    InsufficientMetaboliteError,
-    QuantityError,
-    UnknownMetaboliteError,
 )
+from .exceptions import GlycolysisError, UnknownMetaboliteError
+from .jit import njit
 from .reporter import Reporter
 
+# Entries kept by the adenine nucleotide log before the oldest are overwritten
+ADENINE_LOG_SIZE = 8192
+# Stages of the adenine nucleotide log, stored by index
+ADENINE_LOG_STAGES = ("Initial", "Imbalance")
+INITIAL, IMBALANCE = range(len(ADENINE_LOG_STAGES))
+# Totals closer than this, absolute or relative to their size, are balanced
+BALANCE_ABS_TOL = 1e-6
+BALANCE_REL_TOL = 1e-9
+# Metabolites each simulation step reads, by where it reads them from
+STEP_METABOLITES = {
+    "cell": ("glucose", "pyruvate", "ADP", "NADH"),
+    "cytoplasm": ("ATP", "ADP", "AMP", "NADH"),
+    "mitochondrion": ("ATP", "ADP", "AMP", "NADH"),
+}
+
+
+def _balanced(current: float, initial: float) -> bool:
+    """
+    Whether a conserved total has stayed at its initial value.
+
+    Allows ``BALANCE_ABS_TOL`` of drift, or ``BALANCE_REL_TOL`` of the total
+    when that is larger, so rounding in large totals is not an imbalance.
+    """
+    return math.isclose(
+        current, initial, rel_tol=BALANCE_REL_TOL, abs_tol=BALANCE_ABS_TOL
+    )
+
+
+@njit(cache=True)
+def _distribute_adenine_adjustment(quantities, slots, adjustment):
+    """
+    Take ``adjustment`` off ATP, then ADP, and put the remainder on AMP.
+
+    ``slots`` holds the ATP, ADP and AMP indices of ``quantities``. ATP and
+    ADP give up at most what they hold. Returns the amount taken off ATP and
+    ADP and the amount added to AMP.
+    """
+    atp, adp, amp = slots[0], slots[1], slots[2]
+    atp_adjustment = min(adjustment, quantities[atp])
+    quantities[atp] -= atp_adjustment
+
+    remaining_adjustment = adjustment - atp_adjustment
+    adp_adjustment = min(remaining_adjustment, quantities[adp])
+    quantities[adp] -= adp_adjustment
+
+    amp_adjustment = remaining_adjustment - adp_adjustment
+    quantities[amp] += amp_adjustment
+    return atp_adjustment, adp_adjustment, amp_adjustment
+
 
 class SimulationController:
     """
@@ -34,12 +86,18 @@ class SimulationController:
     -------
     run_simulation(glucose: float) -> dict:
         Run the simulation with the specified glucose amount.
+
+    Raises
+    ------
+    UnknownMetaboliteError
+        If a metabolite a simulation step reads is missing from the cell.
     """
 
     def __init__(self, cell: Cell, reporter: Reporter, debug=True):
         self.cell = cell
         self.reporter = reporter
         self.debug = debug
+        self.glycolysis = Glycolysis(debug=debug)
         self.simulation_duration = SIMULATION_DURATION
         self.simulation_time = 0
         self.time_step = 0.001  # Decreased time step
@@ -51,6 +109,11 @@ class SimulationController:
         self.max_mitochondrial_nadh = 50
         self.max_cytoplasmic_nadh = 100
         self.max_simulation_time = 20  # Increased max simulation time
+        # Log the per-step events every this many steps; -1 turns them off
+        self.log_interval = 1
+        # Before anything looks them up: a missing one would be created
+        self._validate_metabolites()
+        self._bind_metabolites()
         self.initial_adenine_nucleotides = self._calculate_total_adenine_nucleotides()
         self.initial_atp = self.cell.cytoplasm.metabolites["ATP"].quantity
         self.initial_adp = self.cell.cytoplasm.metabolites["ADP"].quantity
@@ -59,13 +122,53 @@ class SimulationController:
             self.initial_atp + self.initial_adp + self.initial_amp
         )
         self.initial_glucose = self.cell.cytoplasm.metabolites["glucose"].quantity
-        self.adenine_nucleotide_log = []
+        # Ring buffer of (stage, total) entries
+        self.adenine_nucleotide_log = np.zeros(
+            ADENINE_LOG_SIZE, dtype=[("stage", "i1"), ("value", "f8")]
+        )
+        self._adenine_log_count = 0
+        # ADP level the glycolysis rate was last activated for
+        self._feedback_adp = None
+        # Rate gained per unit of ADP, so activation is one multiply-add
+        self._adp_activation_slope = self.base_glycolysis_rate / ADP_ACTIVATION_SCALE
         self.initial_energy_state = self._calculate_total_energy_state()
         self.observers = [
             NegativeMetaboliteObserver(),
             AdenineNucleotideBalanceObserver(),
         ]
 
+    def _bind_metabolites(self) -> None:
+        """
+        Look up the metabolites the per-step helpers read.
+
+        The helpers run every step, so they use these references rather
+        than looking the names up each time. Called again at the start of
+        each run in case metabolites were added or removed in between.
+        """
+        cell = self.cell.metabolites
+        cytoplasm = self.cell.cytoplasm.metabolites
+        mitochondrion = self.cell.mitochondrion.metabolites
+        self._cytoplasm = cytoplasm
+        self._cell_adp = cell["ADP"]
+        self._cell_nadh = cell["NADH"]
+        self._cyto_atp = cytoplasm["ATP"]
+        self._cyto_adp = cytoplasm["ADP"]
+        self._mito_atp = mitochondrion["ATP"]
+        self._mito_adp = mitochondrion["ADP"]
+        # ATP, ADP and AMP of both compartments, summed every step
+        self._adenine_nucleotides = tuple(
+            compartment[name]
+            for compartment in (cytoplasm, mitochondrion)
+            for name in ADENINE_NUCLEOTIDES
+        )
+        # Each compartment's ATP and NADH with the maximum it is held to
+        self._limits = (
+            (self._mito_atp, self.max_mitochondrial_atp),
+            (mitochondrion["NADH"], self.max_mitochondrial_nadh),
+            (self._cyto_atp, self.max_cytoplasmic_atp),
+            (cytoplasm["NADH"], self.max_cytoplasmic_nadh),
+        )
+
     def _calculate_total_energy_state(self) -> float:
         return calculate_cell_energy_state(self.cell)
 
@@ -73,11 +176,65 @@ class SimulationController:
         """
         Calculate the total adenine nucleotides in the system.
         """
-        return calculate_total_adenine_nucleotides(
-            self.cell.cytoplasm.metabolites
-        ) + calculate_total_adenine_nucleotides(self.cell.mitochondrion.metabolites)
+        total = 0.0
+        for metabolite in self._adenine_nucleotides:
+            total += metabolite.quantity
+        return total
+
+    def _clock_ticks(self) -> Tuple[int, int]:
+        """
+        The tick the clock is at and the tick a run stops at.
+
+        The current tick comes from ``simulation_time``, so a second run
+        continues the clock of the first.
+        """
+        return (
+            round(self.simulation_time / self.time_step),
+            round(self.max_simulation_time / self.time_step),
+        )
+
+    def _advance_clock(self, tick: int) -> int:
+        """
+        Move the clock one time step past ``tick`` and return the new tick.
 
-    def _adjust_adenine_balance_after_glycolysis(self, adenine_before, adenine_after):
+        The time is recomputed from the tick rather than accumulated, so it
+        does not drift.
+        """
+        tick += 1
+        self.simulation_time = tick * self.time_step
+        return tick
+
+    def _validate_metabolites(self) -> None:
+        """
+        Check that every metabolite a simulation step reads exists.
+
+        Uses ``in`` rather than indexing, which would create a missing
+        metabolite with default values instead of reporting it.
+
+        Raises
+        ------
+        UnknownMetaboliteError
+            If any of them is missing, naming each one.
+        """
+        containers = {
+            "cell": self.cell.metabolites,
+            "cytoplasm": self.cell.cytoplasm.metabolites,
+            "mitochondrion": self.cell.mitochondrion.metabolites,
+        }
+        missing = [
+            f"{container} {name}"
+            for container, names in STEP_METABOLITES.items()
+            for name in names
+            if name not in containers[container]
+        ]
+        if missing:
+            raise UnknownMetaboliteError(
+                f"Missing metabolites for the simulation: {', '.join(missing)}"
+            )
+
+    def _adjust_adenine_balance_after_glycolysis(
+        self, adenine_before: float, adenine_after: float
+    ) -> None:
         """
         Adjust the adenine nucleotide balance after glycolysis if there's a discrepancy.
 
@@ -88,11 +245,13 @@ class SimulationController:
         adenine_after : float
             Total adenine nucleotides after glycolysis
         """
-        if abs(adenine_after - adenine_before) > 1e-6:
+        if not _balanced(adenine_after, adenine_before):
             adjustment = adenine_before - adenine_after
-            self.cell.cytoplasm.metabolites["ADP"].quantity += adjustment
+            self._cyto_adp.quantity += adjustment
             self.reporter.log_event(
-                f"Adjusted ADP by {adjustment:.6f} to maintain adenine nucleotide balance after glycolysis"
+                "Adjusted ADP by %.6f to maintain adenine nucleotide balance "
+                "after glycolysis",
+                adjustment,
             )
 
     def run_simulation(self, glucose: float, reporter: Reporter) -> dict:
@@ -108,188 +267,151 @@ class SimulationController:
         -------
         dict:
             The results of the simulation.
+
+        Raises
+        ------
+        UnknownMetaboliteError
+            If a metabolite a simulation step reads is missing.
         """
-        self.glycolysis = Glycolysis(debug=self.debug)
+        self._validate_metabolites()
         self.initial_adenine_nucleotides = (
             self.initial_atp + self.initial_adp + self.initial_amp
         )
-        self.adenine_nucleotide_log.append(
-            ("Initial", self.initial_adenine_nucleotides)
-        )
+        self._log_adenine_nucleotides(INITIAL, self.initial_adenine_nucleotides)
         self.cell.metabolites["glucose"].quantity = round(glucose, 2)
-        reporter.log_event(f"Starting simulation with {glucose:.2f} glucose units")
+        reporter.log_event("Starting simulation with %.2f glucose units", glucose)
         try:
+            # Bind the metabolites the loop reads every step once
+            cell_glucose = self.cell.metabolites["glucose"]
+            cell_pyruvate = self.cell.metabolites["pyruvate"]
+            cytoplasm = self.cell.cytoplasm.metabolites
+            mitochondrion = self.cell.mitochondrion.metabolites
+            self._bind_metabolites()
+            cyto_atp = self._cyto_atp
+            cyto_adp = self._cyto_adp
+            cyto_amp = cytoplasm["AMP"]
+            mito_atp = self._mito_atp
+            mito_adp = self._mito_adp
+
             glucose_processed = 0
             total_atp_produced = 0
-            initial_glucose = self.cell.metabolites["glucose"].quantity
-            initial_pyruvate = self.cell.metabolites["pyruvate"].quantity
+            initial_glucose = cell_glucose.quantity
+            initial_pyruvate = cell_pyruvate.quantity
             initial_total_adenine = (
                 self.initial_atp + self.initial_adp + self.initial_amp
             )
             reporter.log_event(
-                f"Initial ATP: {self.initial_atp}, Initial ADP: {self.initial_adp}, Initial AMP: {self.initial_amp}"
+                "Initial ATP: %s, Initial ADP: %s, Initial AMP: %s",
+                self.initial_atp,
+                self.initial_adp,
+                self.initial_amp,
             )
 
-            next_log_time = 0
-            while (
-                glucose_processed < glucose
-                and self.simulation_time < self.max_simulation_time
-            ):
-                try:
-                    glucose_available = self.cell.metabolites["glucose"].quantity
-                    reporter.log_event(f"glucose_available: {glucose_available}")
-                    if glucose_available < 1:
-                        reporter.log_warning(
-                            "Insufficient glucose for glycolysis. Stopping simulation."
-                        )
-                        break
-
-                    # Store ATP and ADP levels before reactions
-                    atp_before = (
-                        self.cell.cytoplasm.metabolites["ATP"].quantity
-                        + self.cell.mitochondrion.metabolites["ATP"].quantity
-                    )
-                    adp_before = (
-                        self.cell.cytoplasm.metabolites["ADP"].quantity
-                        + self.cell.mitochondrion.metabolites["ADP"].quantity
+            # Count whole steps so the clock does not drift; the state is
+            # logged on the first step and then every 10 simulated seconds
+            tick, max_ticks = self._clock_ticks()
+            log_every = max(1, round(10 / self.time_step))
+            next_log_tick = 0
+            first_tick = tick
+            while glucose_processed < glucose and tick < max_ticks:
+                log_step = (
+                    self.log_interval > 0
+                    and (tick - first_tick) % self.log_interval == 0
+                    and reporter.isStepEnabledFor(logging.INFO)
+                )
+                glucose_available = cell_glucose.quantity
+                if log_step:
+                    reporter.log_metric("glucose_available", glucose=glucose_available)
+                if glucose_available < 1:
+                    reporter.log_warning(
+                        "Insufficient glucose for glycolysis. Stopping simulation."
                     )
+                    break
 
-                    # Add this line to track adenine nucleotides before each step
-                    adenine_before = self._calculate_total_adenine_nucleotides()
+                adenine_before = self._calculate_total_adenine_nucleotides()
 
-                    # Perform glycolysis
+                # Perform glycolysis
+                try:
                     net_atp_produced, pyruvate_produced = Glycolysis.perform(
                         self.cell, glucose_available, self.reporter
                     )
+                except GlycolysisError as e:
+                    reporter.log_warning("Glycolysis error: %s", e)
+                    break
 
-                    # Add this line to track adenine nucleotides after glycolysis
-                    adenine_after_glycolysis = (
-                        self._calculate_total_adenine_nucleotides()
-                    )
-
-                    # Call the new method to adjust adenine balance
-                    self._adjust_adenine_balance_after_glycolysis(
-                        adenine_before, adenine_after_glycolysis
-                    )
+                # Glycolysis works on the cytoplasm, so any adenine drift it
+                # causes is put back on cytoplasmic ADP before the step goes on
+                self._adjust_adenine_balance_after_glycolysis(
+                    adenine_before, self._calculate_total_adenine_nucleotides()
+                )
 
-                    glucose_processed += glucose_available
-                    total_atp_produced += net_atp_produced
+                glucose_processed += glucose_available
+                total_atp_produced += net_atp_produced
 
-                    # Update ATP levels
-                    self.cell.cytoplasm.metabolites["ATP"].quantity += net_atp_produced
+                # Update ATP levels
+                cyto_atp.quantity += net_atp_produced
 
-                    reporter.log_event(
-                        f"ATP produced in this iteration: {net_atp_produced}"
-                    )
-                    reporter.log_event(
-                        f"Total ATP produced so far: {total_atp_produced}"
-                    )
+                # Record the ATP produced in this iteration; it is only logged
+                # on the steps the log interval picks
+                reporter.log_atp_production("Glycolysis", net_atp_produced, log_step)
+                if log_step:
+                    reporter.log_metric("total_atp_produced", atp=total_atp_produced)
 
-                    reporter.log_atp_production("Glycolysis", net_atp_produced)
+                # Check if there is enough glucose
+                if cell_glucose.quantity <= 0:
+                    reporter.log_warning("Glucose depleted. Stopping simulation.")
+                    break
 
-                    # Check if there is enough glucose
-                    if self.cell.metabolites["glucose"].quantity <= 0:
-                        reporter.log_warning("Glucose depleted. Stopping simulation.")
-                        break
+                # Check and handle ADP availability
+                self._handle_adp_availability(reporter)
 
-                    # Check and handle ADP availability
-                    self._handle_adp_availability()
+                # Implement feedback activation
+                self._apply_feedback_activation()
 
-                    # Implement feedback activation
-                    self._apply_feedback_activation()
+                # Handle NADH shuttle
+                self._handle_nadh_shuttle()
 
-                    # Handle NADH shuttle
-                    self._handle_nadh_shuttle()
+                # Perform cellular respiration
+                #! Pausing for now. Nothing changes the mitochondrial ATP
+                # here while it is, so its production is not recorded; when
+                # restored, log the change in mito_atp.quantity across the
+                # call as "Cellular Respiration"
+                # mitochondrial_atp = self.cell.mitochondrion.cellular_respiration(pyruvate_produced)
 
-                    # Perform cellular respiration
-                    mitochondrial_atp_before = self.cell.mitochondrion.metabolites[
-                        "atp"
-                    ].quantity
-                    #! Pausing for now
-                    # mitochondrial_atp = self.cell.mitochondrion.cellular_respiration(pyruvate_produced)
+                # Transfer excess ATP from mitochondrion to cytoplasm
+                self._transfer_excess_atp()
 
-                    mitochondrial_atp_produced = round(
-                        self.cell.mitochondrion.metabolites["atp"].quantity
-                        - mitochondrial_atp_before,
-                        2,
-                    )
+                # Ensure metabolite quantities don't exceed limits
+                self._enforce_metabolite_limits()
 
-                    reporter.log_atp_production(
-                        "Cellular Respiration", mitochondrial_atp_produced
-                    )
+                tick = self._advance_clock(tick)
 
-                    # Transfer excess ATP from mitochondrion to cytoplasm
-                    self._transfer_excess_atp()
+                if tick >= next_log_tick:
+                    self._log_intermediate_state(reporter)
+                    # Next multiple of log_every
+                    next_log_tick = (tick // log_every + 1) * log_every
 
-                    # Ensure metabolite quantities don't exceed limits
-                    self._enforce_metabolite_limits()
+                if log_step:
+                    reporter.log_metric("simulation_time", time=self.simulation_time)
 
-                    self.simulation_time = round(
-                        self.simulation_time + self.time_step, 2
-                    )
+                # Nothing changes the quantities between the check and the
+                # adjustment, so they share one adenine total
+                adenine = self._check_adenine_nucleotide_balance(reporter)
+                self._check_energy_conservation(reporter)
+                self._check_and_adjust_adenine_balance(reporter, adenine)
 
-                    if self.simulation_time >= next_log_time:
-                        self._log_intermediate_state()
-                        next_log_time = round(
-                            next_log_time + 10, 2
-                        )  # Schedule next log time
-
-                    reporter.log_event(f"Simulation time: {self.simulation_time:.3f}")
-
-                    self._check_adenine_nucleotide_balance()
-                    self._check_energy_conservation()
-
-                    # Add this at the end of each iteration
-                    self._check_and_adjust_adenine_balance()
-
-                    # Ensure no negative quantities after adjustment
-                    for metabolite in ["ATP", "ADP", "AMP"]:
-                        if self.cell.cytoplasm.metabolites[metabolite].quantity < 0:
-                            self.cell.cytoplasm.metabolites[metabolite].quantity = 0
-                            reporter.log_warning(
-                                f"Set {metabolite} to 0 to avoid negative quantity"
-                            )
-
-                    # Run observers
-                    #! Need to think through if this works as expected
-                    for observer in self.observers:
-                        observer.observe(self.cell, reporter)
-
-                except UnknownMetaboliteError as e:
-                    reporter.log_error(f"Unknown metabolite error: {str(e)}")
-                    reporter.log_warning("Skipping current simulation step.")
-                    continue
-                except InsufficientMetaboliteError as e:
-                    reporter.log_error(f"Insufficient metabolite error: {str(e)}")
-                    reporter.log_warning(
-                        "Attempting to continue simulation with available metabolites."
-                    )
-                    continue
-                except QuantityError as e:
-                    reporter.log_error(f"Quantity error: {str(e)}")
-                    reporter.log_warning(
-                        "Adjusting quantities and continuing simulation."
-                    )
-                    continue
-                except GlycolysisError as e:
-                    reporter.log_warning(f"Glycolysis error: {str(e)}")
-                    break
+                # Run observers. NegativeMetaboliteObserver also clamps any
+                # quantity the adjustment left negative to zero
+                #! Need to think through if this works as expected
+                for observer in self.observers:
+                    observer.observe(self.cell, reporter)
 
             # After the simulation loop, update the results dictionary
-            final_glucose = self.cell.metabolites["glucose"].quantity
-            final_pyruvate = self.cell.metabolites["pyruvate"].quantity
-            final_atp = (
-                self.cell.cytoplasm.metabolites["ATP"].quantity
-                + self.cell.mitochondrion.metabolites["ATP"].quantity
-            )
-            final_adp = (
-                self.cell.cytoplasm.metabolites["ADP"].quantity
-                + self.cell.mitochondrion.metabolites["ADP"].quantity
-            )
-            final_amp = (
-                self.cell.cytoplasm.metabolites["AMP"].quantity
-                + self.cell.mitochondrion.metabolites["AMP"].quantity
-            )
+            final_glucose = cell_glucose.quantity
+            final_pyruvate = cell_pyruvate.quantity
+            final_atp = cyto_atp.quantity + mito_atp.quantity
+            final_adp = cyto_adp.quantity + mito_adp.quantity
+            final_amp = cyto_amp.quantity + mitochondrion["AMP"].quantity
             final_total_adenine = final_atp + final_adp + final_amp
 
             results = {
@@ -299,10 +421,8 @@ class SimulationController:
                 "pyruvate_produced": final_pyruvate - initial_pyruvate,
                 "simulation_time": self.simulation_time,
                 "oxygen_remaining": self.cell.metabolites["oxygen"].quantity,
-                "final_cytoplasm_atp": self.cell.cytoplasm.metabolites["ATP"].quantity,
-                "final_mitochondrion_atp": self.cell.mitochondrion.metabolites[
-                    "ATP"
-                ].quantity,
+                "final_cytoplasm_atp": cyto_atp.quantity,
+                "final_mitochondrion_atp": mito_atp.quantity,
                 "final_adp": final_adp,
                 "final_amp": final_amp,
                 "final_phosphoglycerate_2": self.cell.metabolites[
@@ -334,158 +454,157 @@ class SimulationController:
 
             # Check adenine nucleotide balance
             reporter.log_event(
-                f"Initial total adenine nucleotides: {initial_total_adenine}"
+                "Initial total adenine nucleotides: %s", initial_total_adenine
             )
             reporter.log_event(
-                f"Final total adenine nucleotides: {final_total_adenine}"
+                "Final total adenine nucleotides: %s", final_total_adenine
             )
             reporter.log_event(
-                f"Difference: {final_total_adenine - initial_total_adenine}"
+                "Difference: %s", final_total_adenine - initial_total_adenine
             )
 
-            if abs(final_total_adenine - initial_total_adenine) > 1e-6:
+            if not _balanced(final_total_adenine, initial_total_adenine):
                 reporter.log_warning("Adenine nucleotide balance is not conserved!")
                 # Adjust ATP and ADP to maintain balance
                 excess = final_total_adenine - initial_total_adenine
                 atp_adjustment = min(excess, final_atp - self.initial_atp)
-                self.cell.cytoplasm.metabolites["ATP"].quantity -= atp_adjustment
+                # Whatever ATP does not absorb comes off ADP, either sign
                 adp_adjustment = excess - atp_adjustment
-                if adp_adjustment > 0:
-                    self.cell.cytoplasm.metabolites["ADP"].quantity -= adp_adjustment
-                else:
-                    self.cell.cytoplasm.metabolites["ADP"].quantity += abs(
-                        adp_adjustment
-                    )
+                # ATP and ADP are the first two adenine slots
+                cytoplasm.quantity_array[adenine_slots(cytoplasm)[:2]] -= (
+                    atp_adjustment,
+                    adp_adjustment,
+                )
                 reporter.log_event(
-                    f"Adjusted ATP by -{atp_adjustment} and ADP by {-adp_adjustment} to maintain adenine nucleotide balance"
+                    "Adjusted ATP by -%s and ADP by %s to maintain adenine "
+                    "nucleotide balance",
+                    atp_adjustment,
+                    -adp_adjustment,
                 )
-                results["final_cytoplasm_atp"] = self.cell.cytoplasm.metabolites[
-                    "ATP"
-                ].quantity
-                results["final_adp"] = self.cell.cytoplasm.metabolites["ADP"].quantity
+                results["final_cytoplasm_atp"] = cyto_atp.quantity
+                results["final_adp"] = cyto_adp.quantity
 
             # Add this at the end of the method
             final_adenine_nucleotides = self._calculate_total_adenine_nucleotides()
             results["initial_adenine_nucleotides"] = self.initial_adenine_nucleotides
             results["final_adenine_nucleotides"] = final_adenine_nucleotides
 
-            if abs(final_adenine_nucleotides - self.initial_adenine_nucleotides) > 1e-6:
+            if not _balanced(
+                final_adenine_nucleotides, self.initial_adenine_nucleotides
+            ):
                 reporter.log_warning(
-                    f"Adenine nucleotide imbalance detected. "
-                    f"Initial: {self.initial_adenine_nucleotides:.6f}, "
-                    f"Final: {final_adenine_nucleotides:.6f}, "
-                    f"Difference: {final_adenine_nucleotides - self.initial_adenine_nucleotides:.6f}"
+                    "Adenine nucleotide imbalance detected. "
+                    "Initial: %.6f, Final: %.6f, Difference: %.6f",
+                    self.initial_adenine_nucleotides,
+                    final_adenine_nucleotides,
+                    final_adenine_nucleotides - self.initial_adenine_nucleotides,
                 )
 
             return results
 
         except Exception as e:
-            reporter.log_error(f"Simulation error: {str(e)}")
+            reporter.log_error("Simulation error: %s", e)
             raise
 
     def _handle_adp_availability(self, reporter: Reporter) -> None:
         """
         Handle the availability of ADP in the mitochondrion.
         """
-        if self.cell.mitochondrion.metabolites["adp"].quantity < 10:
+        mito_adp = self._mito_adp
+        if mito_adp.quantity < 10:
             reporter.log_warning(
                 "Low ADP levels in mitochondrion. Transferring ADP from cytoplasm."
             )
-            adp_transfer = min(50, self.cell.metabolites["adp"].quantity)
-            self.cell.metabolites["adp"].quantity += adp_transfer
-            self.cell.metabolites["adp"].quantity -= adp_transfer
+            cyto_adp = self._cyto_adp
+            adp_transfer = min(50, cyto_adp.quantity)
+            # Nothing moves once the cytoplasm has run out of ADP
+            if adp_transfer > 0:
+                cyto_adp.quantity -= adp_transfer
+                mito_adp.quantity += adp_transfer
 
     def _apply_feedback_activation(self) -> None:
         """
         Apply feedback activation based on ADP levels.
+
+        The rate only depends on the ADP level, so steady-state steps where
+        it has not changed leave the rate as it is.
         """
-        adp_activation_factor = 1 + self.cell.metabolites["adp"].quantity / 500
+        adp = self._cell_adp.quantity
+        if adp == self._feedback_adp:
+            return
         self.cell.cytoplasm.glycolysis_rate = (
-            self.base_glycolysis_rate * adp_activation_factor
+            self.base_glycolysis_rate + adp * self._adp_activation_slope
         )
+        self._feedback_adp = adp
 
     def _handle_nadh_shuttle(self) -> None:
         """
         Handle the NADH shuttle between the cytoplasm and mitochondrion.
         """
         transfer_rate = 5  # Define a realistic transfer rate per time step
-        cytoplasmic_nadh = round(self.cell.metabolites["nadh"].quantity, 2)
-        nadh_to_transfer = round(min(transfer_rate, cytoplasmic_nadh), 2)
-        self.cell.mitochondrion.transfer_cytoplasmic_nadh(nadh_to_transfer)
-        self.cell.metabolites["nadh"].quantity = round(
-            self.cell.metabolites["nadh"].quantity - nadh_to_transfer, 2
-        )
+        nadh = self._cell_nadh
+        # Read once: the shuttle only changes the mitochondrion's NADH
+        quantity = nadh.quantity
+        nadh_to_transfer = min(transfer_rate, quantity)
+        # Nothing to shuttle once the cytoplasmic NADH has run out
+        if nadh_to_transfer:
+            self.cell.mitochondrion.transfer_cytoplasmic_nadh(nadh_to_transfer)
+        nadh.quantity = quantity - nadh_to_transfer
 
     def _transfer_excess_atp(self) -> None:
         """
         Transfer excess ATP from the mitochondrion to the cytoplasm.
         """
-        atp_excess = max(
-            0,
-            self.cell.metabolites["atp"].quantity - self.max_mitochondrial_atp,
-        )
-        transfer_amount = min(
-            atp_excess,
-            self.max_cytoplasmic_atp - self.cell.metabolites["atp"].quantity,
-        )
-
-        self.cell.metabolites["atp"].quantity += transfer_amount
-        self.cell.metabolites["atp"].quantity -= transfer_amount
+        mito_atp = self._mito_atp
+        cyto_atp = self._cyto_atp
+        atp_excess = max(0, mito_atp.quantity - self.max_mitochondrial_atp)
+        transfer_amount = min(atp_excess, self.max_cytoplasmic_atp - cyto_atp.quantity)
+        # Nothing moves while the mitochondrion is under its limit
+        if transfer_amount > 0:
+            mito_atp.quantity -= transfer_amount
+            cyto_atp.quantity += transfer_amount
 
     def _enforce_metabolite_limits(self) -> None:
         """
         Enforce the limits for mitochondrial and cytoplasmic metabolites.
         """
-        # Limit mitochondrial metabolites
-        self.cell.metabolites["atp"].quantity = min(
-            self.cell.metabolites["atp"].quantity,
-            self.max_mitochondrial_atp,
-        )
-        self.cell.metabolites["nadh"].quantity = min(
-            self.cell.metabolites["nadh"].quantity,
-            self.max_mitochondrial_nadh,
-        )
-
-        # Limit cytoplasmic metabolites
-        self.cell.metabolites["atp"].quantity = min(
-            self.cell.metabolites["atp"].quantity, self.max_cytoplasmic_atp
-        )
-        self.cell.metabolites["nadh"].quantity = min(
-            self.cell.metabolites["nadh"].quantity, self.max_cytoplasmic_nadh
-        )
+        for metabolite, limit in self._limits:
+            if metabolite.quantity > limit:
+                metabolite.quantity = limit
 
     def _log_intermediate_state(self, reporter: Reporter) -> None:
         """
         Log the intermediate state of the simulation.
+
+        The state is only gathered when the reporter would emit it.
         """
+        if not reporter.isEnabledFor(logging.INFO):
+            return
         state = self.get_current_state()
-        reporter.log_event(f"Time: {state['simulation_time']:.2f} s")
-        if "glucose_processed" in state:
-            reporter.log_event(f"Glucose Processed: {state['glucose_processed']:.2f}")
-        else:
-            reporter.log_event("Glucose Processed: Not available")
-        reporter.log_event(f"Total ATP Produced: {state['total_atp_produced']:.2f}")
-        reporter.log_event(f"Cytoplasm ATP: {state['cytoplasm_atp']:.2f}")
-        reporter.log_event(f"Mitochondrion ATP: {state['mitochondrion_atp']:.2f}")
-        reporter.log_event(f"Proton Gradient: {state['proton_gradient']:.2f}")
-        reporter.log_event(f"Oxygen Remaining: {state['oxygen_remaining']:.2f}")
-        reporter.log_event(f"NAD+: {state['nad']:.2f}")
-        reporter.log_event(f"NADH: {state['nadh']:.2f}")
+        reporter.log_event("Time: %.2f s", state["simulation_time"])
+        reporter.log_event("Glucose Processed: %.2f", state["glucose_processed"])
+        reporter.log_event("Total ATP Produced: %.2f", state["total_atp_produced"])
+        reporter.log_event("Cytoplasm ATP: %.2f", state["cytoplasm_atp"])
+        reporter.log_event("Mitochondrion ATP: %.2f", state["mitochondrion_atp"])
+        reporter.log_event("Proton Gradient: %.2f", state["proton_gradient"])
+        reporter.log_event("Oxygen Remaining: %.2f", state["oxygen_remaining"])
+        reporter.log_event("NAD+: %.2f", state["nad"])
+        reporter.log_event("NADH: %.2f", state["nadh"])
 
     def get_current_state(self) -> dict:
         """
         Get the current state of the simulation.
         """
+        cytoplasm = self.cell.cytoplasm.metabolites
+        cytoplasm_atp = self._cyto_atp.quantity
+        mitochondrion_atp = self._mito_atp.quantity
         state = {
             "simulation_time": self.simulation_time,
-            "glucose_processed": self.initial_glucose
-            - self.cell.cytoplasm.metabolites["glucose"].quantity,
-            "cytoplasm_atp": self.cell.cytoplasm.metabolites["ATP"].quantity,
-            "mitochondrion_atp": self.cell.mitochondrion.metabolites["ATP"].quantity,
+            "glucose_processed": self.initial_glucose - cytoplasm["glucose"].quantity,
+            "cytoplasm_atp": cytoplasm_atp,
+            "mitochondrion_atp": mitochondrion_atp,
             "total_atp_produced": (
-                self.cell.cytoplasm.metabolites["ATP"].quantity
-                + self.cell.mitochondrion.metabolites["ATP"].quantity
-                - self.initial_atp
+                cytoplasm_atp + mitochondrion_atp - self.initial_atp
             ),
             "proton_gradient": self.cell.mitochondrion.proton_gradient,
             "oxygen_remaining": self.cell.metabolites["oxygen"].quantity,
@@ -499,38 +618,63 @@ class SimulationController:
         Reset the simulation state.
         """
         self.cell.reset()
+        self._feedback_adp = None
         self.cell.cytoplasm.metabolites["ADP"].quantity = 1.0
         self.cell.cytoplasm.metabolites["AMP"].quantity = 1.0
 
-    def _check_adenine_nucleotide_balance(self, reporter: Reporter) -> None:
+    def _check_adenine_nucleotide_balance(self, reporter: Reporter) -> float:
         """
         Check the adenine nucleotide balance and log any changes.
+
+        Returns the current total adenine nucleotides.
         """
         current_adenine_nucleotides = self._calculate_total_adenine_nucleotides()
         difference = current_adenine_nucleotides - self.initial_adenine_nucleotides
-        if abs(difference) > 1e-6:
+        if not _balanced(current_adenine_nucleotides, self.initial_adenine_nucleotides):
             reporter.log_warning(
-                f"Adenine nucleotide imbalance detected. "
-                f"Current: {current_adenine_nucleotides:.6f}, "
-                f"Initial: {self.initial_adenine_nucleotides:.6f}, "
-                f"Difference: {difference:.6f}"
-            )
-            self.adenine_nucleotide_log.append(
-                ("Imbalance", current_adenine_nucleotides)
+                "Adenine nucleotide imbalance detected. "
+                "Current: %.6f, Initial: %.6f, Difference: %.6f",
+                current_adenine_nucleotides,
+                self.initial_adenine_nucleotides,
+                difference,
             )
+            self._log_adenine_nucleotides(IMBALANCE, current_adenine_nucleotides)
+        return current_adenine_nucleotides
+
+    def _log_adenine_nucleotides(self, stage: int, value: float) -> None:
+        """
+        Record a total in the adenine nucleotide log.
+
+        Once the log is full, each new entry overwrites the oldest.
+        """
+        log = self.adenine_nucleotide_log
+        log[self._adenine_log_count % len(log)] = (stage, value)
+        self._adenine_log_count += 1
+
+    def _adenine_log_entries(self) -> np.ndarray:
+        """
+        The entries of the adenine nucleotide log, oldest first.
+        """
+        log = self.adenine_nucleotide_log
+        count = self._adenine_log_count
+        if count <= len(log):
+            return log[:count]
+        start = count % len(log)
+        return np.concatenate((log[start:], log[:start]))
 
     def _report_adenine_nucleotide_changes(self, reporter: Reporter) -> None:
         """
         Report the changes in adenine nucleotides throughout the simulation.
         """
+        entries = self._adenine_log_entries()
         reporter.log_event("\nAdenine Nucleotide Changes:")
-        for stage, value in self.adenine_nucleotide_log:
-            reporter.log_event(f"{stage}: {value:.6f}")
+        for stage, value in entries.tolist():
+            reporter.log_event("%s: %.6f", ADENINE_LOG_STAGES[stage], value)
 
-        initial = self.adenine_nucleotide_log[0][1]
-        final = self.adenine_nucleotide_log[-1][1]
+        initial = entries["value"][0]
+        final = entries["value"][-1]
         difference = final - initial
-        reporter.log_event(f"Total Change: {difference:.6f}")
+        reporter.log_event("Total Change: %.6f", difference)
 
     def _check_energy_conservation(self, reporter: Reporter) -> None:
         """
@@ -542,41 +686,47 @@ class SimulationController:
         """
         current_energy_state = self._calculate_total_energy_state()
         difference = current_energy_state - self.initial_energy_state
-        if abs(difference) > 1e-6:
+        if not _balanced(current_energy_state, self.initial_energy_state):
             reporter.log_warning(
-                f"Energy conservation violation detected. "
-                f"Current: {current_energy_state:.6f}, "
-                f"Initial: {self.initial_energy_state:.6f}, "
-                f"Difference: {difference:.6f}"
+                "Energy conservation violation detected. "
+                "Current: %.6f, Initial: %.6f, Difference: %.6f",
+                current_energy_state,
+                self.initial_energy_state,
+                difference,
             )
 
-    def _check_and_adjust_adenine_balance(self, reporter: Reporter):
+    def _check_and_adjust_adenine_balance(
+        self, reporter: Reporter, current_adenine: float = None
+    ):
         """
         Check the adenine nucleotide balance and make adjustments if necessary.
 
         If the adenine nucleotide balance is negative, it means that the system
         is consuming adenine nucleotides. If the adenine nucleotide balance is
         positive, it means that the system is producing adenine nucleotides.
+
+        ``current_adenine`` is the current total when the caller already has
+        it; otherwise it is calculated.
         """
-        current_adenine = self._calculate_total_adenine_nucleotides()
-        if abs(current_adenine - self.initial_adenine_nucleotides) > 1e-6:
+        if current_adenine is None:
+            current_adenine = self._calculate_total_adenine_nucleotides()
+        if not _balanced(current_adenine, self.initial_adenine_nucleotides):
             adjustment = self.initial_adenine_nucleotides - current_adenine
 
             # Distribute the adjustment across ATP, ADP, and AMP
-            atp_adjustment = min(
-                adjustment, self.cell.cytoplasm.metabolites["ATP"].quantity
-            )
-            self.cell.cytoplasm.metabolites["ATP"].quantity -= atp_adjustment
-
-            remaining_adjustment = adjustment - atp_adjustment
-            adp_adjustment = min(
-                remaining_adjustment, self.cell.cytoplasm.metabolites["ADP"].quantity
+            cytoplasm = self._cytoplasm
+            atp_adjustment, adp_adjustment, amp_adjustment = (
+                _distribute_adenine_adjustment(
+                    cytoplasm.quantity_array,
+                    adenine_slots(cytoplasm),
+                    adjustment,
+                )
             )
-            self.cell.cytoplasm.metabolites["ADP"].quantity -= adp_adjustment
-
-            amp_adjustment = remaining_adjustment - adp_adjustment
-            self.cell.cytoplasm.metabolites["AMP"].quantity += amp_adjustment
 
             reporter.log_warning(
-                f"Adjusted ATP by -{atp_adjustment}, ADP by -{adp_adjustment}, and AMP by +{amp_adjustment} to maintain adenine nucleotide balance"
+                "Adjusted ATP by -%s, ADP by -%s, and AMP by +%s to maintain "
+                "adenine nucleotide balance",
+                atp_adjustment,
+                adp_adjustment,
+                amp_adjustment,
             )
@@ -1,31 +1,70 @@
-from typing import List
+from typing import List, Tuple
+
+import numpy as np
+
+from .jit import njit, vectorize
 
 
 class Effector:
+    __slots__ = ("concentration", "Ki", "Ka")
+
     def __init__(self, concentration: float, Ki: float, Ka: float):
         self.concentration = concentration
         self.Ki = Ki
         self.Ka = Ka
 
 
+@vectorize(["float64(float64, float64, float64)"], cache=True)
 def michaelis_menten(substrate_conc: float, vmax: float, km: float) -> float:
-    """Calculates reaction rate using the Michaelis-Menten equation."""
+    """
+    Calculates reaction rate using the Michaelis-Menten equation.
+
+    Works elementwise on arrays, so the rates of many reactions are one call.
+    """
     return vmax * substrate_conc / (km + substrate_conc)
 
 
+def pack_effectors(
+    effectors: List[Effector], constant: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Packs effectors into arrays of concentrations and constants.
+
+    ``constant`` is the name of the effector attribute to pack alongside the
+    concentrations, ``"Ki"`` for inhibitors and ``"Ka"`` for activators.
+    """
+    concentrations = np.array([e.concentration for e in effectors], dtype=float)
+    constants = np.array([getattr(e, constant) for e in effectors], dtype=float)
+    return concentrations, constants
+
+
+@njit(cache=True)
+def allosteric_factor(
+    inhibitor_concentrations: np.ndarray,
+    inhibitor_ki: np.ndarray,
+    activator_concentrations: np.ndarray,
+    activator_ka: np.ndarray,
+) -> float:
+    """Combined inhibition and activation factor of packed effectors."""
+    inhibition_factor = np.prod(1 / (1 + inhibitor_concentrations / inhibitor_ki))
+    activation_factor = np.prod(1 + activator_concentrations / activator_ka)
+    return inhibition_factor * activation_factor
+
+
 def allosteric_regulation(
     base_activity: float, inhibitors: List[Effector], activators: List[Effector]
 ) -> float:
     """Calculates enzyme activity considering inhibitors and activators."""
-    inhibition_factor = 1
-    for inhibitor in inhibitors:
-        inhibition_factor *= 1 / (1 + inhibitor.concentration / inhibitor.Ki)
-    activation_factor = 1
-    for activator in activators:
-        activation_factor *= 1 + activator.concentration / activator.Ka
-    return base_activity * inhibition_factor * activation_factor
+    return base_activity * allosteric_factor(
+        *pack_effectors(inhibitors, "Ki"), *pack_effectors(activators, "Ka")
+    )
 
 
+@vectorize(["float64(float64, float64, float64, float64)"], cache=True)
 def hill_equation(substrate_conc: float, Vmax: float, K: float, n: float) -> float:
-    """Calculates reaction rate using the Hill equation for cooperative binding."""
+    """
+    Calculates reaction rate using the Hill equation for cooperative binding.
+
+    Works elementwise on arrays, so the rates of many reactions are one call.
+    """
     return Vmax * (substrate_conc**n) / (K**n + substrate_conc**n)
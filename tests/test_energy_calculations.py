@@ -11,6 +11,7 @@ from pyology.energy_calculations import (
     calculate_proton_gradient_energy,
     calculate_total_adenine_nucleotides,
     get_quantity,
+    sum_adenine_nucleotides,
 )
 from pyology.metabolite import Metabolite
 from pyology.cell import Cell
@@ -88,6 +89,16 @@ def test_calculate_total_adenine_nucleotides():
     assert calculate_total_adenine_nucleotides(mock_organelle) == 10
 
 
+def test_sum_adenine_nucleotides():
+    organelle = Organelle()
+    for name, quantity in {"ATP": 5, "glucose": 7, "ADP": 3, "AMP": 2}.items():
+        organelle.add_metabolite(name, "metabolite", quantity, 100)
+    metabolites = organelle.metabolites
+    assert sum_adenine_nucleotides(metabolites) == 10
+    metabolites["ADP"].quantity = 4
+    assert sum_adenine_nucleotides(metabolites) == 11
+
+
 def test_calculate_energy_state(mock_logger):
     mock_organelle = create_mock_organelle(
         {
@@ -149,3 +160,16 @@ def test_calculate_energy_state_empty(mock_logger):
     ):
         energy_state = calculate_energy_state(mock_organelle, mock_logger)
     assert energy_state == 0
+
+
+def test_calculate_energy_state_organelle():
+    organelle = Organelle()
+    organelle.add_metabolite("ATP", "nucleotide", 10, 100)
+    organelle.add_metabolite("NADH", "cofactor", 3, 100)
+    organelle.add_metabolite("unknown", "other", 7, 100)
+    logger = logging.getLogger("test_energy_calculations")
+    assert calculate_energy_state(organelle, logger) == 10 * 50 + 3 * 158
+
+    # The cached weights follow metabolites added afterwards
+    organelle.add_metabolite("GTP", "nucleotide", 2, 100)
+    assert calculate_energy_state(organelle, logger) == 10 * 50 + 3 * 158 + 2 * 50
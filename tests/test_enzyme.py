@@ -19,6 +19,16 @@ class TestEnzymeActivation(unittest.TestCase):
         enzyme.deactivate()
         self.assertFalse(enzyme.active)
 
+    def test_vmax_follows_activity_and_k_cat(self):
+        enzyme = Enzyme(name="Enzyme1", k_cat=2.0, k_m={"A": 10.0})
+        self.assertEqual(enzyme.vmax, 2.0)
+        enzyme.deactivate()
+        self.assertEqual(enzyme.vmax, 0.0)
+        enzyme.k_cat = 3.0
+        self.assertEqual(enzyme.vmax, 0.0)
+        enzyme.activate()
+        self.assertEqual(enzyme.vmax, 3.0)
+
     def test_inactive_enzyme_calculate_rate(self):
         enzyme = Enzyme(name="Enzyme1", k_cat=1.0, k_m={"A": 10.0}, active=False)
         rate = enzyme.calculate_rate(
@@ -26,6 +36,19 @@ class TestEnzymeActivation(unittest.TestCase):
         )
         self.assertEqual(rate, 0.0)
 
+    def test_parameters_are_read_only_and_repacked_on_assignment(self):
+        enzyme = Enzyme(name="Enzyme1", k_cat=1.0, k_m={"A": 10.0})
+        metabolites = {"A": Metabolite(name="A", quantity=10.0, max_quantity=100.0)}
+        self.assertAlmostEqual(enzyme.calculate_rate(metabolites), 0.5)
+        with self.assertRaises(TypeError):
+            enzyme.k_m["A"] = 30.0
+        enzyme.k_m = {"A": 30.0}
+        self.assertAlmostEqual(enzyme.calculate_rate(metabolites), 0.25)
+        enzyme.hill_coefficients = {"A": 2}
+        self.assertAlmostEqual(enzyme.calculate_rate(metabolites), 0.1)
+        enzyme.activators = {"A": 10.0}
+        self.assertAlmostEqual(enzyme.calculate_rate(metabolites), 0.2)
+
 
 class TestEnzymeRegulation(unittest.TestCase):
     def test_regulate_enzyme_activate(self):
@@ -88,6 +111,36 @@ class TestEnzymeKinetics(unittest.TestCase):
         rate = enzyme.calculate_rate(metabolites)
         self.assertLess(rate, 0.8333333)  # Rate should be lower due to inhibition
 
+    def test_calculate_rate_with_noncompetitive_inhibitor(self):
+        enzyme = Enzyme(
+            name="Enzyme1",
+            k_cat=1.0,
+            k_m={"A": 10.0},
+            inhibitors={"I": {"type": "noncompetitive", "ki": 5.0}},
+        )
+        metabolites = {
+            "A": Metabolite(name="A", quantity=50.0, max_quantity=100.0),
+            "I": Metabolite(name="I", quantity=5.0, max_quantity=10.0),
+        }
+        rate = enzyme.calculate_rate(metabolites)
+        self.assertAlmostEqual(rate, 0.8333333 / 2, places=6)
+
+    def test_calculate_rate_with_bare_inhibition_constant(self):
+        metabolites = {
+            "A": Metabolite(name="A", quantity=50.0, max_quantity=100.0),
+            "I": Metabolite(name="I", quantity=2.5, max_quantity=10.0),
+        }
+        bare = Enzyme(name="Enzyme1", k_cat=1.0, k_m={"A": 10.0}, inhibitors={"I": 5.0})
+        competitive = Enzyme(
+            name="Enzyme1",
+            k_cat=1.0,
+            k_m={"A": 10.0},
+            inhibitors={"I": {"type": "competitive", "ki": 5.0}},
+        )
+        self.assertEqual(
+            bare.calculate_rate(metabolites), competitive.calculate_rate(metabolites)
+        )
+
     def test_calculate_rate_with_activator(self):
         enzyme = Enzyme(
             name="Enzyme1", k_cat=1.0, k_m={"A": 10.0}, activators={"C": 1.0}
@@ -144,5 +197,16 @@ class TestEnzymeCatalysis(unittest.TestCase):
         self.assertGreater(metabolites["product2"].quantity, 0.0)
 
 
+class TestCommonEnzymes(unittest.TestCase):
+    def test_regulation_is_shared_and_read_only(self):
+        from pyology import common_enzymes
+
+        self.assertIs(
+            common_enzymes.hexokinase.inhibitors, common_enzymes.enolase.inhibitors
+        )
+        with self.assertRaises(TypeError):
+            common_enzymes.hexokinase.activators["atp"] = 2.0
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,83 @@
+import logging
+import unittest
+
+import numpy as np
+
+from pyology.glycolysis import Glycolysis
+from pyology.organelle import Organelle
+
+
+class TestGlycolysisBatch(unittest.TestCase):
+    def make_organelle(self, glucose, atp):
+        organelle = Organelle()
+        for name in Glycolysis.batch_names:
+            organelle.add_metabolite(name, "metabolite", 0, 1000)
+        organelle.set_metabolite_quantity("glucose", glucose)
+        organelle.set_metabolite_quantity("atp", atp)
+        for cofactor in ("nad+", "pi", "adp"):
+            organelle.set_metabolite_quantity(cofactor, 100)
+        return organelle
+
+    def test_run_batch_matches_phases(self):
+        logger = logging.getLogger(__name__)
+        lanes = [(1, 10), (3, 50), (5, 3)]
+        quantities = np.zeros((len(Glycolysis.batch_names), len(lanes)))
+        for lane, (glucose, atp) in enumerate(lanes):
+            organelle = self.make_organelle(glucose, atp)
+            quantities[:, lane] = [
+                organelle.get_metabolite_quantity(name)
+                for name in Glycolysis.batch_names
+            ]
+        glucose_units = [glucose for glucose, _ in lanes]
+
+        completed = Glycolysis.run_batch(quantities, 1000, glucose_units)
+
+        np.testing.assert_array_equal(completed, [True, True, False])
+        for lane, (glucose, atp) in enumerate(lanes[:2]):
+            organelle = self.make_organelle(glucose, atp)
+            Glycolysis.investment_phase(organelle, glucose, logger)
+            Glycolysis.yield_phase(organelle, 2 * glucose, logger)
+            expected = [
+                organelle.get_metabolite_quantity(name)
+                for name in Glycolysis.batch_names
+            ]
+            np.testing.assert_array_equal(quantities[:, lane], expected)
+
+    def test_run_matches_phases(self):
+        expected = self.make_organelle(glucose=3, atp=10)
+        Glycolysis.investment_phase(expected, 3, logging.getLogger(__name__))
+        Glycolysis.yield_phase(expected, 6, logging.getLogger(__name__))
+        organelle = self.make_organelle(glucose=3, atp=10)
+        organelle.add_metabolite("amp", "nucleotide", 0, 1000)
+        logger = logging.getLogger(__name__)
+        logger.setLevel(logging.WARNING)
+        self.addCleanup(logger.setLevel, logging.NOTSET)
+        Glycolysis().run(organelle, 3, logger)
+        for name in Glycolysis.batch_names:
+            self.assertEqual(
+                organelle.get_metabolite_quantity(name),
+                expected.get_metabolite_quantity(name),
+            )
+
+    def test_run_truncates_glucose_units_once(self):
+        organelle = self.make_organelle(glucose=2, atp=10)
+        organelle.add_metabolite("amp", "nucleotide", 0, 1000)
+        Glycolysis().run(organelle, 1.5, logging.getLogger(__name__))
+        self.assertEqual(organelle.get_metabolite_quantity("glucose"), 1)
+        self.assertEqual(organelle.get_metabolite_quantity("pyruvate"), 2)
+
+    def test_debug_run_logs_tracked_changes(self):
+        organelle = self.make_organelle(glucose=2, atp=10)
+        organelle.add_metabolite("amp", "nucleotide", 0, 1000)
+        logger = logging.getLogger(__name__)
+        with self.assertLogs(logger, logging.DEBUG) as logs:
+            Glycolysis(debug=True).run(organelle, 1, logger)
+        self.assertIn(
+            f"DEBUG:{__name__}:Glycolysis changes: "
+            "{'ATP': 2.0, 'ADP': -2.0, 'NADH': 2.0, 'glucose': -1.0}",
+            logs.output,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+
+from pyology import jit
+
+
+def add(a, b):
+    return a + b
+
+
+class TestLazyJit(unittest.TestCase):
+    @unittest.skipIf(jit.EAGER, "PYOLOGY_JIT=1 compiles on first call")
+    def test_min_calls_runs_python_first(self):
+        kernel = jit.njit(min_calls=2)(add)
+        self.assertEqual(kernel(1, 2), 3)
+        self.assertEqual(kernel(3, 4), 7)
+        self.assertIsNone(kernel._dispatcher)
+        self.assertEqual(kernel(5, 6), 11)
+        self.assertIsNotNone(kernel._dispatcher)
+
+    def test_min_calls_not_passed_to_numba(self):
+        kernel = jit.njit(min_calls=1)(add)
+        self.assertNotIn("min_calls", kernel.options)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+import numpy as np
+
+from pyology.utils import (
+    Effector,
+    allosteric_factor,
+    allosteric_regulation,
+    hill_equation,
+    michaelis_menten,
+    pack_effectors,
+)
+
+
+class TestKinetics(unittest.TestCase):
+    def test_michaelis_menten(self):
+        self.assertAlmostEqual(michaelis_menten(10.0, 2.0, 10.0), 1.0)
+        self.assertEqual(michaelis_menten(0.0, 2.0, 10.0), 0.0)
+
+    def test_hill_equation(self):
+        self.assertAlmostEqual(hill_equation(10.0, 2.0, 10.0, 2.0), 1.0)
+        self.assertAlmostEqual(hill_equation(5.0, 1.0, 5.0, 1.0), 0.5)
+
+    def test_michaelis_menten_broadcasts(self):
+        rates = michaelis_menten(np.array([0.0, 10.0, 30.0]), 2.0, 10.0)
+        np.testing.assert_allclose(rates, [0.0, 1.0, 1.5])
+
+    def test_hill_equation_reduces_to_michaelis_menten(self):
+        self.assertAlmostEqual(
+            hill_equation(3.0, 4.0, 2.0, 1.0), michaelis_menten(3.0, 4.0, 2.0)
+        )
+
+
+class TestAllostericRegulation(unittest.TestCase):
+    def setUp(self):
+        self.inhibitors = [Effector(2.0, Ki=1.0, Ka=0.0), Effector(1.0, Ki=4.0, Ka=0.0)]
+        self.activators = [Effector(3.0, Ki=0.0, Ka=1.5)]
+
+    def test_allosteric_regulation(self):
+        expected = 10.0 * (1 / (1 + 2.0)) * (1 / (1 + 0.25)) * (1 + 2.0)
+        self.assertAlmostEqual(
+            allosteric_regulation(10.0, self.inhibitors, self.activators), expected
+        )
+
+    def test_no_effectors(self):
+        self.assertEqual(allosteric_regulation(10.0, [], []), 10.0)
+
+    def test_packed_effectors(self):
+        concentrations, constants = pack_effectors(self.inhibitors, "Ki")
+        np.testing.assert_array_equal(concentrations, [2.0, 1.0])
+        np.testing.assert_array_equal(constants, [1.0, 4.0])
+        factor = allosteric_factor(
+            concentrations, constants, *pack_effectors(self.activators, "Ka")
+        )
+        self.assertAlmostEqual(
+            10.0 * factor, allosteric_regulation(10.0, self.inhibitors, self.activators)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import logging
+import unittest
+
+from pyology.exceptions import KrebsCycleError, QuantityError, UnknownMetaboliteError
+from pyology.krebs_cycle import KrebsCycle
+from pyology.organelle import Organelle
+
+logger = logging.getLogger(__name__)
+
+INITIAL_QUANTITIES = {
+    "Acetyl_CoA": 10,
+    "Oxaloacetate": 1,
+    "H2O": 50,
+    "Citrate": 0,
+    "CoA": 0,
+    "Isocitrate": 0,
+    "NAD+": 40,
+    "α_Ketoglutarate": 0,
+    "CO2": 0,
+    "NADH": 0,
+    "Succinyl_CoA": 0,
+    "ADP": 20,
+    "Pi": 20,
+    "Succinate": 0,
+    "ATP": 0,
+    "FAD": 10,
+    "Fumarate": 0,
+    "FADH2": 0,
+    "Malate": 0,
+    "GTP": 0,
+    "GDP": 0,
+}
+
+
+def make_organelle():
+    organelle = Organelle()
+    for name, quantity in INITIAL_QUANTITIES.items():
+        organelle.add_metabolite(name, "metabolite", quantity, 1000)
+    return organelle
+
+
+class TestKrebsCycles(unittest.TestCase):
+    def setUp(self):
+        self.krebs_cycle = KrebsCycle()
+
+    def run_one_at_a_time(self, count):
+        organelle = make_organelle()
+        co2_produced = 0
+        energy_produced = 0
+        for _ in range(count):
+            co2, energy = self.krebs_cycle.cycle(organelle, logger)
+            co2_produced += co2
+            energy_produced += energy
+        return organelle, co2_produced, energy_produced
+
+    def test_cycles_match_single_cycles(self):
+        for count in (1, 4, 10):
+            organelle = make_organelle()
+            co2, energy = self.krebs_cycle.cycles(organelle, count, logger)
+            expected, expected_co2, expected_energy = self.run_one_at_a_time(count)
+            self.assertEqual(co2, expected_co2)
+            self.assertAlmostEqual(energy, expected_energy)
+            self.assertEqual(
+                organelle.metabolites.quantities, expected.metabolites.quantities
+            )
+
+    def test_cycles_insufficient_substrate(self):
+        organelle = make_organelle()
+        with self.assertRaises(KrebsCycleError):
+            self.krebs_cycle.cycles(organelle, 11, logger)
+        # Turns that could run before the shortage still happened
+        self.assertEqual(organelle.get_metabolite_quantity("CO2"), 20)
+
+    def test_cycles_product_above_max(self):
+        organelle = make_organelle()
+        organelle.metabolites["CO2"].max_quantity = 5
+        with self.assertRaises(QuantityError):
+            self.krebs_cycle.cycles(organelle, 4, logger)
+        # The third turn stops at its second decarboxylation
+        self.assertEqual(organelle.get_metabolite_quantity("CO2"), 5)
+        self.assertEqual(organelle.get_metabolite_quantity("α_Ketoglutarate"), 1)
+
+    def test_cycles_missing_metabolite(self):
+        organelle = make_organelle()
+        del organelle.metabolites["Fumarate"]
+        with self.assertRaises(UnknownMetaboliteError):
+            self.krebs_cycle.cycles(organelle, 5, logger)
+        # The missing metabolite is found before any turn runs
+        for name, quantity in INITIAL_QUANTITIES.items():
+            if name != "Fumarate":
+                self.assertEqual(organelle.get_metabolite_quantity(name), quantity)
+
+    def test_cycles_zero(self):
+        organelle = make_organelle()
+        self.assertEqual(self.krebs_cycle.cycles(organelle, 0, logger), (0, 0))
+
+    def test_enzyme_rates_match_calculate_rate(self):
+        organelle = make_organelle()
+        for name in ("Citrate", "Succinate", "Malate"):
+            organelle.set_metabolite_quantity(name, 7)
+        organelle.set_metabolite_quantity("ATP", 3)
+        self.krebs_cycle.cycle_reactions[1].enzyme.deactivate()
+        try:
+            rates = self.krebs_cycle.enzyme_rates(organelle)
+            for rate, reaction in zip(rates, self.krebs_cycle.cycle_reactions):
+                expected = reaction.enzyme.calculate_rate(organelle.metabolites)
+                self.assertAlmostEqual(rate, expected)
+            self.assertEqual(rates[1], 0)
+            # Their k_m is for "alpha-ketoglutarate" and "succinyl-coa", which
+            # the organelle does not hold
+            self.assertEqual(rates[3], 0)
+            self.assertEqual(rates[4], 0)
+            self.assertTrue(rates[[0, 5, 7]].all())
+        finally:
+            self.krebs_cycle.cycle_reactions[1].enzyme.active = True
+
+
+if __name__ == "__main__":
+    unittest.main()
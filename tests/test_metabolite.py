@@ -0,0 +1,191 @@
+import unittest
+
+import numpy as np
+
+from pyology.exceptions import (
+    InsufficientMetaboliteError,
+    MetaboliteError,
+    QuantityError,
+    UnknownMetaboliteError,
+)
+from pyology.metabolite import Metabolite, Metabolites, gibbs_free_energies
+
+
+class TestMetabolitesArrays(unittest.TestCase):
+    def setUp(self):
+        self.metabolites = Metabolites()
+        self.metabolites.register(glucose=(10, 100), atp=(5, 50), adp=(1, 50))
+
+    def test_standalone_metabolite(self):
+        metabolite = Metabolite("ATP", 5, 50)
+        metabolite.quantity += 1
+        self.assertEqual(metabolite.quantity, 6.0)
+        self.assertIsInstance(metabolite.quantity, float)
+        self.assertEqual(metabolite.max_quantity, 50.0)
+
+    def test_non_number_quantity_raises(self):
+        with self.assertRaises(TypeError):
+            Metabolite("x", None, 10)
+        metabolite = Metabolite("ATP", 5, 50)
+        for attribute in ("quantity", "min_quantity", "max_quantity"):
+            with self.assertRaises(TypeError):
+                setattr(metabolite, attribute, None)
+        self.assertEqual(metabolite.quantity, 5)
+
+    def test_metabolite_uses_slots(self):
+        metabolite = Metabolite("ATP", 5, 50)
+        self.assertFalse(hasattr(metabolite, "__dict__"))
+        with self.assertRaises(AttributeError):
+            metabolite.undeclared_attribute = 1
+
+    def test_lock_is_opt_in(self):
+        self.assertIsNone(Metabolite("ATP", 5, 50).lock)
+        metabolite = Metabolite("ATP", 5, 50, thread_safe=True)
+        self.assertIs(metabolite.lock, Metabolite("atp", 1, 5, thread_safe=True).lock)
+        metabolite.adjust_quantity(2)
+        self.assertEqual(metabolite.quantity, 7)
+
+    def test_energy_uses_gibbs_table(self):
+        self.assertEqual(Metabolite("ATP", 2, 10).energy, 100)
+        self.assertEqual(Metabolite("unknown", 2, 10).energy, 2)
+        with self.assertRaises(TypeError):
+            gibbs_free_energies["ATP"] = 0
+
+    def test_quantity_array_matches_metabolites(self):
+        idx = self.metabolites.indices(["glucose", "atp", "adp"])
+        np.testing.assert_array_equal(self.metabolites.quantity_array[idx], [10, 5, 1])
+        np.testing.assert_array_equal(
+            self.metabolites.max_quantity_array[idx], [100, 50, 50]
+        )
+
+    def test_array_and_metabolite_share_storage(self):
+        atp = self.metabolites["atp"]
+        self.metabolites.quantity_array[self.metabolites.index("atp")] += 2
+        self.assertEqual(atp.quantity, 7)
+        atp.quantity = 3
+        self.assertEqual(
+            self.metabolites.quantity_array[self.metabolites.index("atp")], 3
+        )
+
+    def test_growth_keeps_values(self):
+        glucose = self.metabolites["glucose"]
+        for i in range(20):
+            self.metabolites.register(f"m{i}", i, 100)
+        self.assertEqual(glucose.quantity, 10)
+        self.assertEqual(self.metabolites["m19"].quantity, 19)
+        glucose.quantity = 11
+        self.assertEqual(
+            self.metabolites.quantity_array[self.metabolites.index("glucose")], 11
+        )
+
+    def test_setitem_adopts_metabolite(self):
+        nadh = Metabolite("NADH", 4, 10)
+        self.metabolites["nadh"] = nadh
+        self.metabolites.quantity_array[self.metabolites.index("nadh")] = 9
+        self.assertEqual(nadh.quantity, 9)
+
+    def test_metabolite_belongs_to_one_collection(self):
+        atp = self.metabolites["atp"]
+        other = Metabolites()
+        with self.assertRaises(MetaboliteError):
+            other["atp"] = atp
+        with self.assertRaises(MetaboliteError):
+            self.metabolites["nadh"] = atp
+        self.assertNotIn("atp", other)
+        # Once removed it can move
+        del self.metabolites["atp"]
+        other["atp"] = atp
+        atp.quantity = 7
+        self.assertEqual(other.quantity_array[other.index("atp")], 7)
+
+    def test_deleted_metabolite_keeps_its_value(self):
+        atp = self.metabolites["atp"]
+        del self.metabolites["atp"]
+        self.assertNotIn("atp", self.metabolites)
+        self.assertEqual(atp.quantity, 5)
+        with self.assertRaises(UnknownMetaboliteError):
+            self.metabolites.index("atp")
+
+    def test_quantities_follow_insertion_order(self):
+        self.assertEqual(self.metabolites.quantities, [10, 5, 1])
+        del self.metabolites["atp"]
+        self.metabolites.register("nadh", 3, 10)
+        self.assertEqual(self.metabolites.quantities, [10, 1, 3])
+
+    def test_reset(self):
+        self.metabolites.reset()
+        np.testing.assert_array_equal(self.metabolites.quantity_array, [0, 0, 0])
+        self.assertEqual(self.metabolites["glucose"].quantity, 0)
+
+    def test_total_energy_matches_metabolites(self):
+        self.metabolites.register("ATP", 2, 50)
+        expected = sum(m.energy for m in self.metabolites.data.values())
+        self.assertEqual(self.metabolites.total_energy, expected)
+        del self.metabolites["glucose"]
+        self.metabolites["glucose"] = Metabolite("glucose", 3, 100)
+        expected = sum(m.energy for m in self.metabolites.data.values())
+        self.assertEqual(self.metabolites.total_energy, expected)
+
+    def test_energy_dict_matches_metabolites(self):
+        del self.metabolites["atp"]
+        self.metabolites.register("ATP", 2, 50)
+        expected = {m.name: m.energy for m in self.metabolites.data.values()}
+        self.assertEqual(self.metabolites.energy_dict, expected)
+
+    def test_validate_all(self):
+        self.metabolites.validate_all()
+        self.metabolites["adp"].quantity = 60
+        with self.assertRaisesRegex(ValueError, "adp"):
+            self.metabolites.validate_all()
+
+    def test_consume(self):
+        self.metabolites.consume(glucose=4, ATP=5)
+        self.assertEqual(self.metabolites["glucose"].quantity, 6)
+        self.assertEqual(self.metabolites["atp"].quantity, 0)
+
+    def test_consume_insufficient_consumes_nothing(self):
+        with self.assertRaises(InsufficientMetaboliteError):
+            self.metabolites.consume(glucose=4, atp=6)
+        self.assertEqual(self.metabolites["glucose"].quantity, 10)
+
+    def test_produce(self):
+        self.metabolites.produce(glucose=5, adp=2)
+        self.assertEqual(self.metabolites["glucose"].quantity, 15)
+        self.assertEqual(self.metabolites["adp"].quantity, 3)
+
+    def test_produce_above_max_produces_nothing(self):
+        with self.assertRaises(QuantityError):
+            self.metabolites.produce(glucose=5, adp=50)
+        self.assertEqual(self.metabolites["glucose"].quantity, 10)
+        with self.assertRaises(UnknownMetaboliteError):
+            self.metabolites.produce(nadh=1)
+
+    def test_setdefault(self):
+        self.assertIs(self.metabolites.setdefault("ATP"), self.metabolites["atp"])
+        nadh = self.metabolites.setdefault("NADH", 3, 30)
+        self.assertEqual((nadh.quantity, nadh.max_quantity), (3, 30))
+        self.assertIn("nadh", self.metabolites)
+
+    def test_iterates_over_metabolites(self):
+        self.assertEqual(
+            list(self.metabolites),
+            [self.metabolites[n] for n in ("glucose", "atp", "adp")],
+        )
+
+    def test_state(self):
+        state = self.metabolites.state(["quantity", "energy", "missing"])
+        self.assertEqual(state["atp"], {"quantity": 5, "energy": 5})
+        self.assertEqual(list(state), ["glucose", "atp", "adp"])
+
+    def test_keys_are_metabolite_names(self):
+        for key, metabolite in self.metabolites.items():
+            self.assertIs(key, metabolite.name)
+
+    def test_metabolite_info_is_a_copy(self):
+        info = Metabolites._load_metabolite_info("ATP")
+        info["quantity"] = -1
+        self.assertNotEqual(Metabolites._load_metabolite_info("ATP")["quantity"], -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
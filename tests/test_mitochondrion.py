@@ -337,3 +337,256 @@
 # if __name__ == "__main__":
 #     unittest.main()
 
+
+import logging
+import unittest
+
+import numpy as np
+
+from pyology.constants import (
+    FADH2_PER_ACETYL_COA,
+    GTP_PER_ACETYL_COA,
+    NADH_PER_ACETYL_COA,
+)
+from pyology.mitochondrion import Mitochondrion
+from pyology.mitochondrion_batch import MitochondrionBatch
+
+
+class TestKrebsCycleProcess(unittest.TestCase):
+    def setUp(self):
+        self.mito = Mitochondrion()
+
+    def test_uses_slots(self):
+        self.assertFalse(hasattr(self.mito, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.mito.undeclared_attribute = 1
+
+    def test_krebs_cycle_process_yields(self):
+        self.mito.metabolites["oxaloacetate"].quantity = 10
+        self.mito.metabolites["nadh"].quantity = 0
+        self.mito.metabolites["fadh2"].quantity = 0
+        self.mito.metabolites["atp"].quantity = 0
+
+        result = self.mito.krebs_cycle_process(4)
+
+        self.assertEqual(
+            self.mito.metabolites["nadh"].quantity, NADH_PER_ACETYL_COA * 4
+        )
+        self.assertEqual(
+            self.mito.metabolites["fadh2"].quantity, FADH2_PER_ACETYL_COA * 4
+        )
+        self.assertEqual(self.mito.metabolites["atp"].quantity, GTP_PER_ACETYL_COA * 4)
+        self.assertEqual(result, (NADH_PER_ACETYL_COA + FADH2_PER_ACETYL_COA) * 4)
+
+    def test_krebs_cycle_process_without_oxaloacetate(self):
+        self.assertEqual(self.mito.krebs_cycle_process(4), 0)
+
+    def test_reset(self):
+        nadh = self.mito.metabolites["nadh"]
+        nadh.quantity = 10
+        self.mito.proton_gradient = 50
+        self.mito.debug = True
+
+        self.mito.reset()
+
+        self.assertIs(self.mito.metabolites["nadh"], nadh)
+        self.assertEqual(nadh.quantity, 0)
+        self.assertEqual(self.mito.proton_gradient, 0)
+        self.assertTrue(self.mito.debug)
+
+    def test_pyruvate_to_acetyl_coa(self):
+        self.mito.metabolites["nadh"].quantity = 1
+        self.assertEqual(self.mito.pyruvate_to_acetyl_coa(3), 3)
+        self.assertEqual(self.mito.metabolites["nadh"].quantity, 4)
+        self.assertEqual(self.mito.metabolites["co2"].quantity, 3)
+
+    def test_apply_deltas_clamps_at_zero(self):
+        self.mito.metabolites["ubiquinol"].quantity = 2
+        changes = self.mito.apply_deltas(("ubiquinol", "ubiquinone"), (-5, 1))
+        self.assertEqual(changes, [-2, 1])
+        self.assertEqual(self.mito.metabolites["ubiquinol"].quantity, 0)
+
+    def test_change_metabolite_quantity_creates_missing(self):
+        self.assertEqual(self.mito.change_metabolite_quantity("calcium", 5), 5)
+        self.assertEqual(self.mito.change_metabolite_quantity("calcium", -8), -5)
+        self.assertEqual(self.mito.metabolites["calcium"].quantity, 0)
+
+    def test_theoretical_atp_yield(self):
+        # 4 NADH * 2.5 + 1 FADH2 * 1.5 + 1 GTP per pyruvate
+        self.assertEqual(self.mito.theoretical_atp_yield(1), 12.5)
+        self.assertEqual(self.mito.theoretical_atp_yield(2), 25)
+        self.assertEqual(self.mito.theoretical_atp_yield(0), 0)
+
+    def test_theoretical_atp_yield_array(self):
+        pyruvate = np.array([0, 1, 2, 10])
+        np.testing.assert_array_equal(
+            self.mito.theoretical_atp_yield(pyruvate),
+            [self.mito.theoretical_atp_yield(p) for p in pyruvate],
+        )
+
+
+class TestElectronTransportChain(unittest.TestCase):
+    def setUp(self):
+        self.mito = Mitochondrion()
+        self.initial = {
+            "nadh": 10,
+            "fadh2": 2,
+            "ubiquinone": 100,
+            "ubiquinol": 0,
+            "cytochrome_c_oxidized": 100,
+            "cytochrome_c_reduced": 0,
+            "oxygen": 50,
+        }
+        for name, quantity in self.initial.items():
+            self.mito.metabolites[name].quantity = quantity
+
+    def test_electron_transport_chain(self):
+        electrons = self.mito.electron_transport_chain()
+
+        self.assertEqual(electrons, (10, 2, 12, 12))
+        self.assertEqual(self.mito.metabolites["nadh"].quantity, 0)
+        self.assertEqual(self.mito.metabolites["fadh2"].quantity, 0)
+        self.assertEqual(self.mito.metabolites["oxygen"].quantity, 44)
+        self.assertEqual(self.mito.metabolites["cytochrome_c_oxidized"].quantity, 100)
+        self.assertGreater(self.mito.proton_gradient, 0)
+
+    def test_matches_batch_complexes(self):
+        batch = MitochondrionBatch(1, **self.initial)
+        expected = (
+            batch.complex_I()[0],
+            batch.complex_II()[0],
+            batch.complex_III()[0],
+            batch.complex_IV()[0],
+        )
+
+        electrons = self.mito.electron_transport_chain()
+
+        self.assertEqual(electrons, expected)
+        self.assertAlmostEqual(self.mito.proton_gradient, batch.proton_gradient[0])
+        for name in self.initial:
+            self.assertAlmostEqual(
+                self.mito.metabolites[name].quantity, getattr(batch, name)[0]
+            )
+
+    def test_complexes_match_electron_transport_chain(self):
+        other = Mitochondrion()
+        for name, quantity in self.initial.items():
+            other.metabolites[name].quantity = quantity
+        expected = other.electron_transport_chain()
+
+        electrons = (
+            self.mito.complex_I(),
+            self.mito.complex_II(),
+            self.mito.complex_III(),
+            self.mito.complex_IV(),
+        )
+
+        self.assertEqual(electrons, expected)
+        self.assertAlmostEqual(self.mito.proton_gradient, other.proton_gradient)
+
+    def test_is_metabolite_available(self):
+        self.assertTrue(self.mito.is_metabolite_available("nadh", 10))
+        self.assertFalse(self.mito.is_metabolite_available("nadh", 11))
+        self.assertFalse(self.mito.is_metabolite_available("unknown", 1))
+
+    def test_consume_metabolites_all_or_nothing(self):
+        self.assertFalse(self.mito.consume_metabolites(nadh=5, fadh2=3))
+        self.assertEqual(self.mito.metabolites["nadh"].quantity, 10)
+        self.assertEqual(self.mito.metabolites["fadh2"].quantity, 2)
+
+        self.assertTrue(self.mito.consume_metabolites(nadh=5, fadh2=2))
+        self.assertEqual(self.mito.metabolites["nadh"].quantity, 5)
+        self.assertEqual(self.mito.metabolites["fadh2"].quantity, 0)
+
+    def test_consume_unknown_metabolite(self):
+        self.assertFalse(self.mito.consume_metabolites(nadh=1, unknown=1))
+        self.assertEqual(self.mito.metabolites["nadh"].quantity, 10)
+
+    def test_atp_synthase_limited_by_gradient(self):
+        self.mito.metabolites["adp"].quantity = 50
+        self.mito.metabolites["atp"].quantity = 0
+        self.mito.proton_gradient = 21.5
+
+        self.assertEqual(self.mito.atp_synthase(), 5)
+        self.assertEqual(self.mito.proton_gradient, 1.5)
+
+    def test_atp_synthase_limited_by_adp(self):
+        self.mito.metabolites["adp"].quantity = 3
+        self.mito.metabolites["atp"].quantity = 0
+        self.mito.proton_gradient = 21.5
+
+        self.assertEqual(self.mito.atp_synthase(), 3)
+        self.assertEqual(self.mito.proton_gradient, 9.5)
+        self.assertEqual(self.mito.metabolites["atp"].quantity, 3)
+
+    def test_atp_synthase_without_adp(self):
+        self.mito.metabolites["adp"].quantity = 0
+        self.mito.metabolites["atp"].quantity = 0
+        self.mito.proton_gradient = 21.5
+
+        with self.assertLogs("pyology.mitochondrion", logging.WARNING):
+            self.assertEqual(self.mito.atp_synthase(), 0)
+        self.assertEqual(self.mito.proton_gradient, 21.5)
+        self.assertEqual(self.mito.metabolites["atp"].quantity, 0)
+
+    def test_atp_synthase_without_gradient(self):
+        self.mito.metabolites["adp"].quantity = 50
+        self.mito.proton_gradient = 3
+
+        with self.assertLogs("pyology.mitochondrion", logging.WARNING):
+            self.assertEqual(self.mito.atp_synthase(), 0)
+        self.assertEqual(self.mito.metabolites["adp"].quantity, 50)
+
+    def test_oxidative_phosphorylation_matches_steps(self):
+        other = Mitochondrion()
+        for mito in (self.mito, other):
+            for name, quantity in self.initial.items():
+                mito.metabolites[name].quantity = quantity
+            mito.metabolites["adp"].quantity = 20
+            mito.metabolites["atp"].quantity = 0
+            mito.proton_gradient = 30
+
+        other.electron_transport_chain()
+        expected = other.atp_synthase()
+        other.replenish_ubiquinone()
+        other.replenish_cytochrome_c()
+
+        atp_produced = self.mito.oxidative_phosphorylation()
+
+        self.assertEqual(atp_produced, expected)
+        self.assertAlmostEqual(self.mito.proton_gradient, other.proton_gradient)
+        for name in list(self.initial) + ["adp", "atp"]:
+            self.assertAlmostEqual(
+                self.mito.metabolites[name].quantity,
+                other.metabolites[name].quantity,
+            )
+
+    def test_batch_round_trip(self):
+        other = Mitochondrion()
+        other.metabolites["nadh"].quantity = 3
+        other.proton_gradient = 7
+        self.mito.proton_gradient = 5
+
+        batch = MitochondrionBatch.from_mitochondria([self.mito, other])
+        np.testing.assert_array_equal(batch.nadh, [10, 3])
+        np.testing.assert_array_equal(batch.oxygen, [50, 0])
+        np.testing.assert_array_equal(batch.proton_gradient, [5, 7])
+
+        batch.complex_I()
+        batch.to_mitochondria([self.mito, other])
+        for column, mito in enumerate((self.mito, other)):
+            self.assertEqual(mito.metabolites["nadh"].quantity, batch.nadh[column])
+            self.assertEqual(
+                mito.metabolites["ubiquinol"].quantity, batch.ubiquinol[column]
+            )
+            self.assertEqual(mito.proton_gradient, batch.proton_gradient[column])
+
+    def test_no_oxygen(self):
+        self.mito.metabolites["oxygen"].quantity = 0
+        electrons = self.mito.electron_transport_chain()
+        self.assertEqual(electrons[3], 0)
+        self.assertEqual(self.mito.metabolites["cytochrome_c_reduced"].quantity, 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+import logging
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from pyology import mitochondrion_batch
+
+from pyology.constants import PROTONS_PER_ATP
+from pyology.mitochondrion import Mitochondrion
+from pyology.mitochondrion_batch import NADH, MitochondrionBatch
+
+
+class TestMitochondrionBatch(unittest.TestCase):
+    def setUp(self):
+        self.batch = MitochondrionBatch(
+            3,
+            nadh=[0, 5, 10],
+            ubiquinone=100,
+            cytochrome_c_oxidized=100,
+            oxygen=[0, 50, 50],
+            adp=100,
+        )
+
+    def test_initial_state(self):
+        self.assertEqual(len(self.batch), 3)
+        np.testing.assert_array_equal(self.batch.nadh, [0, 5, 10])
+        np.testing.assert_array_equal(self.batch.ubiquinone, [100, 100, 100])
+        np.testing.assert_array_equal(self.batch.proton_gradient, [0, 0, 0])
+
+    def test_fields_are_state_rows(self):
+        self.assertEqual(self.batch.state.shape, (len(MitochondrionBatch.fields), 3))
+        self.batch.nadh += 1
+        np.testing.assert_array_equal(self.batch.state[NADH], [1, 6, 11])
+
+    def test_reset(self):
+        self.batch.proton_gradient[:] = 10
+        self.batch.reset()
+        for field in MitochondrionBatch.fields:
+            np.testing.assert_array_equal(getattr(self.batch, field), 0)
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            MitochondrionBatch(2, glucose=1)
+
+    def test_krebs_cycle_process(self):
+        produced = self.batch.krebs_cycle_process([1, 2, 3])
+        np.testing.assert_array_equal(produced, [4, 8, 12])
+        np.testing.assert_array_equal(self.batch.nadh, [3, 11, 19])
+        np.testing.assert_array_equal(self.batch.fadh2, [1, 2, 3])
+        np.testing.assert_array_equal(self.batch.atp, [1, 2, 3])
+
+    def test_complex_I(self):
+        rate = self.batch.complex_I()
+        np.testing.assert_array_equal(rate, [0, 5, 10])
+        np.testing.assert_array_equal(self.batch.nadh, [0, 0, 0])
+        np.testing.assert_array_equal(self.batch.ubiquinol, [0, 5, 10])
+        self.assertEqual(self.batch.proton_gradient[0], 0)
+        self.assertTrue((self.batch.proton_gradient[1:] > 0).all())
+
+    def test_complex_IV_needs_half_an_oxygen(self):
+        batch = MitochondrionBatch(
+            3, cytochrome_c_reduced=[4, 4, 0.5], oxygen=[0.4, 0.5, 10]
+        )
+        rate = batch.complex_IV()
+        np.testing.assert_array_equal(rate, [0, 1, 0])
+        np.testing.assert_array_equal(batch.oxygen, [0.4, 0, 10])
+
+    def test_calculate_proton_leak(self):
+        self.batch.proton_gradient[:] = [0, 150, 400]
+        leak = self.batch.calculate_proton_leak()
+        mito = Mitochondrion()
+        for gradient, expected in zip([0, 150, 400], leak):
+            mito.proton_gradient = gradient
+            self.assertAlmostEqual(mito.calculate_proton_leak(), expected)
+        np.testing.assert_array_equal(self.batch.proton_gradient, [0, 150, 400])
+
+    def test_atp_synthase(self):
+        self.batch.proton_gradient[:] = [3, 8, 2000]
+        atp = self.batch.atp_synthase()
+        np.testing.assert_array_equal(atp, [0, 2, 100])
+        np.testing.assert_array_equal(self.batch.adp, [100, 98, 0])
+        np.testing.assert_array_equal(
+            self.batch.proton_gradient, [3, 0, 2000 - 100 * PROTONS_PER_ATP]
+        )
+
+    def test_replenish_carriers(self):
+        kwargs = dict(
+            ubiquinone=[90, 10, 50],
+            ubiquinol=[20, 5, 0],
+            cytochrome_c_oxidized=[0, 99, 40],
+            cytochrome_c_reduced=[30, 10, 5],
+        )
+        separate = MitochondrionBatch(3, **kwargs)
+        fused = MitochondrionBatch(3, **kwargs)
+        where = np.array([True, True, False])
+        expected = [
+            separate.replenish_ubiquinone(where),
+            separate.replenish_cytochrome_c(where),
+        ]
+        np.testing.assert_array_equal(fused.replenish_carriers(where), expected)
+        np.testing.assert_array_equal(fused.state, separate.state)
+
+    def test_oxidative_phosphorylation_skips_anoxic(self):
+        atp = self.batch.oxidative_phosphorylation()
+        self.assertEqual(atp[0], 0)
+        self.assertEqual(self.batch.proton_gradient[0], 0)
+        self.assertTrue((atp[1:] > 0).all())
+        np.testing.assert_array_equal(self.batch.atp, atp)
+
+    def test_oxidative_phosphorylation_warns_for_lanes_taking_part(self):
+        with self.assertLogs(mitochondrion_batch.logger, logging.WARNING) as logs:
+            self.batch.oxidative_phosphorylation()
+        self.assertIn("1 of 3", logs.records[0].getMessage())
+        # The anoxic lane is left out, so there is nothing to warn about
+        with patch.object(mitochondrion_batch.logger, "warning") as warning:
+            self.batch.oxidative_phosphorylation(np.array([False, True, True]))
+        warning.assert_not_called()
+
+    def test_cellular_respiration_warns_once_for_anoxic_lanes(self):
+        batch = MitochondrionBatch(
+            3,
+            max_quantity=10,
+            ubiquinone=10,
+            cytochrome_c_oxidized=10,
+            oxygen=[0, 1000, 1000],
+            adp=1000,
+        )
+        with self.assertLogs(mitochondrion_batch.logger, logging.WARNING) as logs:
+            _, steps = batch.cellular_respiration([10, 10, 10])
+        self.assertEqual(steps[0], 0)
+        self.assertGreater(steps[1], 1)
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("1 of 3", logs.records[0].getMessage())
+
+    def test_cellular_respiration_stops_each_lane_on_its_own(self):
+        pyruvate = [2, 4, 10]
+        # Few carriers, so more NADH takes more steps to oxidize
+        carriers = dict(
+            max_quantity=10, ubiquinone=10, cytochrome_c_oxidized=10, oxygen=1000
+        )
+        batch = MitochondrionBatch(3, adp=1000, **carriers)
+        atp, steps = batch.cellular_respiration(pyruvate)
+        self.assertTrue((steps[:-1] < steps[1:]).all())
+        for lane, amount in enumerate(pyruvate):
+            single = MitochondrionBatch(1, adp=1000, **carriers)
+            single_atp, single_steps = single.cellular_respiration([amount])
+            self.assertEqual(atp[lane], single_atp[0])
+            self.assertEqual(steps[lane], single_steps[0])
+            np.testing.assert_array_equal(batch.state[:, lane], single.state[:, 0])
+        self.assertTrue((batch.nadh < 1).all() and (batch.fadh2 < 1).all())
+
+    def test_cellular_respiration_per_lane_step_budget(self):
+        carriers = dict(
+            max_quantity=10, ubiquinone=10, cytochrome_c_oxidized=10, oxygen=1000
+        )
+        batch = MitochondrionBatch(3, adp=1000, **carriers)
+        _, steps = batch.cellular_respiration([10, 10, 10], max_steps=[0, 1, 1000])
+        self.assertEqual(steps[0], 0)
+        self.assertEqual(steps[1], 1)
+        self.assertGreater(steps[2], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from unittest.mock import Mock, call
+
+from pyology.cell import Cell
+from pyology.observers import NegativeMetaboliteObserver
+from pyology.reporter import Reporter
+
+
+class TestNegativeMetaboliteObserver(unittest.TestCase):
+    def setUp(self):
+        self.cell = Cell([])
+        for compartment in (self.cell.cytoplasm, self.cell.mitochondrion):
+            for name in ("ATP", "ADP"):
+                compartment.add_metabolite(name, "metabolite", 10, 100)
+        self.reporter = Mock(spec=Reporter)
+
+    def test_negative_quantities_clamped_and_reported(self):
+        cytoplasm = self.cell.cytoplasm.metabolites
+        mitochondrion = self.cell.mitochondrion.metabolites
+        cytoplasm["ADP"].quantity = -2.5
+        mitochondrion["ATP"].quantity = -1.0
+        NegativeMetaboliteObserver().observe(self.cell, self.reporter)
+
+        self.assertEqual(cytoplasm["ADP"].quantity, 0)
+        self.assertEqual(mitochondrion["ATP"].quantity, 0)
+        # The other metabolites are left alone
+        self.assertEqual(cytoplasm["ATP"].quantity, 10)
+        self.assertEqual(mitochondrion["ADP"].quantity, 10)
+        self.assertEqual(
+            self.reporter.log_warning.call_args_list,
+            [
+                call(
+                    "Negative %s quantity detected in %s: %s", "adp", "Cytoplasm", -2.5
+                ),
+                call(
+                    "Negative %s quantity detected in %s: %s",
+                    "atp",
+                    "Mitochondrion",
+                    -1.0,
+                ),
+            ],
+        )
+
+    def test_no_warning_without_negatives(self):
+        NegativeMetaboliteObserver().observe(self.cell, self.reporter)
+        self.reporter.log_warning.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -31,6 +31,10 @@ class TestOrganelle(unittest.TestCase):
         with self.assertRaises(GlycolysisRateError):
             self.organelle.glycolysis_rate = 0
 
+    def test_runaway_glycolysis_rate(self):
+        with self.assertRaises(GlycolysisRateError):
+            self.organelle.glycolysis_rate = 1e6
+
     def test_add_metabolite(self):
         self.organelle.add_metabolite("test_metabolite", "test_type", 50, 100)
         self.assertIn("test_metabolite", self.organelle.metabolites)
@@ -71,6 +75,21 @@ class TestOrganelle(unittest.TestCase):
                 "glucose", 2000
             )  # exceed max quantity
 
+    def test_apply_deltas(self):
+        self.organelle.add_metabolite("nad", "cofactor", 10, 100)
+        self.organelle.add_metabolite("nadh", "cofactor", 1, 100)
+        self.organelle.apply_deltas(("nad", "nadh"), (-4, 4))
+        self.assertEqual(self.organelle.get_metabolite_quantity("nad"), 6)
+        self.assertEqual(self.organelle.get_metabolite_quantity("nadh"), 5)
+
+    def test_apply_deltas_out_of_bounds_changes_nothing(self):
+        self.organelle.add_metabolite("nad", "cofactor", 10, 100)
+        self.organelle.add_metabolite("nadh", "cofactor", 1, 100)
+        with self.assertRaises(QuantityError):
+            self.organelle.apply_deltas(("nad", "nadh"), (1, -2))
+        self.assertEqual(self.organelle.get_metabolite_quantity("nad"), 10)
+        self.assertEqual(self.organelle.get_metabolite_quantity("nadh"), 1)
+
     def test_is_metabolite_available(self):
         self.assertTrue(self.organelle.is_metabolite_available("atp", 50))
         self.assertFalse(self.organelle.is_metabolite_available("atp", 200))
@@ -87,6 +106,14 @@ class TestOrganelle(unittest.TestCase):
         with self.assertRaises(InsufficientMetaboliteError):
             self.organelle.consume_metabolites(atp=200)
 
+    def test_consume_metabolites_insufficient_consumes_nothing(self):
+        self.organelle.add_metabolite("nad", "cofactor", 10, 100)
+        self.organelle.add_metabolite("nadh", "cofactor", 1, 100)
+        with self.assertRaises(InsufficientMetaboliteError):
+            self.organelle.consume_metabolites(nad=5, nadh=2)
+        self.assertEqual(self.organelle.get_metabolite_quantity("nad"), 10)
+        self.assertEqual(self.organelle.get_metabolite_quantity("nadh"), 1)
+
     def test_produce_metabolites(self):
         initial_quantity = self.organelle.metabolites["glucose"].quantity
         self.organelle.produce_metabolites(glucose=50)
@@ -4,7 +4,7 @@ import logging
 
 # Assuming the necessary classes are imported from the pyology package
 from pyology.enzymes import Enzyme
-from pyology.exceptions import UnknownMetaboliteError
+from pyology.exceptions import QuantityError, UnknownMetaboliteError
 from pyology.organelle import Organelle
 from pyology.reaction import Reaction
 
@@ -625,5 +625,115 @@ class TestReaction(unittest.TestCase):
         self.assertAlmostEqual(self.organelle.get_metabolite_quantity("B"), 0.666666 * 1.0, places=5)
 
 
+class TestReactionStoichiometry(unittest.TestCase):
+    def setUp(self):
+        self.organelle = Organelle()
+        self.organelle.add_metabolite("A", "substrate", 10.0, 100.0)
+        self.organelle.add_metabolite("B", "product", 0.0, 100.0)
+        self.reaction = Reaction(
+            name="A to B", enzyme=None, substrates={"A": 2.0}, products={"B": 1.0}
+        )
+
+    def test_stoichiometry_indices(self):
+        metabolites = self.organelle.metabolites
+        substrate_idx, substrate_coef, product_idx, product_coef = (
+            self.reaction.stoichiometry(metabolites)
+        )
+        self.assertEqual(list(substrate_idx), [metabolites.index("A")])
+        self.assertEqual(list(substrate_coef), [2.0])
+        self.assertEqual(list(product_idx), [metabolites.index("B")])
+        self.assertEqual(list(product_coef), [1.0])
+
+    def test_stoichiometry_is_cached(self):
+        first = self.reaction.stoichiometry(self.organelle.metabolites)
+        second = self.reaction.stoichiometry(self.organelle.metabolites)
+        self.assertIs(first[0], second[0])
+
+    def test_stoichiometry_reverse(self):
+        substrate_idx, _, product_idx, _ = self.reaction.stoichiometry(
+            self.organelle.metabolites, reverse=True
+        )
+        self.assertEqual(list(substrate_idx), [self.organelle.metabolites.index("B")])
+        self.assertEqual(list(product_idx), [self.organelle.metabolites.index("A")])
+
+    def test_changes(self):
+        metabolites = self.organelle.metabolites
+        idx, coef = self.reaction.changes(metabolites)
+        self.assertEqual(list(idx), list(metabolites.indices(["A", "B"])))
+        self.assertEqual(list(coef), [-2.0, 1.0])
+        idx, coef = self.reaction.changes(metabolites, reverse=True)
+        self.assertEqual(list(idx), list(metabolites.indices(["B", "A"])))
+        self.assertEqual(list(coef), [-1.0, 2.0])
+
+    def test_stoichiometry_unknown_metabolite(self):
+        reaction = Reaction(
+            name="C to B", enzyme=None, substrates={"C": 1.0}, products={"B": 1.0}
+        )
+        with self.assertRaises(UnknownMetaboliteError):
+            reaction.stoichiometry(self.organelle.metabolites)
+
+    def test_can_react(self):
+        self.assertTrue(self.reaction.can_react(self.organelle))
+        self.organelle.set_metabolite_quantity("A", 1.0)
+        self.assertFalse(self.reaction.can_react(self.organelle))
+
+    def test_can_react_without_products(self):
+        organelle = Organelle()
+        organelle.add_metabolite("A", "substrate", 10.0, 100.0)
+        self.assertTrue(self.reaction.can_react(organelle))
+        with self.assertRaises(UnknownMetaboliteError):
+            self.reaction.can_react(Organelle())
+
+    def test_transform_with_rates_is_supply_limited(self):
+        enzyme = Enzyme(name="Fast", k_cat=1000.0, k_m={"A": 1.0})
+        reaction = Reaction(
+            name="A to B", enzyme=enzyme, substrates={"A": 2.0}, products={"B": 1.0}
+        )
+        rate = reaction.transform(self.organelle, use_rates=True)
+        # 10 A sustain at most 5 turns of 2A -> B
+        self.assertEqual(rate, 5.0)
+        self.assertEqual(self.organelle.get_metabolite_quantity("A"), 0.0)
+        self.assertEqual(self.organelle.get_metabolite_quantity("B"), 5.0)
+
+    def test_transform_with_rates_matches_calculate_rate(self):
+        enzyme = Enzyme(
+            name="Hill",
+            k_cat=2.0,
+            k_m={"A": 4.0, "B": 3.0},
+            hill_coefficients={"A": 2},
+        )
+        reaction = Reaction(
+            name="A to B", enzyme=enzyme, substrates={"A": 2.0}, products={"B": 1.0}
+        )
+        self.organelle.set_metabolite_quantity("B", 1.0)
+        expected = enzyme.calculate_rate(
+            {name: self.organelle.get_metabolite(name) for name in ("A", "B")}
+        )
+        rate = reaction.transform(self.organelle, use_rates=True, time_step=0.5)
+        self.assertEqual(rate, expected * 0.5)
+        self.assertEqual(self.organelle.get_metabolite_quantity("A"), 10.0 - 2 * rate)
+        self.assertEqual(self.organelle.get_metabolite_quantity("B"), 1.0 + rate)
+
+    def test_transform_reverse(self):
+        reaction = Reaction(
+            name="A to B",
+            enzyme=None,
+            substrates={"A": 2.0},
+            products={"B": 1.0},
+            reversible=True,
+        )
+        self.organelle.set_metabolite_quantity("B", 3.0)
+        self.assertEqual(reaction.transform(self.organelle, reverse=True), 1.0)
+        self.assertEqual(self.organelle.get_metabolite_quantity("A"), 12.0)
+        self.assertEqual(self.organelle.get_metabolite_quantity("B"), 2.0)
+
+    def test_transform_product_above_max_changes_nothing(self):
+        self.organelle.set_metabolite_quantity("B", 100.0)
+        with self.assertRaises(QuantityError):
+            self.reaction.transform(self.organelle)
+        self.assertEqual(self.organelle.get_metabolite_quantity("A"), 10.0)
+        self.assertEqual(self.organelle.get_metabolite_quantity("B"), 100.0)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,121 @@
+import unittest
+
+import numpy as np
+
+from pyology.exceptions import InsufficientSubstrateError, QuantityError
+from pyology.organelle import Organelle
+from pyology.reaction import Reaction
+from pyology.reaction_compiler import CompiledReactions
+
+
+class TestCompiledReactions(unittest.TestCase):
+    def setUp(self):
+        self.reactions = (
+            Reaction("Step 1", None, {"A": 1, "ATP": 1}, {"B": 1, "ADP": 1}),
+            Reaction("Step 2", None, {"B": 1}, {"C": 2}),
+        )
+        self.compiled = CompiledReactions(self.reactions)
+
+    def make_organelle(self, a=5, atp=10, c_max=100):
+        organelle = Organelle()
+        organelle.add_metabolite("A", "substrate", a, 100)
+        organelle.add_metabolite("ATP", "cofactor", atp, 100)
+        organelle.add_metabolite("ADP", "cofactor", 0, 100)
+        organelle.add_metabolite("B", "intermediate", 0, 100)
+        organelle.add_metabolite("C", "product", 0, c_max)
+        return organelle
+
+    def test_matches_transform(self):
+        expected = self.make_organelle()
+        for _ in range(3):
+            for reaction in self.reactions:
+                reaction.transform(organelle=expected)
+        organelle = self.make_organelle()
+        self.compiled.run(organelle, 3)
+        self.assertEqual(
+            organelle.metabolites.quantities, expected.metabolites.quantities
+        )
+
+    def test_many_passes_match_transform(self):
+        expected = self.make_organelle(a=50, atp=60)
+        for _ in range(40):
+            for reaction in self.reactions:
+                reaction.transform(organelle=expected)
+        organelle = self.make_organelle(a=50, atp=60)
+        self.compiled.run(organelle, 40)
+        self.assertEqual(
+            organelle.metabolites.quantities, expected.metabolites.quantities
+        )
+
+    def test_insufficient_substrate_stops_at_failing_reaction(self):
+        organelle = self.make_organelle(a=2)
+        with self.assertRaises(InsufficientSubstrateError):
+            self.compiled.run(organelle, 3)
+        self.assertEqual(organelle.get_metabolite_quantity("C"), 4)
+        self.assertEqual(organelle.get_metabolite_quantity("ATP"), 8)
+
+    def test_stops_after_many_passes(self):
+        organelle = self.make_organelle(a=50, atp=40)
+        with self.assertRaises(InsufficientSubstrateError):
+            self.compiled.run(organelle, 60)
+        # ATP runs out first, after 40 passes
+        self.assertEqual(organelle.get_metabolite_quantity("A"), 10)
+        self.assertEqual(organelle.get_metabolite_quantity("ATP"), 0)
+        self.assertEqual(organelle.get_metabolite_quantity("C"), 80)
+
+    def test_phases_run_in_turn(self):
+        compiled = CompiledReactions(self.reactions, phases=((1, 1), (1, 2)))
+        organelle = self.make_organelle(a=5, atp=10)
+        organelle.add_metabolite("B", "intermediate", 3, 100)
+        compiled.run(organelle, 2)
+        self.assertEqual(organelle.get_metabolite_quantity("A"), 3)
+        self.assertEqual(organelle.get_metabolite_quantity("B"), 1)
+        self.assertEqual(organelle.get_metabolite_quantity("C"), 8)
+
+    def test_phases_report_failing_pass(self):
+        compiled = CompiledReactions(self.reactions, phases=((1, 1), (1, 2)))
+        organelle = self.make_organelle(a=5, atp=10)
+        with self.assertRaisesRegex(InsufficientSubstrateError, "Step 2.*pass 4"):
+            compiled.run(organelle, 3)
+        # All of the first phase ran, then three passes of the second
+        self.assertEqual(organelle.get_metabolite_quantity("A"), 2)
+        self.assertEqual(organelle.get_metabolite_quantity("C"), 6)
+
+    def test_product_above_max(self):
+        organelle = self.make_organelle(c_max=3)
+        with self.assertRaises(QuantityError):
+            self.compiled.run(organelle, 2)
+        # The second pass stops before Step 2, leaving its substrate in place
+        self.assertEqual(organelle.get_metabolite_quantity("B"), 1)
+        self.assertEqual(organelle.get_metabolite_quantity("C"), 2)
+
+    def test_run_lanes_matches_run(self):
+        lanes = [dict(a=5), dict(a=2), dict(c_max=3)]
+        organelles = [self.make_organelle(**lane) for lane in lanes]
+        quantities = np.array(
+            [
+                [o.get_metabolite_quantity(name) for o in organelles]
+                for name in self.compiled.names
+            ]
+        )
+        max_quantities = np.array(
+            [
+                [o.get_metabolite(name).max_quantity for o in organelles]
+                for name in self.compiled.names
+            ]
+        )
+        done = self.compiled.run_lanes(quantities, max_quantities, 3)
+        np.testing.assert_array_equal(done, [6, 4, 3])
+        for lane, organelle in enumerate(organelles):
+            try:
+                self.compiled.run(organelle, 3)
+            except (InsufficientSubstrateError, QuantityError):
+                pass
+            expected = [
+                organelle.get_metabolite_quantity(n) for n in self.compiled.names
+            ]
+            np.testing.assert_array_equal(quantities[:, lane], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+
+import numpy as np
+
+from pyology.enzymes import Enzyme
+from pyology.exceptions import QuantityError
+from pyology.organelle import Organelle
+from pyology.reaction import Reaction
+from pyology.reaction_network import ReactionNetwork
+
+
+class TestReactionNetwork(unittest.TestCase):
+    def setUp(self):
+        self.reactions = (
+            Reaction(
+                "A to B",
+                Enzyme("E1", k_cat=2.0, k_m={"A": 4.0}, hill_coefficients={"A": 2}),
+                {"A": 2.0},
+                {"B": 1.0},
+            ),
+            Reaction(
+                "C to D",
+                Enzyme("E2", k_cat=3.0, k_m={"C": 1.0}, inhibitors={"D": 2.0}),
+                {"C": 1.0},
+                {"D": 1.0},
+            ),
+        )
+        self.network = ReactionNetwork(self.reactions)
+
+    def make_organelle(self, a=10.0, c=0.5):
+        organelle = Organelle()
+        organelle.add_metabolite("A", "substrate", a, 100)
+        organelle.add_metabolite("B", "product", 0, 100)
+        organelle.add_metabolite("C", "substrate", c, 100)
+        organelle.add_metabolite("D", "product", 1, 100)
+        return organelle
+
+    def test_matrix(self):
+        metabolites = self.make_organelle().metabolites
+        matrix = self.network.matrix(metabolites)
+        columns = metabolites.indices(["A", "B", "C", "D"])
+        np.testing.assert_array_equal(
+            matrix[:, columns], [[-2, 1, 0, 0], [0, 0, -1, 1]]
+        )
+
+    def test_step_matches_transform(self):
+        # The reactions share no metabolites, so running them together is
+        # the same as running them one after the other
+        expected = self.make_organelle()
+        expected_rates = [
+            reaction.transform(expected, time_step=0.5, use_rates=True)
+            for reaction in self.reactions
+        ]
+        organelle = self.make_organelle()
+        rates = self.network.step(organelle, time_step=0.5)
+        np.testing.assert_allclose(rates, expected_rates)
+        for name in "ABCD":
+            self.assertAlmostEqual(
+                organelle.get_metabolite_quantity(name),
+                expected.get_metabolite_quantity(name),
+            )
+
+    def test_step_over_max_changes_nothing(self):
+        organelle = self.make_organelle()
+        organelle.set_metabolite_quantity("D", 100)
+        with self.assertRaisesRegex(QuantityError, "d"):
+            self.network.step(organelle)
+        self.assertEqual(organelle.get_metabolite_quantity("A"), 10)
+        self.assertEqual(organelle.get_metabolite_quantity("C"), 0.5)
+
+    def test_rates_follow_replaced_enzyme_parameters(self):
+        organelle = self.make_organelle()
+        network = ReactionNetwork(self.reactions[:1])
+        enzyme = self.reactions[0].enzyme
+        a = {"A": organelle.get_metabolite("A")}
+        np.testing.assert_allclose(network.rates(organelle), enzyme.calculate_rate(a))
+        enzyme.k_m = {"A": 8.0}
+        enzyme.hill_coefficients = {"A": 1}
+        np.testing.assert_allclose(network.rates(organelle), enzyme.calculate_rate(a))
+
+    def test_run_matches_steps(self):
+        reactions = (
+            self.reactions[0],
+            Reaction(
+                "B to C",
+                Enzyme("E3", k_cat=1.5, k_m={"B": 2.0}),
+                {"B": 1.0},
+                {"C": 1.0},
+            ),
+        )
+        network = ReactionNetwork(reactions)
+        expected = self.make_organelle()
+        expected_totals = sum(network.step(expected, 0.25) for _ in range(20))
+        organelle = self.make_organelle()
+        totals = network.run(organelle, 20, time_step=0.25)
+        np.testing.assert_allclose(totals, expected_totals)
+        for name in "ABCD":
+            self.assertAlmostEqual(
+                organelle.get_metabolite_quantity(name),
+                expected.get_metabolite_quantity(name),
+            )
+
+    def test_run_stops_before_step_out_of_bounds(self):
+        network = ReactionNetwork(self.reactions[:1])
+        organelle = self.make_organelle()
+        organelle.get_metabolite("B").max_quantity = 4
+        with self.assertRaisesRegex(QuantityError, "step 3"):
+            network.run(organelle, 10)
+        # The first two steps make about 3.2 of B, the third would pass 4
+        expected = self.make_organelle()
+        network.step(expected)
+        network.step(expected)
+        for name in "AB":
+            self.assertAlmostEqual(
+                organelle.get_metabolite_quantity(name),
+                expected.get_metabolite_quantity(name),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import io
+import logging
+import os
+import pickle
+import tempfile
+import unittest
+
+from pyology.reporter import ATP_LOG_SIZE, MetricHandler, Reporter
+
+
+class TestReporter(unittest.TestCase):
+    def setUp(self):
+        self.reporter = Reporter(console=False)
+        self.stream = io.BytesIO()
+        self.handler = MetricHandler(self.stream)
+        self.reporter.logger.addHandler(self.handler)
+
+    def tearDown(self):
+        self.reporter.logger.removeHandler(self.handler)
+
+    def read_metrics(self):
+        self.stream.seek(0)
+        records = []
+        while self.stream.tell() < len(self.stream.getvalue()):
+            records.append(pickle.load(self.stream))
+        return records
+
+    def test_metric_handler_stores_fields(self):
+        self.reporter.log_metric("glucose_available", glucose=4.5)
+        self.reporter.log_event("Not a metric")
+        self.reporter.log_atp_production("Glycolysis", 2.0)
+        records = self.read_metrics()
+        self.assertEqual(
+            [(name, fields) for _, name, fields in records],
+            [
+                ("glucose_available", {"glucose": 4.5}),
+                ("atp_produced", {"step": "Glycolysis", "atp": 2.0}),
+            ],
+        )
+
+    def test_metric_text(self):
+        with self.assertLogs(self.reporter.logger, logging.INFO) as logs:
+            self.reporter.log_metric("atp_produced", step="Glycolysis", atp=2.0)
+        self.assertEqual(
+            logs.records[0].getMessage(), "atp_produced: step=Glycolysis, atp=2.0"
+        )
+
+    def test_disabled_step_logger_keeps_events(self):
+        self.reporter.step_logger.disabled = True
+        try:
+            with self.assertLogs(self.reporter.logger, logging.INFO) as logs:
+                self.reporter.log_metric("glucose_available", glucose=4.5)
+                self.reporter.log_event("Summary")
+        finally:
+            self.reporter.step_logger.disabled = False
+        self.assertEqual([record.getMessage() for record in logs.records], ["Summary"])
+        self.assertEqual(self.read_metrics(), [])
+
+    def test_step_log_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "steps.log")
+            with Reporter(console=False, step_log=path) as reporter:
+                reporter.log_metric("simulation_time", time=0.5)
+                reporter.log_event("Summary")
+                # Other reporters still send their step records as before
+                self.reporter.log_metric("glucose_available", glucose=4.5)
+            self.assertEqual(reporter.step_logger.handlers, [])
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "simulation_time: time=0.5\n")
+        # The step record went to the file only
+        self.assertEqual(
+            [name for _, name, _ in self.read_metrics()], ["glucose_available"]
+        )
+        self.assertTrue(self.reporter.step_logger.propagate)
+
+    def test_atp_production_log(self):
+        for atp in range(3):
+            self.reporter.log_atp_production("Glycolysis", atp)
+        self.assertEqual(
+            self.reporter.atp_production_log,
+            (("Glycolysis", 0.0), ("Glycolysis", 1.0), ("Glycolysis", 2.0)),
+        )
+
+    def test_atp_production_log_grows(self):
+        for atp in range(ATP_LOG_SIZE + 3):
+            self.reporter.log_atp_production("Glycolysis", atp, log=False)
+        entries = self.reporter.atp_production_log
+        self.assertEqual(len(entries), ATP_LOG_SIZE + 3)
+        self.assertEqual(
+            [atp for _, atp in entries], [float(atp) for atp in range(ATP_LOG_SIZE + 3)]
+        )
+        self.assertEqual({step for step, _ in entries}, {"Glycolysis"})
+
+    def test_atp_production_log_changes(self):
+        self.reporter.log_atp_production("Glycolysis", 2.0, log=False)
+        # A copy of the arrays, so mutating it must fail loudly
+        with self.assertRaises(AttributeError):
+            self.reporter.atp_production_log.append(("Krebs", 1.0))
+        self.reporter.atp_production_log = [("Krebs", 1.0), ("ETC", 30.0)]
+        self.assertEqual(
+            self.reporter.atp_production_log, (("Krebs", 1.0), ("ETC", 30.0))
+        )
+        self.reporter.clear_atp_log()
+        self.assertEqual(self.reporter.atp_production_log, ())
+
+    def test_atp_production_recorded_without_logging(self):
+        self.reporter.log_atp_production("Glycolysis", 2.0, log=False)
+        self.assertEqual(self.reporter.atp_production_log, (("Glycolysis", 2.0),))
+        self.assertEqual(self.read_metrics(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
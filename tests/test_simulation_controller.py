@@ -2,7 +2,27 @@ import unittest
 from unittest.mock import Mock, patch
 
 from pyology.cell import Cell
-from pyology.simulation import Reporter, SimulationController
+from pyology.exceptions import UnknownMetaboliteError
+from pyology.simulation import (
+    ADENINE_LOG_SIZE,
+    IMBALANCE,
+    INITIAL,
+    Reporter,
+    SimulationController,
+)
+
+CELL_METABOLITES = ["Glucose", "Pyruvate", "ATP", "ADP", "AMP", "NAD+", "NADH"]
+COMPARTMENT_METABOLITES = ("ATP", "ADP", "AMP", "NADH")
+
+
+def make_cell(skip=()):
+    """A cell with every metabolite a simulation step reads, except ``skip``."""
+    cell = Cell(CELL_METABOLITES)
+    for compartment in (cell.cytoplasm, cell.mitochondrion):
+        for name in COMPARTMENT_METABOLITES:
+            if (compartment.name, name) not in skip:
+                compartment.add_metabolite(name, "metabolite", 10, 1000)
+    return cell
 
 
 class TestSimulationController(unittest.TestCase):
@@ -185,5 +205,134 @@ class TestSimulationController(unittest.TestCase):
             print(f"  {key}: {value}")
 
 
+class TestSimulationSteps(unittest.TestCase):
+    def setUp(self):
+        self.cell = make_cell()
+        self.reporter = Mock(spec=Reporter)
+        self.sim_controller = SimulationController(self.cell, self.reporter)
+        self.cytoplasm = self.cell.cytoplasm.metabolites
+        self.mitochondrion = self.cell.mitochondrion.metabolites
+
+    def test_missing_compartment_metabolite_raises(self):
+        cell = make_cell(skip=[("Mitochondrion", "ADP")])
+        with self.assertRaisesRegex(UnknownMetaboliteError, "mitochondrion ADP"):
+            SimulationController(cell, self.reporter)
+        # Reported, not created with default values
+        self.assertNotIn("ADP", cell.mitochondrion.metabolites)
+
+    def total(self, name):
+        return self.cytoplasm[name].quantity + self.mitochondrion[name].quantity
+
+    def test_adp_transfer_capped_by_cytoplasm(self):
+        self.mitochondrion["ADP"].quantity = 5
+        self.cytoplasm["ADP"].quantity = 30
+        total_adp = self.total("ADP")
+        self.sim_controller._handle_adp_availability(self.reporter)
+        # Less than the 50 the transfer asks for is left in the cytoplasm
+        self.assertEqual(self.cytoplasm["ADP"].quantity, 0)
+        self.assertEqual(self.mitochondrion["ADP"].quantity, 35)
+        self.assertEqual(self.total("ADP"), total_adp)
+
+    def test_excess_atp_moves_to_cytoplasm(self):
+        self.mitochondrion["ATP"].quantity = 150
+        total_atp = self.total("ATP")
+        self.sim_controller._transfer_excess_atp()
+        self.assertEqual(self.mitochondrion["ATP"].quantity, 100)
+        self.assertEqual(self.cytoplasm["ATP"].quantity, 60)
+        self.assertEqual(self.total("ATP"), total_atp)
+
+    def test_excess_atp_capped_by_cytoplasm_limit(self):
+        self.mitochondrion["ATP"].quantity = 150
+        self.cytoplasm["ATP"].quantity = 480
+        total_atp = self.total("ATP")
+        self.sim_controller._transfer_excess_atp()
+        self.assertEqual(self.cytoplasm["ATP"].quantity, 500)
+        self.assertEqual(self.mitochondrion["ATP"].quantity, 130)
+        self.assertEqual(self.total("ATP"), total_atp)
+
+    def test_limits_clamp_their_own_compartment(self):
+        for metabolites in (self.cell.metabolites, self.cytoplasm, self.mitochondrion):
+            metabolites["ATP"].quantity = 150
+            metabolites["NADH"].quantity = 80
+        self.sim_controller._enforce_metabolite_limits()
+        # Over the mitochondrial limits of 100 ATP and 50 NADH
+        self.assertEqual(self.mitochondrion["ATP"].quantity, 100)
+        self.assertEqual(self.mitochondrion["NADH"].quantity, 50)
+        # Under the cytoplasmic limits, and the cell has none
+        for metabolites in (self.cytoplasm, self.cell.metabolites):
+            self.assertEqual(metabolites["ATP"].quantity, 150)
+            self.assertEqual(metabolites["NADH"].quantity, 80)
+
+    def test_limits_clamp_cytoplasm_only(self):
+        self.cytoplasm["ATP"].quantity = 600
+        self.mitochondrion["ATP"].quantity = 90
+        self.sim_controller._enforce_metabolite_limits()
+        self.assertEqual(self.cytoplasm["ATP"].quantity, 500)
+        self.assertEqual(self.mitochondrion["ATP"].quantity, 90)
+
+    def test_adenine_log_keeps_latest_entries(self):
+        self.sim_controller._log_adenine_nucleotides(INITIAL, -1.0)
+        for value in range(ADENINE_LOG_SIZE + 5):
+            self.sim_controller._log_adenine_nucleotides(IMBALANCE, value)
+        entries = self.sim_controller._adenine_log_entries()
+        # The initial entry and the first five imbalances were overwritten
+        self.assertEqual(len(entries), ADENINE_LOG_SIZE)
+        self.assertEqual(
+            entries["value"].tolist(), list(range(5, ADENINE_LOG_SIZE + 5))
+        )
+        self.assertTrue((entries["stage"] == IMBALANCE).all())
+
+    def test_adenine_log_before_wrapping(self):
+        self.sim_controller._log_adenine_nucleotides(INITIAL, 30.0)
+        self.sim_controller._log_adenine_nucleotides(IMBALANCE, 31.0)
+        entries = self.sim_controller._adenine_log_entries()
+        self.assertEqual(entries.tolist(), [(INITIAL, 30.0), (IMBALANCE, 31.0)])
+
+    def test_clock_advances_one_tick_per_step(self):
+        tick = 0
+        for _ in range(25):
+            tick = self.sim_controller._advance_clock(tick)
+        self.assertEqual(tick, 25)
+        # The 0.001 step used to be rounded away, leaving the clock at 0
+        time_step = self.sim_controller.time_step
+        self.assertEqual(time_step, 0.001)
+        self.assertEqual(self.sim_controller.simulation_time, 25 * time_step)
+
+    def test_clock_runs_to_max_time_without_drift(self):
+        tick, max_ticks = self.sim_controller._clock_ticks()
+        self.assertEqual((tick, max_ticks), (0, 20000))
+        while tick < max_ticks:
+            tick = self.sim_controller._advance_clock(tick)
+        # Summing the 0.001 step 20000 times would land just off 20
+        self.assertEqual(self.sim_controller.simulation_time, 20.0)
+
+    def test_clock_continues_from_previous_run(self):
+        tick = 0
+        for _ in range(1500):
+            tick = self.sim_controller._advance_clock(tick)
+        self.assertEqual(self.sim_controller._clock_ticks(), (1500, 20000))
+
+    def test_adp_transfer_skipped_without_cytoplasmic_adp(self):
+        self.mitochondrion["ADP"].quantity = 5
+        self.cytoplasm["ADP"].quantity = 0
+        self.sim_controller._handle_adp_availability(self.reporter)
+        self.reporter.log_warning.assert_called_once()
+        self.assertEqual(self.cytoplasm["ADP"].quantity, 0)
+        self.assertEqual(self.mitochondrion["ADP"].quantity, 5)
+
+    def test_adp_transfer_moves_up_to_50(self):
+        self.mitochondrion["ADP"].quantity = 5
+        self.cytoplasm["ADP"].quantity = 80
+        self.sim_controller._handle_adp_availability(self.reporter)
+        self.assertEqual(self.cytoplasm["ADP"].quantity, 30)
+        self.assertEqual(self.mitochondrion["ADP"].quantity, 55)
+
+    def test_no_adp_transfer_when_mitochondrion_has_enough(self):
+        self.sim_controller._handle_adp_availability(self.reporter)
+        self.reporter.log_warning.assert_not_called()
+        self.assertEqual(self.cytoplasm["ADP"].quantity, 10)
+        self.assertEqual(self.mitochondrion["ADP"].quantity, 10)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import Mock, patch
 
+from pyology.organelle import Organelle
 from pyology.reporter import Reporter
 from utils.command_data import CommandData
 from utils.tracking import CommandExecutionResult, execute_command
@@ -164,6 +165,33 @@ class TestExecuteCommand(unittest.TestCase):
         self.assertEqual(result.final_values, {})
         self.mock_logger.error.assert_called()
 
+    def test_tracks_organelle_metabolites(self):
+        organelle = Organelle()
+        organelle.add_metabolite("nad", "cofactor", 10, 100)
+        organelle.add_metabolite("nadh", "cofactor", 1, 100)
+        command_data = CommandData(
+            obj=organelle,
+            command=organelle.apply_deltas,
+            tracked_attributes=["NAD", "NADH"],
+            args=(("nad", "nadh"), (-4, 4)),
+        )
+        result = execute_command(organelle, command_data, logger=self.mock_logger)
+        self.assertEqual(result.initial_values, {"NAD": 10, "NADH": 1})
+        self.assertEqual(result.final_values, {"NAD": 6, "NADH": 5})
+
+    def test_tracks_known_metabolites_when_one_is_missing(self):
+        organelle = Organelle()
+        organelle.add_metabolite("nad", "cofactor", 10, 100)
+        command_data = CommandData(
+            obj=organelle,
+            command=organelle.is_metabolite_available,
+            tracked_attributes=["NAD", "unknown"],
+            args=("nad", 1),
+        )
+        result = execute_command(organelle, command_data, logger=self.mock_logger)
+        self.assertEqual(result.initial_values, {"NAD": 10})
+        self.mock_logger.error.assert_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
+
+from pyology.exceptions import UnknownMetaboliteError
 from pyology.organelle import Organelle
 from pyology.reporter import Reporter
 
@@ -50,8 +53,11 @@ def execute_command(
     kwargs = command_data.kwargs
     validations = command_data.validations
 
+    # Resolve the tracked metabolites once for both snapshots
+    tracked_indices = _tracked_indices(organelle, tracked_attributes)
+
     initial_values = _log_attribute_values(
-        logger, organelle, tracked_attributes, "Initial", debug
+        logger, organelle, tracked_attributes, "Initial", debug, tracked_indices
     )
 
     # Execute the command
@@ -69,7 +75,7 @@ def execute_command(
         raise
 
     final_values = _log_attribute_values(
-        logger, organelle, tracked_attributes, "Final", debug
+        logger, organelle, tracked_attributes, "Final", debug, tracked_indices
     )
 
     validation_results = _log_validation_results(
@@ -85,12 +91,43 @@ def execute_command(
     )
 
 
+def _tracked_indices(
+    organelle: "Organelle", tracked_attributes: List[str]
+) -> Optional[Tuple[int, np.ndarray]]:
+    """
+    Resolve the tracked metabolites to positions in the organelle's quantities.
+
+    Parameters
+    ----------
+    organelle : "Organelle"
+        The organelle the command runs on.
+    tracked_attributes : List[str]
+        The metabolites to track.
+
+    Returns
+    -------
+    Optional[Tuple[int, np.ndarray]]
+        The generation of the organelle's metabolites and the positions of
+        the tracked ones, or None when the organelle has no metabolite
+        collection or a tracked metabolite is missing, in which case each
+        one is looked up, and any failure reported, on its own.
+    """
+    if not isinstance(organelle, Organelle):
+        return None
+    metabolites = organelle.metabolites
+    try:
+        return metabolites._generation, metabolites.indices(tracked_attributes)
+    except UnknownMetaboliteError:
+        return None
+
+
 def _log_attribute_values(
     logger: Reporter,
     organelle: "Organelle",
     tracked_attributes: List[str],
     stage: str,
     debug: bool = True,
+    tracked_indices: Optional[Tuple[int, np.ndarray]] = None,
 ) -> Dict[str, Any]:
     """
     Log the values of the tracked attributes.
@@ -107,12 +144,26 @@ def _log_attribute_values(
         The stage of the simulation to log the attribute values for.
     debug : bool, optional
         Whether to enable debug logging (default is True).
+    tracked_indices : Optional[Tuple[int, np.ndarray]], optional
+        The result of :func:`_tracked_indices`. While the organelle's
+        metabolites are unchanged, the values are read with one gather
+        from its quantity array.
 
     Returns
     -------
     Dict[str, Any]
         A dictionary containing the attribute values.
     """
+    if (
+        tracked_indices is not None
+        and tracked_indices[0] == organelle.metabolites._generation
+    ):
+        quantities = organelle.metabolites.quantity_array[tracked_indices[1]]
+        values = dict(zip(tracked_attributes, quantities.tolist()))
+        if debug:
+            logger.debug("%s values: %s", stage, values)
+        return values
+
     values = {}
     for attr in tracked_attributes:
         try:
@@ -132,7 +183,7 @@ def _log_attribute_values(
             )
 
     if debug:
-        logger.debug(f"{stage} values: {values}")
+        logger.debug("%s values: %s", stage, values)
 
     return values
 